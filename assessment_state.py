@@ -0,0 +1,190 @@
+"""
+PATH-FINDER: Compact Assessment State
+One session's assessment held in a few small arrays instead of nested dicts:
+- answers: chosen option index per question (array('b'), -1 = unanswered)
+- sliders: one byte per Ikigai slider in IKIGAI_QUADRANTS order (array('B'))
+- results: top career ids (array('i')) plus their scores and the Ikigai
+  intersection scores (array('d'))
+
+The dict shapes the scoring functions and reports expect (psychometric_answers,
+ikigai_data, psychometric_results, final_recommendations) are rebuilt on demand
+and point at the shared question bank and catalog records rather than copies.
+"""
+
+import time
+from array import array
+from datetime import datetime
+
+from scoring import (
+    DEFAULT_SLIDER_VALUE,
+    IKIGAI_QUADRANTS,
+    INTERSECTION_DESCRIPTIONS,
+    PSYCHOMETRIC_QUESTIONS,
+    calculate_trait_scores,
+    personality_profile,
+    question_bank_version,
+    trait_profile,
+)
+
+# Intersection scores are stored in this order
+INTERSECTION_LABELS = list(INTERSECTION_DESCRIPTIONS) + ["Ikigai_Center"]
+CENTER_DESCRIPTION = "Perfect balance of all four elements"
+
+# Per recommended career: psychometric, Ikigai and combined score
+SCORES_PER_CAREER = 3
+
+SLIDER_ITEMS = [(quadrant, item) for quadrant, data in IKIGAI_QUADRANTS.items() for item in data["items"]]
+
+
+def compact_results(intersections, career_ids, psych_scores, ikigai_scores, combined_scores):
+    """(intersection scores, career ids, interleaved career scores) arrays for ranked results"""
+    return (
+        array("d", [intersections[label]["score"] for label in INTERSECTION_LABELS]),
+        array("i", [int(idx) for idx in career_ids]),
+        array("d", [
+            float(score)
+            for scores in zip(psych_scores, ikigai_scores, combined_scores)
+            for score in scores
+        ])
+    )
+
+
+class AssessmentState:
+    """Answers, slider values and ranked results of one session"""
+
+    __slots__ = ("answers", "sliders", "psychometric_completed_at", "intersection_scores",
+                 "career_ids", "career_scores", "catalog_version", "completed_at")
+
+    def __init__(self):
+        self.answers = array("b", [-1] * len(PSYCHOMETRIC_QUESTIONS))
+        self.sliders = array("B", [DEFAULT_SLIDER_VALUE] * len(SLIDER_ITEMS))
+        self.psychometric_completed_at = None
+        self.intersection_scores = None
+        self.career_ids = None
+        self.career_scores = None
+        self.catalog_version = None
+        self.completed_at = None
+
+    @classmethod
+    def from_record(cls, record):
+        """State rebuilt from record(), or None if it was saved against another question bank"""
+        (bank_version, answers, sliders, psychometric_completed_at, intersection_scores,
+         career_ids, career_scores, catalog_version, completed_at) = record
+        state = cls()
+        if bank_version != question_bank_version() or len(answers) != len(state.answers) \
+                or len(sliders) != len(state.sliders):
+            return None
+
+        state.answers = array("b", answers)
+        state.sliders = array("B", sliders)
+        state.psychometric_completed_at = psychometric_completed_at
+        if completed_at is not None:
+            state.intersection_scores = array("d", intersection_scores)
+            state.career_ids = array("i", career_ids)
+            state.career_scores = array("d", career_scores)
+            state.catalog_version = catalog_version
+            state.completed_at = completed_at
+        return state
+
+    def record(self):
+        """Flat tuple of bytes and scalars for persistence (see session_store.py)"""
+        results = (self.intersection_scores, self.career_ids, self.career_scores)
+        return (
+            question_bank_version(),
+            self.answers.tobytes(),
+            self.sliders.tobytes(),
+            self.psychometric_completed_at,
+            *(values.tobytes() if values is not None else None for values in results),
+            self.catalog_version,
+            self.completed_at
+        )
+
+    def layer(self):
+        """App layer to resume at: 1 personality, 2 Ikigai, 3 career navigation"""
+        if self.completed_at is not None:
+            return 3
+        return 2 if self.psychometric_completed_at is not None else 1
+
+    def answered_count(self):
+        return sum(option >= 0 for option in self.answers)
+
+    def answered(self):
+        return self.answered_count() == len(self.answers)
+
+    def key(self):
+        """Canonical bytes of a complete assessment (same encoding as scoring.assessment_key)"""
+        if not self.answered():
+            return None
+        return self.answers.tobytes() + self.sliders.tobytes()
+
+    def psychometric_answers(self):
+        """{question id: option dict} referencing the shared question bank"""
+        return {
+            question["id"]: question["options"][option]
+            for question, option in zip(PSYCHOMETRIC_QUESTIONS, self.answers)
+            if option >= 0
+        }
+
+    def ikigai_data(self):
+        """{quadrant: {item: value}} slider values"""
+        ikigai_data = {quadrant: {} for quadrant in IKIGAI_QUADRANTS}
+        for (quadrant, item), value in zip(SLIDER_ITEMS, self.sliders):
+            ikigai_data[quadrant][item] = value
+        return ikigai_data
+
+    def slider_matrix(self):
+        """Slider values as a list of rows, one per quadrant"""
+        n_items = len(self.sliders) // len(IKIGAI_QUADRANTS)
+        return [list(self.sliders[start:start + n_items]) for start in range(0, len(self.sliders), n_items)]
+
+    def matching_traits(self):
+        """Big Five and auxiliary trait scores the careers are matched against"""
+        if self.answered():
+            return trait_profile(self.answers)
+        return calculate_trait_scores(self.psychometric_answers().values(), auxiliary=True)
+
+    def psychometric_results(self):
+        """Trait scores and personality analysis, or None before layer 1 is analyzed"""
+        if self.psychometric_completed_at is None:
+            return None
+        trait_scores, analysis = personality_profile(self.answers)
+        return {
+            "trait_scores": trait_scores,
+            "auxiliary_traits": {
+                trait: score for trait, score in trait_profile(self.answers).items() if trait not in trait_scores
+            },
+            "analysis": analysis,
+            "completed_at": datetime.fromtimestamp(self.psychometric_completed_at).isoformat()
+        }
+
+    def complete_psychometric(self):
+        self.psychometric_completed_at = time.time()
+
+    def store_results(self, results, catalog_version):
+        """Keep compact_results() output, scored against catalog_version, as this session's final results"""
+        self.intersection_scores, self.career_ids, self.career_scores = results
+        self.catalog_version = catalog_version
+        self.completed_at = time.time()
+
+    def final_recommendations(self, engine):
+        """Results shaped like the app's final_recommendations, or None before layer 2 is analyzed"""
+        if self.completed_at is None:
+            return None
+
+        intersections = {
+            label: {"score": score, "description": INTERSECTION_DESCRIPTIONS.get(label, CENTER_DESCRIPTION)}
+            for label, score in zip(INTERSECTION_LABELS, self.intersection_scores)
+        }
+        # Keyword alignment is cheap for the listed careers, so it is recomputed rather than stored
+        alignments = engine.keyword_alignments(self.slider_matrix(), self.career_ids)
+        recommendations = [
+            engine.recommendation(
+                career_idx, *self.career_scores[rank * SCORES_PER_CAREER:(rank + 1) * SCORES_PER_CAREER], alignment
+            )
+            for rank, (career_idx, alignment) in enumerate(zip(self.career_ids, alignments))
+        ]
+        return {
+            "ikigai_intersections": intersections,
+            "career_recommendations": recommendations,
+            "completed_at": datetime.fromtimestamp(self.completed_at).isoformat()
+        }
@@ -0,0 +1,267 @@
+"""
+PATH-FINDER: Headless Batch Scoring
+Scores a whole cohort of users against the career catalog in one pass,
+without Streamlit session state:
+- Input: CSV or Parquet with one row per user (answers q1..q5 + 40 sliders)
+- Output: ranked recommendations per user as CSV or Parquet
+
+Usage:
+    python batch_scoring.py sampleusers.csv -o recommendations.csv [--top-k 5] [--workers 4]
+
+Answer columns hold the chosen option number (1-4) for each question.
+Slider columns are named <quadrant key>_<item>, e.g. love_creative_problem_solving;
+missing slider columns default to 5, like the sliders in the app.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+from scoring import (
+    DEFAULT_SLIDER_VALUE,
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    SLIDER_RANGE,
+    answer_columns,
+    get_career_engine,
+    slider_columns,
+    trait_profiles,
+    trait_vocabulary,
+)
+from career_engine import INTERSECTION_PAIRS, batch_intersection_scores, select_top_k_rows
+from keyword_matching import QUADRANT_KEYS
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def batch_trait_scores(answers, engine):
+    """Big Five and auxiliary trait (values, mask) for (n_users, Q) zero-based option choices, in engine columns"""
+    vocabulary = trait_vocabulary()
+    trait_values, trait_masks = trait_profiles(answers)
+
+    user_values = np.zeros((len(answers), len(engine.trait_names)))
+    user_masks = np.zeros(user_values.shape, dtype=bool)
+    for col, trait in enumerate(vocabulary.names):
+        engine_col = engine.trait_ids.get(trait)
+        if engine_col is not None:
+            user_values[:, engine_col] = trait_values[:, col]
+            user_masks[:, engine_col] = trait_masks[:, col]
+    return user_values, user_masks
+
+
+def cohort_arrays(answers, sliders, engine):
+    """(user_values, user_masks, user_intersections, center_scores) engine inputs for a cohort"""
+    user_values, user_masks = batch_trait_scores(answers, engine)
+    intersection_scores = batch_intersection_scores(sliders)
+    center_scores = intersection_scores.sum(axis=1) / 4
+
+    # Align batch columns with the engine's intersection vocabulary
+    user_intersections = np.zeros((len(answers), len(engine.intersection_names)))
+    for col, (label, _, _) in enumerate(INTERSECTION_PAIRS):
+        if label in engine.intersection_ids:
+            user_intersections[:, engine.intersection_ids[label]] = intersection_scores[:, col]
+    if "Ikigai_Center" in engine.intersection_ids:
+        user_intersections[:, engine.intersection_ids["Ikigai_Center"]] = center_scores
+    return user_values, user_masks, user_intersections, center_scores
+
+
+def score_cohort(answers, sliders, engine=None, top_k=5):
+    """Score a cohort in one matrix pass
+
+    answers: (n_users, n_questions) zero-based option indices
+    sliders: (n_users, 4, n_items) slider values
+    Returns a dict of arrays with the top_k career indices, their scores and
+    their (n_users, top_k, 4) per-quadrant keyword alignment. Careers tied on
+    the combined score are ordered by keyword alignment.
+    """
+    engine = engine if engine is not None else get_career_engine()
+    user_values, user_masks, user_intersections, center_scores = cohort_arrays(answers, sliders, engine)
+
+    psych, ikigai, combined = engine.score_batch(user_values, user_masks, user_intersections)
+    top = select_top_k_rows(combined, top_k, engine.keyword_tiebreak(sliders))
+    rows = np.arange(len(answers))[:, np.newaxis]
+    # One (user, career) pair per listed career
+    alignment = engine.keyword_matcher.quadrant_alignment(np.repeat(sliders, top.shape[1], axis=0), top.ravel())
+
+    return {
+        "top_careers": top,
+        "psychometric_score": psych[rows, top],
+        "ikigai_score": ikigai[rows, top],
+        "combined_score": combined[rows, top],
+        "keyword_alignment": alignment.reshape(*top.shape, len(QUADRANT_KEYS)),
+        "ikigai_center": center_scores
+    }
+
+
+def read_user_chunks(path, chunksize=DEFAULT_CHUNK_SIZE):
+    """Yield DataFrames of users from a CSV or Parquet file"""
+    if path.endswith(".parquet"):
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("Reading Parquet requires pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def frame_to_arrays(frame):
+    """Extract (user_ids, answers, sliders) arrays from an input DataFrame"""
+    missing = [col for col in answer_columns() if col not in frame.columns]
+    if missing:
+        raise ValueError(f"Input is missing answer columns: {', '.join(missing)}")
+
+    answers = frame[answer_columns()].to_numpy(dtype=np.int64) - 1
+    option_counts = np.array([len(question["options"]) for question in PSYCHOMETRIC_QUESTIONS])
+    if (answers < 0).any() or (answers >= option_counts).any():
+        raise ValueError(f"Answer values must be option numbers between 1 and {option_counts.max()}")
+
+    sliders = np.full((len(frame), len(slider_columns())), DEFAULT_SLIDER_VALUE, dtype=float)
+    for col, name in enumerate(slider_columns()):
+        if name in frame.columns:
+            values = pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float)
+            # Same rule as the scoring service: whole numbers in SLIDER_RANGE, no blanks
+            valid = (values >= SLIDER_RANGE[0]) & (values <= SLIDER_RANGE[1]) & (values == np.round(values))
+            if not valid.all():
+                raise ValueError(
+                    f"Slider column '{name}' must hold whole numbers between {SLIDER_RANGE[0]} and {SLIDER_RANGE[1]}"
+                )
+            sliders[:, col] = values
+    # Explicit item count: -1 cannot be inferred for a zero-row chunk
+    sliders = sliders.reshape(len(frame), len(IKIGAI_QUADRANTS), len(slider_columns()) // len(IKIGAI_QUADRANTS))
+
+    if "user_id" in frame.columns:
+        user_ids = frame["user_id"].to_numpy()
+    else:
+        user_ids = frame.index.to_numpy()
+    return user_ids, answers, sliders
+
+
+def results_to_frame(user_ids, results, engine=None):
+    """Long-format DataFrame: one row per (user, rank)"""
+    engine = engine if engine is not None else get_career_engine()
+    n_users, top_k = results["top_careers"].shape
+    combined = results["combined_score"].ravel()
+
+    # Decode only the careers that appear in this chunk's results
+    winners, positions = np.unique(results["top_careers"], return_inverse=True)
+    winner_names = np.array([engine.career_names[idx] for idx in winners], dtype=object)
+
+    return pd.DataFrame({
+        "user_id": np.repeat(user_ids, top_k),
+        "rank": np.tile(np.arange(1, top_k + 1), n_users),
+        "career": winner_names[positions.ravel()],
+        "match_percentage": (combined * 100).astype(int),
+        "combined_score": combined,
+        "psychometric_score": results["psychometric_score"].ravel(),
+        "ikigai_score": results["ikigai_score"].ravel(),
+        **{
+            f"keyword_alignment_{key}": results["keyword_alignment"][:, :, col].ravel()
+            for col, key in enumerate(QUADRANT_KEYS)
+        },
+        "ikigai_center": np.repeat(results["ikigai_center"], top_k)
+    })
+
+
+class RecommendationWriter:
+    """Append ranked recommendation chunks to a CSV or Parquet file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_parquet = path.endswith(".parquet")
+        self.arrow_writer = None
+        self.rows_written = 0
+        if self.is_parquet and not ARROW_AVAILABLE:
+            raise RuntimeError("Writing Parquet requires pyarrow (pip install pyarrow)")
+
+    def write(self, frame):
+        if ARROW_AVAILABLE:
+            # Arrow's writers are an order of magnitude faster than DataFrame.to_csv
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self.arrow_writer is None:
+                writer_class = pq.ParquetWriter if self.is_parquet else pa_csv.CSVWriter
+                self.arrow_writer = writer_class(self.path, table.schema)
+            self.arrow_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="a" if self.rows_written else "w",
+                         header=not self.rows_written, index=False)
+        self.rows_written += len(frame)
+
+    def close(self):
+        if self.arrow_writer is not None:
+            self.arrow_writer.close()
+
+
+def run_batch(input_path, output_path, top_k=5, chunksize=DEFAULT_CHUNK_SIZE, workers=None):
+    """Score every user in input_path and write recommendations; returns stats
+
+    With workers > 1, chunks are scored by a process pool sharing the catalog
+    matrices (see parallel_scoring.py).
+    """
+    writer = RecommendationWriter(output_path)
+    scorer = None
+    n_users = 0
+    scoring_time = 0.0
+    start = time.perf_counter()
+
+    try:
+        if workers and workers > 1:
+            from parallel_scoring import ParallelCohortScorer
+            scorer = ParallelCohortScorer(workers=workers)
+
+        for frame in read_user_chunks(input_path, chunksize):
+            user_ids, answers, sliders = frame_to_arrays(frame)
+
+            chunk_start = time.perf_counter()
+            if scorer is not None:
+                results = scorer.score(answers, sliders, top_k=top_k)
+            else:
+                results = score_cohort(answers, sliders, top_k=top_k)
+            scoring_time += time.perf_counter() - chunk_start
+
+            writer.write(results_to_frame(user_ids, results))
+            n_users += len(frame)
+    finally:
+        if scorer is not None:
+            scorer.close()
+        writer.close()
+
+    total_time = time.perf_counter() - start
+    return {
+        "users": n_users,
+        "total_seconds": total_time,
+        "scoring_seconds": scoring_time,
+        "users_per_second": n_users / total_time if total_time else 0.0,
+        "scoring_users_per_second": n_users / scoring_time if scoring_time else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a cohort of users against the career catalog")
+    parser.add_argument("input", help="CSV or Parquet file with one row per user")
+    parser.add_argument("-o", "--output", required=True, help="Output .csv or .parquet path")
+    parser.add_argument("--top-k", type=int, default=5, help="Recommendations per user")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNK_SIZE, help="Users scored per pass")
+    parser.add_argument("--workers", type=int, default=None, help="Scoring processes (default: score in this process)")
+    args = parser.parse_args(argv)
+
+    stats = run_batch(args.input, args.output, top_k=args.top_k, chunksize=args.chunksize, workers=args.workers)
+    print(
+        f"Scored {stats['users']:,} users in {stats['total_seconds']:.2f}s "
+        f"({stats['users_per_second']:,.0f} users/s end-to-end, "
+        f"{stats['scoring_users_per_second']:,.0f} users/s scoring only)",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
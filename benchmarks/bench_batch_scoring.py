@@ -0,0 +1,61 @@
+"""
+Benchmark: headless cohort scoring throughput
+Generates a synthetic cohort file (answers + sliders, same layout as
+sampleusers.csv), scores it with batch_scoring.run_batch and reports users/second.
+
+Usage:
+    python benchmarks/bench_batch_scoring.py [--users 1000000] [--format csv|parquet]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_scoring import answer_columns, run_batch, slider_columns
+
+
+def write_synthetic_cohort(path, n_users, seed=7):
+    """Write n_users random users to a CSV or Parquet file"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({"user_id": np.arange(1, n_users + 1)})
+    for col in answer_columns():
+        frame[col] = rng.integers(1, 5, n_users, dtype=np.int8)
+    for col in slider_columns():
+        frame[col] = rng.integers(0, 11, n_users, dtype=np.int8)
+
+    if path.endswith(".parquet"):
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, f"cohort.{args.format}")
+        output_path = os.path.join(tmp, f"recommendations.{args.format}")
+
+        start = time.perf_counter()
+        write_synthetic_cohort(input_path, args.users)
+        print(f"Generated {args.users:,} users in {time.perf_counter() - start:.1f}s")
+
+        stats = run_batch(input_path, output_path, chunksize=args.chunksize)
+
+    print(f"Total:   {stats['total_seconds']:.2f}s  {stats['users_per_second']:>12,.0f} users/s")
+    print(f"Scoring: {stats['scoring_seconds']:.2f}s  {stats['scoring_users_per_second']:>12,.0f} users/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark: loop-based vs vectorized career scoring
+Scores the same synthetic users against catalogs of increasing size with the
+original per-career Python loop and with CareerScoringEngine, checks that both
+produce identical rankings, and reports the timings.
+
+Usage:
+    python benchmarks/bench_career_engine.py [--sizes 5 1000 100000] [--users 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import (
+    BIG_FIVE_TRAITS,
+    CAREER_DATABASE,
+    calculate_career_ikigai_alignment,
+    calculate_psychometric_compatibility,
+)
+from career_engine import CareerScoringEngine, IKIGAI_WEIGHT, PSYCHOMETRIC_WEIGHT, select_top_k
+
+INTERSECTION_LABELS = ["Passion", "Mission", "Profession", "Vocation"]
+
+
+def build_synthetic_catalog(size, rng):
+    """Return the real catalog for small sizes, otherwise random careers"""
+    if size <= len(CAREER_DATABASE):
+        return dict(list(CAREER_DATABASE.items())[:size])
+
+    catalog = {}
+    for i in range(size):
+        catalog[f"Career {i}"] = {
+            "skills": [],
+            "growth_rate": "High",
+            "salary_range": "",
+            "description": "",
+            "ikigai_intersections": rng.sample(INTERSECTION_LABELS, rng.randint(1, 3)),
+            "psychometric_fit": {trait: rng.randint(1, 5) for trait in BIG_FIVE_TRAITS}
+        }
+    return catalog
+
+
+def build_synthetic_user(rng):
+    """Random trait scores and intersection scores shaped like the app's results"""
+    trait_scores = {trait: rng.choice([2.5, 3, 3.5, 4, 4.5, 5]) for trait in BIG_FIVE_TRAITS}
+    intersections = {label: {"score": rng.random()} for label in INTERSECTION_LABELS}
+    return trait_scores, intersections
+
+
+def loop_recommendations(catalog, trait_scores, intersections, limit=5):
+    """Original per-career scoring loop"""
+    recommendations = []
+    for career_name, career_data in catalog.items():
+        psych_score = calculate_psychometric_compatibility(trait_scores, career_data["psychometric_fit"])
+        ikigai_score = calculate_career_ikigai_alignment(intersections, career_data["ikigai_intersections"])
+        combined_score = (psych_score * PSYCHOMETRIC_WEIGHT) + (ikigai_score * IKIGAI_WEIGHT)
+        recommendations.append({
+            "career": career_name,
+            "psychometric_score": psych_score,
+            "ikigai_score": ikigai_score,
+            "combined_score": combined_score
+        })
+    recommendations.sort(key=lambda x: x["combined_score"], reverse=True)
+    return recommendations[:limit]
+
+
+def compare_top_k(size, k, rng):
+    """Time partial top-k selection against a full stable sort on tie-heavy scores"""
+    # Scores on a coarse grid so many careers tie, like the real 40/60 blend
+    scores = np.array([rng.randint(0, 50) / 50 for _ in range(size)])
+
+    start = time.perf_counter()
+    full = np.argsort(-scores, kind="stable")[:k]
+    sort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    partial = select_top_k(scores, k)
+    select_time = time.perf_counter() - start
+
+    assert list(full) == list(partial), "top-k tie-break mismatch"
+    return sort_time, select_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 1000, 100000])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    users = [build_synthetic_user(rng) for _ in range(args.users)]
+
+    print(f"{'careers':>10} {'loop ms/user':>14} {'engine ms/user':>16} {'build ms':>10} {'speedup':>9}")
+    for size in args.sizes:
+        catalog = build_synthetic_catalog(size, rng)
+
+        start = time.perf_counter()
+        engine = CareerScoringEngine(catalog)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loop_results = [loop_recommendations(catalog, traits, inter, args.top_k) for traits, inter in users]
+        loop_time = (time.perf_counter() - start) / len(users)
+
+        start = time.perf_counter()
+        engine_results = [engine.recommend(traits, inter, top_k=args.top_k) for traits, inter in users]
+        engine_time = (time.perf_counter() - start) / len(users)
+
+        for expected, actual in zip(loop_results, engine_results):
+            assert [r["career"] for r in expected] == [r["career"] for r in actual], "ranking mismatch"
+            for e, a in zip(expected, actual):
+                assert abs(e["combined_score"] - a["combined_score"]) < 1e-12, "score mismatch"
+
+        print(f"{size:>10} {loop_time * 1000:>14.3f} {engine_time * 1000:>16.3f} "
+              f"{build_time * 1000:>10.1f} {loop_time / engine_time:>8.1f}x")
+
+    print()
+    print(f"{'careers':>10} {'full sort ms':>14} {'top-k ms':>10}")
+    for size in args.sizes:
+        sort_time, select_time = compare_top_k(size, args.top_k, rng)
+        print(f"{size:>10} {sort_time * 1000:>14.3f} {select_time * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: in-memory catalog vs memory-mapped catalog bundle
+Builds a synthetic catalog, exports it with catalog_store.save_catalog, then
+compares building the scoring index from Python dicts with memory-mapping the
+bundle, and the cost of scoring one user against each.
+
+Usage:
+    python benchmarks/bench_catalog_store.py [--careers 1000000]
+"""
+
+import argparse
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_career_engine import build_synthetic_catalog, build_synthetic_user
+from catalog_store import load_catalog_engine, save_catalog
+from career_engine import CareerScoringEngine
+
+
+# Peak RSS is read from VmHWM: ru_maxrss survives fork+exec and would report the parent's peak
+WORKER_CODE = """
+import sys
+from catalog_store import load_catalog_engine
+engine = load_catalog_engine(sys.argv[1])
+traits = {name: 3.5 for name in engine.trait_names}
+intersections = {name: {"score": 0.6} for name in engine.intersection_names}
+engine.recommend(traits, intersections)
+print(next(line.split()[1] for line in open("/proc/self/status") if line.startswith("VmHWM")))
+"""
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    traits, intersections = build_synthetic_user(rng)
+    catalog = build_synthetic_catalog(args.careers, rng)
+
+    with tempfile.TemporaryDirectory() as bundle:
+        start = time.perf_counter()
+        save_catalog(catalog, bundle)
+        print(f"Export {args.careers:,} careers: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        dict_engine = CareerScoringEngine(catalog)
+        print(f"Build index from dicts:  {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+        start = time.perf_counter()
+        mapped_engine = load_catalog_engine(bundle)
+        print(f"Memory-map bundle:       {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+        for label, engine in [("dict", dict_engine), ("mapped", mapped_engine)]:
+            start = time.perf_counter()
+            recommendations = engine.recommend(traits, intersections)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"Recommend ({label:>6}):      {elapsed:10.1f} ms  top: {recommendations[0]['career']}")
+
+        expected = [rec["career"] for rec in dict_engine.recommend(traits, intersections)]
+        actual = [rec["career"] for rec in mapped_engine.recommend(traits, intersections)]
+        assert expected == actual, "mapped catalog ranking differs"
+
+        # A fresh worker (Linux) that only maps the bundle shows the real per-process footprint
+        worker = subprocess.run(
+            [sys.executable, "-c", WORKER_CODE, bundle],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        print(f"Peak RSS, worker scoring from the mapped bundle: {float(worker.stdout) / 1024:8.0f} MB")
+        print(f"Peak RSS, this process (dict catalog + index):   {peak_rss_mb():8.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: incremental vs full rescoring on a slider change
+For each catalog size, moves random sliders one at a time and compares
+IncrementalIkigaiScorer.update + top-5 with the full path the app used to run
+(calculate_ikigai_intersections + CareerScoringEngine.rank with the keyword
+tie-break). Both order tied careers by keyword alignment.
+
+Usage:
+    python benchmarks/bench_incremental_scoring.py [--sizes 5 100000 1000000] [--moves 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_retrieval import build_array_engine
+from incremental_scoring import IncrementalIkigaiScorer
+from scoring import BIG_FIVE_TRAITS, IKIGAI_QUADRANTS, calculate_ikigai_intersections, get_career_engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 100_000, 1_000_000])
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    quadrant_items = [(quadrant, data["items"]) for quadrant, data in IKIGAI_QUADRANTS.items()]
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        engine = get_career_engine() if size <= 5 else build_array_engine(size, np.random.default_rng(args.seed))
+        trait_scores = {trait: rng.choice([2.5, 3, 3.5, 4, 4.5]) for trait in BIG_FIVE_TRAITS}
+        sliders = np.full((len(quadrant_items), len(quadrant_items[0][1])), 5.0)
+        moves = [(rng.randrange(sliders.shape[0]), rng.randrange(sliders.shape[1]), rng.randint(0, 10))
+                 for _ in range(args.moves)]
+
+        scorer = IncrementalIkigaiScorer(engine, trait_scores, sliders)
+        engine.keyword_matcher  # built once per catalog, outside the timed moves
+        start = time.perf_counter()
+        for quadrant, item, value in moves:
+            scorer.update(quadrant, item, value)
+            scorer.top_careers(5)
+        incremental = (time.perf_counter() - start) / args.moves
+
+        start = time.perf_counter()
+        for quadrant, item, value in moves:
+            sliders[quadrant, item] = value
+            ikigai_data = {
+                name: dict(zip(items, sliders[row].tolist())) for row, (name, items) in enumerate(quadrant_items)
+            }
+            intersections = calculate_ikigai_intersections(ikigai_data)
+            engine.rank(trait_scores, intersections, 5, sliders=sliders)
+        full = (time.perf_counter() - start) / args.moves
+
+        print(f"{size:>10,} careers: incremental {incremental * 1000:9.3f} ms/move   "
+              f"full {full * 1000:9.3f} ms/move   speedup {full / incremental:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: background job queue for the Ikigai analysis
+Scores synthetic users against a synthetic catalog and reports:
+- how long the caller is blocked: scoring inline vs. submitting the same work
+  to the JobQueue (the Streamlit script thread only pays for submit)
+- deduplication: many sessions submitting the same answers at once share one job
+- backpressure: submits beyond max_pending are rejected with QueueFull
+
+Usage:
+    python benchmarks/bench_job_queue.py [--careers 200000] [--users 50] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_retrieval import build_array_engine, build_user
+from job_queue import JobQueue, QueueFull
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    engine = build_array_engine(args.careers, rng)
+    users = [build_user(rng) for _ in range(args.users)]
+
+    start = time.perf_counter()
+    for traits, intersections in users:
+        engine.rank(traits, intersections)
+    inline = (time.perf_counter() - start) / args.users
+    print(f"{args.careers:,} careers, {os.cpu_count()} CPU(s)")
+    print(f"inline scoring:      {inline * 1000:8.2f} ms blocked per analysis")
+
+    with JobQueue(workers=args.workers, max_pending=args.users) as jobs:
+        start = time.perf_counter()
+        submitted = [jobs.submit(("user", idx), engine.rank, *user) for idx, user in enumerate(users)]
+        blocked = (time.perf_counter() - start) / args.users
+        for job in submitted:
+            job.result()
+        total = time.perf_counter() - start
+        print(f"job queue submit:    {blocked * 1000:8.3f} ms blocked per analysis "
+              f"({args.users / total:,.0f} analyses/s in the background)")
+
+    # Many sessions with identical answers clicking at the same moment
+    with JobQueue(workers=args.workers, max_pending=args.max_pending) as jobs:
+        barrier = threading.Barrier(args.users)
+        handles = []
+
+        def session():
+            barrier.wait()
+            handles.append(jobs.submit("same answers", engine.rank, *users[0]))
+
+        threads = [threading.Thread(target=session) for _ in range(args.users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        handles[0].result()
+        stats = jobs.stats()
+        print(f"deduplication:       {args.users} identical submits -> {stats['submitted']} job(s), "
+              f"{len({id(job) for job in handles})} distinct handle(s)")
+
+    # More distinct analyses than the queue admits
+    with JobQueue(workers=args.workers, max_pending=args.max_pending) as jobs:
+        accepted = []
+        rejected = 0
+        for idx, user in enumerate(users):
+            try:
+                accepted.append(jobs.submit(("user", idx), engine.rank, *user))
+            except QueueFull:
+                rejected += 1
+        for job in accepted:
+            job.result()
+        print(f"backpressure:        {len(accepted)} accepted, {rejected} rejected (max_pending={args.max_pending})")
+
+
+if __name__ == "__main__":
+    main()
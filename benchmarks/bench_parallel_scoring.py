@@ -0,0 +1,64 @@
+"""
+Benchmark: multi-process cohort scoring with shared-memory career matrices
+Scores the same synthetic cohort against a synthetic catalog in this process
+(score_in_passes) and with ParallelCohortScorer at several worker counts,
+checks that every run returns identical rankings, and reports the speedup.
+Near-linear scaling needs that many idle cores; the machine's CPU count is
+printed with the results.
+
+Usage:
+    python benchmarks/bench_parallel_scoring.py [--careers 20000] [--users 20000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_retrieval import build_array_engine
+from parallel_scoring import ParallelCohortScorer, score_in_passes
+from scoring import IKIGAI_QUADRANTS, PSYCHOMETRIC_QUESTIONS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    engine = build_array_engine(args.careers, rng)
+    n_options = min(len(question["options"]) for question in PSYCHOMETRIC_QUESTIONS)
+    n_items = len(next(iter(IKIGAI_QUADRANTS.values()))["items"])
+    answers = rng.integers(0, n_options, size=(args.users, len(PSYCHOMETRIC_QUESTIONS)))
+    sliders = rng.integers(0, 11, size=(args.users, len(IKIGAI_QUADRANTS), n_items)).astype(float)
+
+    start = time.perf_counter()
+    expected = score_in_passes(answers, sliders, engine, args.top_k)
+    serial_time = time.perf_counter() - start
+    print(f"{args.users:,} users x {args.careers:,} careers on {os.cpu_count()} CPU(s)")
+    print(f"{'in-process':>12}: {serial_time:8.2f}s  {args.users / serial_time:10,.0f} users/s")
+
+    for workers in args.workers:
+        with ParallelCohortScorer(engine, workers=workers) as scorer:
+            # Start every worker (and attach the shared catalog) before timing
+            scorer.score(answers[:workers], sliders[:workers], top_k=args.top_k)
+            start = time.perf_counter()
+            results = scorer.score(answers, sliders, top_k=args.top_k)
+            elapsed = time.perf_counter() - start
+
+        assert np.array_equal(results["top_careers"], expected["top_careers"]), "ranking mismatch"
+        assert np.array_equal(results["combined_score"], expected["combined_score"]), "score mismatch"
+        print(f"{workers:>4} workers: {elapsed:8.2f}s  {args.users / elapsed:10,.0f} users/s  "
+              f"speedup {serial_time / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
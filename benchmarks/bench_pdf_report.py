@@ -0,0 +1,77 @@
+"""
+Benchmark: PDF report rendering
+Measures single-report render time into a BytesIO (cold, with style setup,
+and warm, with the per-process style cache), then renders a synthetic cohort
+with pdf_report.render_cohort_reports for each worker count and reports
+reports/second.
+
+Usage:
+    python benchmarks/bench_pdf_report.py [--users 2000] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_batch_scoring import write_synthetic_cohort
+from pdf_report import render_cohort_reports, render_pdf_report, report_styles
+from scoring import (
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    calculate_ikigai_intersections,
+    calculate_trait_scores,
+    generate_comprehensive_recommendations,
+    generate_personality_analysis,
+)
+
+
+def sample_report_inputs():
+    """Psychometric and final results for a fixed sample user"""
+    trait_scores = calculate_trait_scores(question["options"][0] for question in PSYCHOMETRIC_QUESTIONS)
+    psychometric = {"trait_scores": trait_scores, "analysis": generate_personality_analysis(trait_scores)}
+    ikigai_data = {
+        quadrant: {item: (i * 3) % 11 for i, item in enumerate(data["items"])}
+        for quadrant, data in IKIGAI_QUADRANTS.items()
+    }
+    intersections = calculate_ikigai_intersections(ikigai_data)
+    results = {
+        "ikigai_intersections": intersections,
+        "career_recommendations": generate_comprehensive_recommendations(psychometric, ikigai_data, intersections)
+    }
+    return psychometric, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    psychometric, results = sample_report_inputs()
+    start = time.perf_counter()
+    report_styles()
+    buffer = render_pdf_report(psychometric, results)
+    print(f"First report (style setup + render): {(time.perf_counter() - start) * 1000:8.2f} ms, "
+          f"{len(buffer.getvalue()):,} bytes")
+
+    runs = 50
+    start = time.perf_counter()
+    for _ in range(runs):
+        render_pdf_report(psychometric, results)
+    print(f"Warm report into BytesIO:            {(time.perf_counter() - start) / runs * 1000:8.2f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "cohort.csv")
+        write_synthetic_cohort(input_path, args.users)
+        for workers in sorted(set(args.workers)):
+            stats = render_cohort_reports(input_path, os.path.join(tmp, f"reports_{workers}"), workers=workers)
+            print(f"Cohort of {stats['reports']:,} with {workers:>2} worker(s): {stats['total_seconds']:7.2f}s  "
+                  f"{stats['reports_per_second']:8,.0f} reports/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: exact full-catalog scoring vs tree-based candidate retrieval
+Builds a synthetic catalog directly as arrays (traits on the 1-5 scale, one to
+three Ikigai intersections per career), indexes it with CareerRetrievalIndex
+and compares, for random users:
+- recall@k: share of the exact top-k careers found by retrieval + re-rank
+- score recall@k: share of the exact top-k scores matched (ties between
+  careers with identical scores count as hits)
+- per-user latency of exact scoring and of retrieval + re-rank
+
+Usage:
+    python benchmarks/bench_retrieval.py [--careers 1000000] [--users 200] [--integer-traits]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import BIG_FIVE_TRAITS
+from career_engine import CareerScoringEngine, select_top_k
+from career_retrieval import CareerRetrievalIndex
+
+INTERSECTION_LABELS = ["Passion", "Mission", "Profession", "Vocation"]
+
+
+def build_array_engine(size, rng, integer_traits=False):
+    """CareerScoringEngine over random arrays (no per-career dicts, so 1M+ builds in seconds)"""
+    if integer_traits:
+        trait_matrix = rng.integers(1, 6, size=(size, len(BIG_FIVE_TRAITS))).astype(float)
+    else:
+        trait_matrix = np.round(rng.uniform(1, 5, size=(size, len(BIG_FIVE_TRAITS))), 2)
+    trait_mask = np.ones(trait_matrix.shape, dtype=bool)
+
+    # One to three distinct intersections per career
+    label_counts = rng.integers(1, 4, size=size)
+    ranks = rng.random((size, len(INTERSECTION_LABELS))).argsort(axis=1).argsort(axis=1)
+    intersection_matrix = (ranks < label_counts[:, np.newaxis]).astype(float)
+
+    return CareerScoringEngine.from_arrays(
+        None, range(size), BIG_FIVE_TRAITS, INTERSECTION_LABELS, {},
+        trait_matrix, trait_mask, intersection_matrix, intersection_matrix.sum(axis=1)
+    )
+
+
+def build_user(rng):
+    """Random trait scores and intersection scores shaped like the app's results"""
+    trait_scores = {trait: float(rng.choice([2.5, 3, 3.5, 4, 4.5, 5])) for trait in BIG_FIVE_TRAITS}
+    intersections = {label: {"score": float(rng.random())} for label in INTERSECTION_LABELS}
+    return trait_scores, intersections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--integer-traits", action="store_true", help="Whole-number traits (many exact ties)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    engine = build_array_engine(args.careers, rng, args.integer_traits)
+
+    start = time.perf_counter()
+    index = CareerRetrievalIndex(engine)
+    print(f"Index {args.careers:,} careers into {len(index)} partitions: {time.perf_counter() - start:.2f}s")
+
+    users = [build_user(rng) for _ in range(args.users)]
+    exact_time = retrieval_time = 0.0
+    found = score_found = candidates_total = 0
+
+    for trait_scores, intersections in users:
+        start = time.perf_counter()
+        _, _, combined = engine.score(trait_scores, intersections)
+        exact = select_top_k(combined, args.top_k)
+        exact_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = index.candidates(trait_scores, intersections, args.top_k)
+        _, _, candidate_scores = engine.score(trait_scores, intersections, rows)
+        retrieved = rows[select_top_k(candidate_scores, args.top_k)]
+        retrieval_time += time.perf_counter() - start
+
+        candidates_total += len(rows)
+        found += len(set(exact.tolist()) & set(retrieved.tolist()))
+        exact_scores = np.sort(combined[exact])
+        retrieved_scores = np.sort(combined[retrieved])
+        score_found += int(np.isclose(exact_scores, retrieved_scores, rtol=0, atol=1e-12).sum())
+
+    total = args.users * args.top_k
+    print(f"Exact scoring:        {exact_time / args.users * 1000:8.2f} ms/user")
+    print(f"Retrieval + re-rank:  {retrieval_time / args.users * 1000:8.2f} ms/user "
+          f"({candidates_total / args.users:,.0f} candidates/user)")
+    print(f"Speedup:              {exact_time / retrieval_time:8.1f}x")
+    print(f"recall@{args.top_k}:             {found / total:8.3f}")
+    print(f"score recall@{args.top_k}:       {score_found / total:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
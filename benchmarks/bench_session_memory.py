@@ -0,0 +1,112 @@
+"""
+Benchmark: per-session memory of completed assessments
+Builds N completed sessions with random answers and sliders and measures the
+bytes allocated per session (tracemalloc) for the nested-dict layout the app
+used to keep in st.session_state and for AssessmentState.
+
+Usage:
+    python benchmarks/bench_session_memory.py [--sessions 2000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from array import array
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assessment_state import SLIDER_ITEMS, AssessmentState, compact_results
+from scoring import (
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    calculate_ikigai_intersections,
+    calculate_trait_scores,
+    generate_comprehensive_recommendations,
+    generate_personality_analysis,
+    get_career_engine,
+)
+
+
+def dict_session(options, sliders):
+    """Session keys as the app stored them before AssessmentState"""
+    psychometric_answers = {}
+    for question, option in zip(PSYCHOMETRIC_QUESTIONS, options):
+        chosen = question["options"][option]
+        psychometric_answers[question["id"]] = {
+            "question": question["question"],
+            "text": chosen["text"],
+            "traits": chosen["traits"],
+            "category": question["category"]
+        }
+    trait_scores = calculate_trait_scores(psychometric_answers.values())
+    psychometric_results = {
+        "trait_scores": trait_scores,
+        "analysis": generate_personality_analysis(trait_scores),
+        "completed_at": datetime.now().isoformat()
+    }
+    ikigai_data = {quadrant: {} for quadrant in IKIGAI_QUADRANTS}
+    for (quadrant, item), value in zip(SLIDER_ITEMS, sliders):
+        ikigai_data[quadrant][item] = value
+    intersections = calculate_ikigai_intersections(ikigai_data)
+    return {
+        "psychometric_answers": psychometric_answers,
+        "psychometric_results": psychometric_results,
+        "ikigai_data": ikigai_data,
+        "final_recommendations": {
+            "ikigai_intersections": intersections,
+            "career_recommendations": generate_comprehensive_recommendations(psychometric_results, ikigai_data, intersections),
+            "completed_at": datetime.now().isoformat()
+        }
+    }
+
+
+def compact_session(options, sliders, engine):
+    state = AssessmentState()
+    state.answers[:] = array("b", options)
+    state.sliders[:] = array("B", sliders)
+    state.complete_psychometric()
+    intersections = calculate_ikigai_intersections(state.ikigai_data())
+    state.store_results(compact_results(intersections, *engine.rank(state.matching_traits(), intersections)), "bench")
+    return state
+
+
+def measure(build, inputs):
+    """Bytes still allocated per session after building all of them"""
+    gc.collect()
+    tracemalloc.start()
+    sessions = [build(options, sliders) for options, sliders in inputs]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return allocated / len(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    inputs = [
+        ([rng.randrange(len(question["options"])) for question in PSYCHOMETRIC_QUESTIONS],
+         [rng.randint(0, 10) for _ in SLIDER_ITEMS])
+        for _ in range(args.sessions)
+    ]
+    engine = get_career_engine()
+    # Warm module-level caches so they are not charged to the first layout
+    dict_session(*inputs[0])
+    compact_session(*inputs[0], engine)
+
+    dict_bytes = measure(dict_session, inputs)
+    compact_bytes = measure(lambda options, sliders: compact_session(options, sliders, engine), inputs)
+    print(f"{args.sessions:,} sessions: dict layout {dict_bytes:8,.0f} B/session   "
+          f"AssessmentState {compact_bytes:8,.0f} B/session   reduction {dict_bytes / compact_bytes:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
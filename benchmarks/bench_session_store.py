@@ -0,0 +1,72 @@
+"""
+Benchmark: session persistence cost on the render path
+Saves N completed sessions through SessionStore (the call the app makes at the
+end of a run), waits for the background writer, then resumes every session.
+Reports the per-call latency of save() and load() and the writer's throughput.
+
+Usage:
+    python benchmarks/bench_session_store.py [--sessions 20000] [--db /tmp/bench_sessions.db]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assessment_state import SLIDER_ITEMS, AssessmentState, compact_results
+from scoring import PSYCHOMETRIC_QUESTIONS, calculate_ikigai_intersections, get_career_engine
+from session_store import SessionStore
+
+
+def completed_record(rng, engine):
+    state = AssessmentState()
+    for idx, question in enumerate(PSYCHOMETRIC_QUESTIONS):
+        state.answers[idx] = rng.randrange(len(question["options"]))
+    for idx in range(len(SLIDER_ITEMS)):
+        state.sliders[idx] = rng.randint(0, 10)
+    state.complete_psychometric()
+    intersections = calculate_ikigai_intersections(state.ikigai_data())
+    state.store_results(compact_results(intersections, *engine.rank(state.matching_traits(), intersections)), "bench")
+    return state.record()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--db", default=None, help="Database file (default: a temporary file)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = get_career_engine()
+    records = [(f"session-{idx}", completed_record(rng, engine)) for idx in range(args.sessions)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SessionStore(args.db or os.path.join(tmp_dir, "sessions.db"))
+
+        start = time.perf_counter()
+        for session_id, record in records:
+            store.save(session_id, record)
+        save_time = time.perf_counter() - start
+        store.flush()
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resumed = sum(store.load(session_id) is not None for session_id, _ in records)
+        load_time = time.perf_counter() - start
+
+        stats = store.stats()
+        store.close()
+
+    print(f"save():  {save_time / args.sessions * 1e6:8.1f} us/call on the caller's thread")
+    print(f"writer:  {stats['rows_written']:,} rows in {stats['batches']:,} batches, "
+          f"{stats['rows_written'] / write_time:,.0f} rows/s")
+    print(f"load():  {load_time / args.sessions * 1e6:8.1f} us/call ({resumed:,} of {args.sessions:,} resumed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Benchmark suite for the scoring hot paths, with regression thresholds
+Times every stage of the pipeline on synthetic users against synthetic catalogs
+of increasing size, compares each stage with the stored baseline and fails
+when one is slower than its baseline by more than the threshold:
+
+- traits:        calculate_trait_scores over a user's answers
+- profile:       personality_profile table lookup, and trait_profile (Big Five
+                 plus auxiliary traits from the compiled option vectors)
+- intersections: calculate_ikigai_intersections (plus the scalar
+                 calculate_intersection_score for one quadrant pair)
+- compatibility: calculate_psychometric_compatibility against every career
+                 (the per-career reference formula, small catalogs only)
+- ranking:       generate_comprehensive_recommendations, and recommend_batch (both
+                 with the keyword tie-break and per-quadrant alignment)
+- report:        generate_text_report (and the PDF report when reportlab is installed)
+
+Each stage is reported as the best of --repeats mean times per call. Baselines
+are machine specific: record them on the machine that runs the comparison.
+
+Usage:
+    python benchmarks/bench_suite.py                      # compare with benchmarks/baselines.json
+    python benchmarks/bench_suite.py --save-baseline      # record new baselines
+    python benchmarks/bench_suite.py --sizes 5 1000 --threshold 0.5 --stages ranking
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_career_engine import build_synthetic_catalog
+from career_engine import CareerScoringEngine
+from scoring import (
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    calculate_ikigai_intersections,
+    calculate_intersection_score,
+    calculate_psychometric_compatibility,
+    calculate_trait_scores,
+    generate_comprehensive_recommendations,
+    generate_personality_analysis,
+    generate_text_report,
+    personality_profile,
+    slider_array,
+    trait_profile,
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# A stage fails when it is this much slower than its baseline (0.25 = 25%)
+DEFAULT_THRESHOLD = 0.25
+# Shortest timed repeat; fast stages loop over the users until it is reached
+MIN_REPEAT_SECONDS = 0.05
+# Full re-runs before a stage over the threshold is reported as a regression
+CONFIRM_RUNS = 2
+# Per-career Python loops are only timed up to this catalog size
+LOOP_SIZE_LIMIT = 10_000
+
+PDF_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+
+def build_synthetic_users(count, rng):
+    """(option indexes, psychometric_answers, ikigai_data) for random users"""
+    users = []
+    for _ in range(count):
+        options = [rng.randrange(len(question["options"])) for question in PSYCHOMETRIC_QUESTIONS]
+        answers = {
+            question["id"]: question["options"][option]
+            for question, option in zip(PSYCHOMETRIC_QUESTIONS, options)
+        }
+        ikigai_data = {
+            quadrant: {item: rng.randint(0, 10) for item in data["items"]}
+            for quadrant, data in IKIGAI_QUADRANTS.items()
+        }
+        users.append((options, answers, ikigai_data))
+    return users
+
+
+def time_stage(func, items, repeats):
+    """Best-of-repeats mean seconds per call of func over items
+
+    Each repeat makes whole passes over items for at least MIN_REPEAT_SECONDS,
+    with garbage collection paused, after one untimed warm-up pass.
+    """
+    for item in items:
+        func(item)
+
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            calls = 0
+            start = time.perf_counter()
+            while True:
+                for item in items:
+                    func(item)
+                calls += len(items)
+                elapsed = time.perf_counter() - start
+                if elapsed >= MIN_REPEAT_SECONDS:
+                    break
+            best = min(best, elapsed / calls)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def catalog_independent_stages(users, repeats):
+    """Stages that do not depend on the catalog size"""
+    # First two quadrants (love, good at) of each user, as the Passion score pairs them
+    quadrant_pairs = [tuple(list(ikigai_data.values())[:2]) for _, _, ikigai_data in users]
+    return {
+        "traits": time_stage(lambda user: calculate_trait_scores(user[1].values()), users, repeats),
+        "profile": time_stage(lambda user: personality_profile(user[0]), users, repeats),
+        "trait_profile": time_stage(lambda user: trait_profile(user[0]), users, repeats),
+        "intersections": time_stage(lambda user: calculate_ikigai_intersections(user[2]), users, repeats),
+        "intersection_score": time_stage(lambda pair: calculate_intersection_score(*pair), quadrant_pairs, repeats),
+    }
+
+
+def catalog_stages(size, users, repeats, rng, stages):
+    """Stages timed against a synthetic catalog of the given size"""
+    catalog = build_synthetic_catalog(size, rng)
+    engine = CareerScoringEngine(catalog)
+
+    prepared = []
+    for _, answers, ikigai_data in users:
+        trait_scores = calculate_trait_scores(answers.values())
+        psychometric = {"trait_scores": trait_scores, "analysis": generate_personality_analysis(trait_scores)}
+        prepared.append((psychometric, ikigai_data, calculate_ikigai_intersections(ikigai_data)))
+
+    timings = {}
+    if "compatibility" in stages and size <= LOOP_SIZE_LIMIT:
+        fits = [career["psychometric_fit"] for career in catalog.values()]
+        timings["compatibility"] = time_stage(
+            lambda user: [calculate_psychometric_compatibility(user[0]["trait_scores"], fit) for fit in fits],
+            prepared, repeats
+        )
+    if "ranking" in stages:
+        timings["ranking"] = time_stage(
+            lambda user: generate_comprehensive_recommendations(*user, engine=engine), prepared, repeats
+        )
+        batches = [(
+            [psychometric["trait_scores"] for psychometric, _, _ in prepared],
+            [intersections for _, _, intersections in prepared],
+            5,
+            [slider_array(ikigai_data) for _, ikigai_data, _ in prepared]
+        )]
+        timings["ranking_batch"] = time_stage(
+            lambda batch: engine.recommend_batch(*batch), batches, repeats
+        ) / len(prepared)
+    if "report" in stages:
+        results = [
+            (psychometric, {"ikigai_intersections": intersections,
+                            "career_recommendations": generate_comprehensive_recommendations(
+                                psychometric, ikigai_data, intersections, engine=engine)})
+            for psychometric, ikigai_data, intersections in prepared
+        ]
+        timings["text_report"] = time_stage(lambda result: generate_text_report(*result), results, repeats)
+        if PDF_AVAILABLE:
+            from pdf_report import render_pdf_report
+            timings["pdf_report"] = time_stage(lambda result: render_pdf_report(*result), results[:5], repeats)
+    return {f"{stage}@{size}": seconds for stage, seconds in timings.items()}
+
+
+def regressed_stages(timings, baselines, threshold):
+    """Keys of stages slower than their baseline by more than threshold"""
+    return [
+        key for key, seconds in timings.items()
+        if key in baselines and seconds / baselines[key] - 1 > threshold
+    ]
+
+
+def report(timings, baselines, threshold):
+    print(f"{'stage':<28} {'us/call':>12} {'baseline':>12} {'change':>9}")
+    for key, seconds in timings.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            print(f"{key:<28} {seconds * 1e6:>12.2f} {'-':>12} {'new':>9}")
+            continue
+        change = seconds / baseline - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{key:<28} {seconds * 1e6:>12.2f} {baseline * 1e6:>12.2f} {change:>+8.0%}{flag}")
+
+
+def run_suite(users, args):
+    """Timings for every selected stage and catalog size"""
+    timings = {}
+    if "traits" in args.stages:
+        timings.update(catalog_independent_stages(users, args.repeats))
+    for size in args.sizes:
+        # Same synthetic catalog on every run and re-run
+        timings.update(catalog_stages(size, users, args.repeats, random.Random(args.seed + size), args.stages))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 1_000, 100_000])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--stages", nargs="+", default=["traits", "compatibility", "ranking", "report"],
+                        choices=["traits", "compatibility", "ranking", "report"])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--confirm-runs", type=int, default=CONFIRM_RUNS,
+                        help="Re-runs (keeping each stage's best time) before a regression counts")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Record these timings as the new baselines")
+    args = parser.parse_args()
+
+    users = build_synthetic_users(args.users, random.Random(args.seed))
+    # Build lazily initialized tables before timing
+    personality_profile(users[0][0])
+    trait_profile(users[0][0])
+    timings = run_suite(users, args)
+
+    machine = f"{platform.machine()} {platform.processor() or platform.system()}, Python {platform.python_version()}"
+    if args.save_baseline:
+        baselines = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baselines = json.load(baseline_file)["stages"]
+        baselines.update(timings)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({"machine": machine, "stages": baselines}, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        report(timings, {}, args.threshold)
+        print(f"Saved {len(timings)} baselines to {args.baseline}")
+        return
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            recorded = json.load(baseline_file)
+        baselines = recorded["stages"]
+        if recorded.get("machine") != machine:
+            print(f"Note: baselines were recorded on {recorded.get('machine')}, this is {machine}")
+
+    # Shared or throttled machines have noisy moments; a regression has to survive re-runs
+    for _ in range(args.confirm_runs):
+        if not regressed_stages(timings, baselines, args.threshold):
+            break
+        for key, seconds in run_suite(users, args).items():
+            timings[key] = min(timings[key], seconds)
+
+    report(timings, baselines, args.threshold)
+    regressions = regressed_stages(timings, baselines, args.threshold)
+    for key in regressions:
+        print(f"FAIL: {key} is {timings[key] / baselines[key] - 1:.0%} slower than its baseline "
+              f"({args.threshold:.0%} allowed)")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: markup cost of one layer-3 rerun
+Builds the styling and card markup a layer-3 rerun sends (stylesheet, header,
+progress steps, Ikigai metrics, career cards) the way the app used to (inline
+CSS and per-rerun formatting of indented templates) and through ui_templates
+(minified stylesheet and cached compact cards). Reports bytes and server time.
+
+Usage:
+    python benchmarks/bench_ui_templates.py [--reruns 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui_templates import STYLESHEET, TEMPLATES, render, style_block
+
+CARDS = [
+    ("main_header", {}),
+    *[("progress_step", {"status_class": "active" if num == 3 else "complete", "icon": icon,
+                         "color": "var(--accent-color)" if num == 3 else "var(--text-secondary)",
+                         "num": num, "label": label})
+      for num, icon, label in [(1, "🧠", "Personality Analysis"), (2, "🌸", "Ikigai Discovery"),
+                               (3, "🎯", "Career Navigation")]],
+    ("section_header", {"title": "🎯 Your Career Navigation Results",
+                        "subtitle": "Comprehensive analysis combining personality and purpose"}),
+    *[("metric", {"value": value, "label": label})
+      for value, label in [(72, "Passion"), (64, "Mission"), (58, "Profession"), (61, "Vocation")]],
+    ("ikigai_score", {"score": 63}),
+    *[("career_card", {"rank": rank, "career": career, "match": match})
+      for rank, career, match in [(1, "Product Manager", 69), (2, "Digital Marketing Manager", 66),
+                                  (3, "UX/UI Designer", 62)]],
+    *[("match_breakdown", {"psychometric": psychometric, "ikigai": ikigai})
+      for psychometric, ikigai in [(78, 63), (74, 61), (70, 58)]],
+]
+
+
+def inline_rerun(stylesheet):
+    return [stylesheet] + [TEMPLATES[name].format(**fields) for name, fields in CARDS]
+
+
+def cached_rerun():
+    return [style_block()] + [render(name, **fields) for name, fields in CARDS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reruns", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(STYLESHEET, encoding="utf-8") as stylesheet_file:
+        stylesheet = f"<style>{stylesheet_file.read()}</style>"
+
+    for label, build in [("inline", lambda: inline_rerun(stylesheet)), ("cached", cached_rerun)]:
+        payload = sum(len(markup.encode("utf-8")) for markup in build())
+        start = time.perf_counter()
+        for _ in range(args.reruns):
+            build()
+        elapsed = (time.perf_counter() - start) / args.reruns
+        print(f"{label:>6}: {payload:6,} bytes/rerun   {elapsed * 1e6:7.1f} us/rerun")
+
+
+if __name__ == "__main__":
+    main()
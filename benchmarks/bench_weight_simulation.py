@@ -0,0 +1,87 @@
+"""
+Benchmark: what-if weight simulation
+Simulates synthetic users over a psychometric x Ikigai weight grid on a
+synthetic catalog and reports:
+- time per user for the full grid (skyband pruning + one broadcast over the
+  surviving candidates), with and without trait perturbations
+- how many candidates survive pruning
+- the naive cost of scoring the whole catalog at every grid setting, on a
+  sample of settings
+- a parity check of sampled settings against engine.rank
+
+Usage:
+    python benchmarks/bench_weight_simulation.py [--careers 10000] [--grid-steps 100] [--users 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_retrieval import build_array_engine, build_user
+from career_engine import select_top_k
+from weight_simulation import skyband, simulate_user, trait_perturbations, weight_grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=10_000)
+    parser.add_argument("--grid-steps", type=int, default=100)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    engine = build_array_engine(args.careers, rng)
+    users = [build_user(rng) for _ in range(args.users)]
+    grid = weight_grid(args.grid_steps)
+    n_settings = len(grid) ** 2
+    print(f"{args.careers:,} careers, {len(grid)} x {len(grid)} = {n_settings:,} weight settings, top {args.top_k}")
+
+    simulate_user(*users[0], engine, grid, grid, top_k=args.top_k)  # warm-up
+    start = time.perf_counter()
+    results = [simulate_user(traits, intersections, engine, grid, grid, top_k=args.top_k)
+               for traits, intersections in users]
+    per_user = (time.perf_counter() - start) / args.users
+    print(f"weight grid:         {per_user * 1000:8.1f} ms per user")
+
+    perturbations = trait_perturbations(engine)
+    start = time.perf_counter()
+    simulate_user(*users[0], engine, grid, grid, perturbations, top_k=args.top_k)
+    perturbed = time.perf_counter() - start
+    print(f"+ trait shifts:      {perturbed * 1000:8.1f} ms per user ({len(perturbations)} trait profiles)")
+
+    traits, intersections = users[0]
+    psych, ikigai, _ = engine.score(traits, intersections)
+    candidates = skyband(psych, ikigai, args.top_k)
+    print(f"skyband:             {len(candidates):,} of {args.careers:,} careers can reach the top {args.top_k}")
+
+    # Naive: a full catalog pass per setting, timed on a sample of settings
+    sample = rng.integers(0, len(grid), size=(50, 2))
+    start = time.perf_counter()
+    for psych_idx, ikigai_idx in sample:
+        select_top_k((psych * grid[psych_idx]) + (ikigai * grid[ikigai_idx]), args.top_k)
+    naive = (time.perf_counter() - start) / len(sample) * n_settings
+    print(f"naive full scoring:  {naive * 1000:8.1f} ms per user (estimated from {len(sample)} settings, "
+          f"{naive / per_user:.0f}x slower)")
+
+    mismatches = 0
+    for (traits, intersections), result in zip(users, results):
+        psych, ikigai, _ = engine.score(traits, intersections)
+        for psych_idx, ikigai_idx in sample:
+            expected = select_top_k((psych * grid[psych_idx]) + (ikigai * grid[ikigai_idx]), args.top_k)
+            mismatches += not np.array_equal(expected, result["top_careers"][0, psych_idx, ikigai_idx])
+    print(f"parity:              {mismatches} mismatches in {len(sample) * args.users} sampled settings")
+
+    result = results[0]
+    print(f"stability (user 0):  top-1 kept in {result['top1_agreement']:.1%} of settings, "
+          f"top-{args.top_k} set in {result['topk_agreement']:.1%}, mean overlap {result['mean_overlap']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Import-time regression check for the scoring core
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and fails
+when the module's cumulative import time exceeds the budget, or when it pulls
+in UI or heavy optional libraries.
+
+Usage:
+    python benchmarks/check_import_time.py [--module scoring] [--budget-ms 50] [--runs 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries the scoring core must never import eagerly
+FORBIDDEN_MODULES = ["streamlit", "pandas", "numpy", "plotly", "sklearn", "reportlab", "pyarrow"]
+
+
+def measure_import(module):
+    """Return (cumulative import time in ms, top-level modules loaded) for one fresh import"""
+    code = f"import sys, {module}; print(','.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry found for {module}")
+
+    loaded = set(proc.stdout.strip().split(","))
+    return cumulative_us / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="scoring")
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--runs", type=int, default=5, help="Best of N runs is compared to the budget")
+    args = parser.parse_args()
+
+    timings = []
+    loaded = set()
+    for _ in range(args.runs):
+        elapsed_ms, loaded = measure_import(args.module)
+        timings.append(elapsed_ms)
+
+    best = min(timings)
+    print(f"import {args.module}: best {best:.1f}ms, worst {max(timings):.1f}ms (budget {args.budget_ms:.0f}ms)")
+
+    failures = []
+    if best > args.budget_ms:
+        failures.append(f"import time {best:.1f}ms exceeds budget of {args.budget_ms:.0f}ms")
+    heavy = sorted(set(FORBIDDEN_MODULES) & loaded)
+    if heavy:
+        failures.append(f"eagerly imports {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
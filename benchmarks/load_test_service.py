@@ -0,0 +1,148 @@
+"""
+Load test: HTTP scoring service
+Starts scoring_service.py (unless --url points at a running instance), opens
+--connections keep-alive connections and sends --requests POST /recommend
+calls with random answers and sliders. Reports throughput and client-side
+p50/p99 latency, then the server's own /metrics.
+
+Usage:
+    python benchmarks/load_test_service.py [--requests 20000] [--connections 64] [--repeat-rate 0.0]
+    python benchmarks/load_test_service.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scoring import PSYCHOMETRIC_QUESTIONS, slider_columns
+
+
+def random_user(rng):
+    """Request body with random answers and sliders"""
+    return {
+        "answers": {f"q{question['id']}": rng.randint(1, len(question["options"])) for question in PSYCHOMETRIC_QUESTIONS},
+        "sliders": {field: rng.randint(0, 10) for field in slider_columns()}
+    }
+
+
+async def http_request(reader, writer, host, method, path, body=b""):
+    """One HTTP/1.1 request on an open keep-alive connection -> (status, body)"""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+    )
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+    length = int(next(value for name, value in headers.items() if name.lower() == "content-length"))
+    return status, await reader.readexactly(length)
+
+
+async def run_client(host, port, bodies, latencies, errors):
+    """Send bodies sequentially over a single connection"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            status, _ = await http_request(reader, writer, host, "POST", "/recommend", body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def fetch_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, body = await http_request(reader, writer, host, "GET", path)
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+async def wait_until_ready(host, port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return await fetch_json(host, port, "/healthz")
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def load_test(host, port, args):
+    rng = random.Random(args.seed)
+    await wait_until_ready(host, port)
+
+    # A share of repeated answer sets exercises the result cache
+    pool = [random_user(rng) for _ in range(100)]
+    bodies = [
+        json.dumps(rng.choice(pool) if rng.random() < args.repeat_rate else random_user(rng)).encode("utf-8")
+        for _ in range(args.requests)
+    ]
+    per_connection = [bodies[i::args.connections] for i in range(args.connections)]
+
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, chunk, latencies, errors) for chunk in per_connection))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{args.requests:,} requests over {args.connections} keep-alive connections in {elapsed:.2f}s")
+    print(f"Throughput: {args.requests / elapsed:10,.0f} req/s   errors: {len(errors)}")
+    print(f"Client latency: p50 {percentile(latencies, 0.50) * 1000:.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print("Server /metrics:")
+    print(json.dumps(await fetch_json(host, port, "/metrics"), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Test a running service instead of starting one")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the service started by this script")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--repeat-rate", type=float, default=0.0, help="Share of requests reusing an answer set")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", args.port
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "scoring_service.py"), "--host", host, "--port", str(port)],
+            cwd=ROOT
+        )
+
+    try:
+        asyncio.run(load_test(host, port, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
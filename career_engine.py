@@ -0,0 +1,426 @@
+"""
+PATH-FINDER: Vectorized Career Scoring Engine
+Packs the career catalog into NumPy matrices once so that a user can be
+scored against every career with a handful of array operations:
+- Trait matrix (careers x traits) built from each career's psychometric_fit
+- One-hot intersection matrix (careers x labels) built from ikigai_intersections
+"""
+
+from collections import namedtuple
+from functools import cached_property
+from types import MappingProxyType
+
+import numpy as np
+
+from scoring import normalize_keyword
+
+# Combined score weighting (Ikigai weighted more than personality)
+PSYCHOMETRIC_WEIGHT = 0.4
+IKIGAI_WEIGHT = 0.6
+
+# Score used when a career or user has nothing to compare against
+NEUTRAL_SCORE = 0.5
+
+# Intersection label -> (first quadrant, second quadrant) in slider tensor order
+INTERSECTION_PAIRS = [
+    ("Passion", 0, 1),
+    ("Mission", 0, 2),
+    ("Profession", 1, 3),
+    ("Vocation", 2, 3),
+]
+
+# Per-career list fields indexed as normalized keyword vocabularies
+KEYWORD_FIELDS = ["skills", "what_you_love", "what_youre_good_at", "what_world_needs", "what_you_can_be_paid_for"]
+
+# Terms of one catalog field: names by id, name -> id, and CSR-style career -> term ids
+Vocabulary = namedtuple("Vocabulary", ["names", "ids", "indptr", "indices"])
+
+# Above this many careers, per-row partial selection beats a full row sort
+ROW_SORT_LIMIT = 256
+
+
+def select_top_k(scores, k):
+    """Indices of the k highest scores, best first, ties kept in index order"""
+    n_scores = len(scores)
+    if k <= 0 or n_scores == 0:
+        return np.empty(0, dtype=np.intp)
+
+    negated = -np.asarray(scores)
+    if k >= n_scores:
+        return np.argsort(negated, kind="stable")
+
+    # Partial selection finds the k-th best score without sorting everything
+    kth = np.argpartition(negated, k - 1)[k - 1]
+    threshold = negated[kth]
+
+    # Same tie-break as a stable full sort: lowest indices win at the threshold
+    better = np.flatnonzero(negated < threshold)
+    tied = np.flatnonzero(negated == threshold)[:k - len(better)]
+    candidates = np.concatenate([better, tied])
+
+    return candidates[np.argsort(negated[candidates], kind="stable")]
+
+
+def break_ties(scores, top, secondary):
+    """Reorder a select_top_k result so careers tied on score follow secondary scores (higher first)
+
+    secondary(pool) returns the secondary scores of the careers at the pool
+    indices; it is only called when the list has a tie. Careers tied with the
+    last listed score compete for its place, and remaining ties keep index order.
+    """
+    if len(top) == 0:
+        return top
+    top_scores = scores[top]
+    # Array methods rather than np.any/np.flatnonzero: this runs once per ranked user
+    pool = (scores >= top_scores[-1]).nonzero()[0]
+    if len(pool) == len(top) and not (top_scores[1:] == top_scores[:-1]).any():
+        return top
+    # The pool is in index order and lexsort is stable, so full ties keep it
+    return pool[np.lexsort((-secondary(pool), -scores[pool]))][:len(top)]
+
+
+def select_top_k_rows(scores, k, secondary=None):
+    """Row-wise select_top_k for an (n_users, n_careers) score matrix
+
+    With secondary, rows whose list has a tie are reordered as in break_ties;
+    secondary(rows) returns the (len(rows), n_careers) secondary scores.
+    """
+    if scores.shape[1] <= ROW_SORT_LIMIT:
+        # Small catalogs: one stable sort over the whole matrix is cheapest
+        top = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+    elif len(scores) == 0:
+        return np.empty((0, k), dtype=np.intp)
+    else:
+        top = np.stack([select_top_k(row, k) for row in scores])
+    if secondary is None or top.shape[1] == 0:
+        return top
+
+    # Rows with equal scores inside the list or at its cut-off
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    tied = np.any(top_scores[:, 1:] == top_scores[:, :-1], axis=1)
+    tied |= (scores >= top_scores[:, -1:]).sum(axis=1) > top.shape[1]
+    tied_rows = np.flatnonzero(tied)
+    if len(tied_rows) == 0:
+        return top
+
+    if scores.shape[1] <= ROW_SORT_LIMIT:
+        # Re-sort the tied rows whole: score, then secondary, then index (lexsort is stable)
+        order = np.lexsort((-secondary(tied_rows), -scores[tied_rows]), axis=-1)
+        top[tied_rows] = order[:, :top.shape[1]]
+    else:
+        for row in tied_rows:
+            top[row] = break_ties(scores[row], top[row], lambda pool: secondary(np.array([row]))[0, pool])
+    return top
+
+
+def quadrant_pair_scores(sliders):
+    """Correlation scores (0-1) between every pair of Ikigai quadrants
+
+    sliders is a (4, n_items) array for one user or an (n_users, 4, n_items)
+    tensor for a cohort. All six pairwise Pearson correlations come from one
+    batched matrix product and are returned as a symmetric (4, 4) or
+    (n_users, 4, 4) array. Pairs with a zero-variance quadrant score 0.5.
+    """
+    sliders = np.asarray(sliders, dtype=float)
+    single_user = sliders.ndim == 2
+    if single_user:
+        sliders = sliders[np.newaxis]
+
+    deviations = sliders - sliders.mean(axis=2, keepdims=True)
+    sum_sq = (deviations ** 2).sum(axis=2)
+    numerators = deviations @ deviations.transpose(0, 2, 1)
+    denominators = sum_sq[:, :, np.newaxis] * sum_sq[:, np.newaxis, :]
+
+    scores = np.full(numerators.shape, NEUTRAL_SCORE)
+    valid = denominators != 0
+    correlation = numerators[valid] / denominators[valid] ** 0.5
+    scores[valid] = np.clip((correlation + 1) / 2, 0, 1)
+    return scores[0] if single_user else scores
+
+
+def batch_intersection_scores(sliders):
+    """Intersection scores for an (n_users, 4, n_items) slider tensor -> (n_users, 4)
+
+    Quadrants are ordered love, good at, world needs, paid for; columns follow
+    INTERSECTION_PAIRS. Zero-variance quadrants fall back to the neutral 0.5.
+    """
+    pair_scores = quadrant_pair_scores(sliders)
+    firsts = [first for _, first, _ in INTERSECTION_PAIRS]
+    seconds = [second for _, _, second in INTERSECTION_PAIRS]
+    return pair_scores[:, firsts, seconds]
+
+
+def _frozen(array):
+    """Mark an array read-only so a shared index cannot be mutated by a session"""
+    array.setflags(write=False)
+    return array
+
+
+def _build_vocabulary(careers, field, normalize=None):
+    """Collect a per-career list field into a Vocabulary with CSR-style career -> term ids"""
+    names = []
+    ids = {}
+    indptr = [0]
+    indices = []
+    for career_data in careers:
+        for term in career_data.get(field, []):
+            if normalize is not None:
+                term = normalize(term)
+            if term not in ids:
+                ids[term] = len(names)
+                names.append(term)
+            indices.append(ids[term])
+        indptr.append(len(indices))
+
+    return Vocabulary(
+        tuple(names),
+        MappingProxyType(ids),
+        _frozen(np.array(indptr, dtype=np.int64)),
+        _frozen(np.array(indices, dtype=np.int64))
+    )
+
+
+class CareerScoringEngine:
+    """Immutable matrix view of a career catalog for vectorized scoring
+
+    Build it once per process and share it between sessions: every array is
+    read-only and every lookup table is a read-only mapping.
+    """
+
+    def __init__(self, career_database, fingerprint=None):
+        careers = list(career_database.values())
+
+        # Trait and intersection vocabularies in first-seen order across the catalog
+        traits = _build_vocabulary(careers, "psychometric_fit")
+        intersections = _build_vocabulary(careers, "ikigai_intersections")
+
+        # Normalized keyword vocabularies (skills and the per-quadrant lists)
+        keyword_vocabularies = {
+            field: _build_vocabulary(careers, field, normalize_keyword) for field in KEYWORD_FIELDS
+        }
+
+        trait_matrix = np.zeros((len(careers), len(traits.names)))
+        trait_mask = np.zeros((len(careers), len(traits.names)), dtype=bool)
+        intersection_matrix = np.zeros((len(careers), len(intersections.names)))
+
+        for row, career_data in enumerate(careers):
+            for trait, ideal_score in career_data.get("psychometric_fit", {}).items():
+                col = traits.ids[trait]
+                trait_matrix[row, col] = ideal_score
+                trait_mask[row, col] = True
+            # Counts rather than booleans so repeated labels weigh like the loop version
+            for intersection in career_data.get("ikigai_intersections", []):
+                intersection_matrix[row, intersections.ids[intersection]] += 1
+
+        self._assign(
+            career_database, tuple(career_database.keys()), traits.names, intersections.names,
+            keyword_vocabularies, trait_matrix, trait_mask, intersection_matrix,
+            np.diff(intersections.indptr).astype(float), fingerprint
+        )
+
+    @classmethod
+    def from_arrays(cls, career_database, career_names, trait_names, intersection_names, keyword_vocabularies,
+                    trait_matrix, trait_mask, intersection_matrix, intersection_counts, fingerprint=None):
+        """Wrap prebuilt arrays (e.g. memory-mapped from a catalog bundle) without copying them"""
+        engine = cls.__new__(cls)
+        engine._assign(
+            career_database, career_names, trait_names, intersection_names, keyword_vocabularies,
+            trait_matrix, trait_mask, intersection_matrix, intersection_counts, fingerprint
+        )
+        return engine
+
+    def _assign(self, career_database, career_names, trait_names, intersection_names, keyword_vocabularies,
+                trait_matrix, trait_mask, intersection_matrix, intersection_counts, fingerprint):
+        self.career_database = career_database
+        self.career_names = career_names
+        self.fingerprint = fingerprint
+
+        self.trait_names = tuple(trait_names)
+        self.trait_ids = MappingProxyType({name: idx for idx, name in enumerate(self.trait_names)})
+        self.intersection_names = tuple(intersection_names)
+        self.intersection_ids = MappingProxyType({name: idx for idx, name in enumerate(self.intersection_names)})
+        self.keyword_vocabularies = MappingProxyType(dict(keyword_vocabularies))
+
+        self.trait_matrix = _frozen(trait_matrix)
+        self.trait_mask = _frozen(trait_mask)
+        self.intersection_matrix = _frozen(intersection_matrix)
+        self.intersection_counts = _frozen(intersection_counts)
+
+    @cached_property
+    def career_ids(self):
+        """Career name -> row index (built on first use; decodes every name)"""
+        return MappingProxyType({name: idx for idx, name in enumerate(self.career_names)})
+
+    def career_record(self, career_idx):
+        """Full record of one career (decoded on demand for memory-mapped catalogs)"""
+        decode = getattr(self.career_database, "record", None)
+        if decode is not None:
+            return decode(career_idx)
+        return self.career_database[self.career_names[career_idx]]
+
+    def career_keywords(self, career_idx, field):
+        """Normalized keywords of one career for a KEYWORD_FIELDS field"""
+        vocabulary = self.keyword_vocabularies[field]
+        start, stop = vocabulary.indptr[career_idx], vocabulary.indptr[career_idx + 1]
+        return [vocabulary.names[term] for term in vocabulary.indices[start:stop]]
+
+    def __len__(self):
+        return len(self.career_names)
+
+    @cached_property
+    def keyword_matcher(self):
+        """KeywordMatcher over the per-quadrant keyword lists (built on first use)"""
+        from keyword_matching import KeywordMatcher
+        return KeywordMatcher(self)
+
+    def keyword_tiebreak(self, users_sliders):
+        """select_top_k_rows secondary: keyword alignment for an (n_users, 4, n_items) slider tensor"""
+        return lambda rows: self.keyword_matcher.alignment_batch(np.asarray(users_sliders)[rows])
+
+    def trait_vector(self, user_traits):
+        """Return (values, mask) arrays for a trait dict, aligned to trait_names"""
+        values = np.zeros(len(self.trait_names))
+        mask = np.zeros(len(self.trait_names), dtype=bool)
+        for trait, score in (user_traits or {}).items():
+            col = self.trait_ids.get(trait)
+            if col is not None:
+                values[col] = score
+                mask[col] = True
+        return values, mask
+
+    def intersection_vector(self, intersections):
+        """Return intersection scores aligned to intersection_names"""
+        values = np.zeros(len(self.intersection_names))
+        for intersection, col in self.intersection_ids.items():
+            if intersection in intersections:
+                values[col] = intersections[intersection]["score"]
+        return values
+
+    def psychometric_scores_batch(self, user_values, user_masks, rows=None):
+        """Compatibility for (n_users, n_traits) users against every career (or just rows)"""
+        trait_matrix = self.trait_matrix if rows is None else self.trait_matrix[rows]
+        trait_mask = self.trait_mask if rows is None else self.trait_mask[rows]
+
+        active = trait_mask[np.newaxis, :, :] & user_masks[:, np.newaxis, :]
+        distance = np.abs(user_values[:, np.newaxis, :] - trait_matrix[np.newaxis, :, :])
+        compatibility = np.maximum(0, 1 - (distance / 5))
+        totals = np.sum(compatibility, axis=2, where=active)
+        counts = active.sum(axis=2)
+
+        scores = np.full(totals.shape, NEUTRAL_SCORE)
+        np.divide(totals, counts, out=scores, where=counts > 0)
+        return scores
+
+    def ikigai_scores_batch(self, user_intersections, rows=None):
+        """Alignment for (n_users, n_labels) intersection scores against every career (or just rows)"""
+        intersection_matrix = self.intersection_matrix if rows is None else self.intersection_matrix[rows]
+        intersection_counts = self.intersection_counts if rows is None else self.intersection_counts[rows]
+        totals = (intersection_matrix[np.newaxis, :, :] * user_intersections[:, np.newaxis, :]).sum(axis=2)
+
+        scores = np.full(totals.shape, NEUTRAL_SCORE)
+        np.divide(totals, intersection_counts, out=scores, where=intersection_counts > 0)
+        return scores
+
+    def score_batch(self, user_values, user_masks, user_intersections, rows=None):
+        """Return (psychometric, ikigai, combined) score matrices for a batch of users"""
+        psych_scores = self.psychometric_scores_batch(user_values, user_masks, rows)
+        ikigai_scores = self.ikigai_scores_batch(user_intersections, rows)
+        combined_scores = (psych_scores * PSYCHOMETRIC_WEIGHT) + (ikigai_scores * IKIGAI_WEIGHT)
+        return psych_scores, ikigai_scores, combined_scores
+
+    def psychometric_scores(self, user_traits, rows=None):
+        """Compatibility between the user's traits and every career (0-1)"""
+        values, mask = self.trait_vector(user_traits)
+        return self.psychometric_scores_batch(values[np.newaxis], mask[np.newaxis], rows)[0]
+
+    def ikigai_scores(self, intersections, rows=None):
+        """Alignment between the user's Ikigai intersections and every career (0-1)"""
+        return self.ikigai_scores_batch(self.intersection_vector(intersections)[np.newaxis], rows)[0]
+
+    def score(self, user_traits, intersections, rows=None):
+        """Return (psychometric, ikigai, combined) score arrays for the whole catalog (or just rows)"""
+        psych_scores = self.psychometric_scores(user_traits, rows)
+        ikigai_scores = self.ikigai_scores(intersections, rows)
+        combined_scores = (psych_scores * PSYCHOMETRIC_WEIGHT) + (ikigai_scores * IKIGAI_WEIGHT)
+        return psych_scores, ikigai_scores, combined_scores
+
+    def rank(self, user_traits, intersections, top_k=5, rows=None, sliders=None):
+        """Return (career indices, psychometric, ikigai, combined scores) for the top_k careers
+
+        With the user's (4, n_items) sliders, careers tied on the combined score
+        are ordered by keyword alignment (keyword_matching.py) before catalog order.
+        """
+        psych_scores, ikigai_scores, combined_scores = self.score(user_traits, intersections, rows)
+        order = select_top_k(combined_scores, top_k)
+        if sliders is not None:
+            def alignment(pool):
+                return self.keyword_matcher.alignment(sliders, pool if rows is None else np.asarray(rows)[pool])
+            order = break_ties(combined_scores, order, alignment)
+        career_ids = order if rows is None else np.asarray(rows)[order]
+        return career_ids, psych_scores[order], ikigai_scores[order], combined_scores[order]
+
+    def recommend(self, user_traits, intersections, top_k=5, rows=None, sliders=None):
+        """Build recommendation dicts for the top_k careers, ranked as in rank()
+
+        rows restricts scoring to a sorted subset of career indices, e.g. the
+        candidates returned by a retrieval index. Without sliders, careers tied
+        on the combined score keep catalog order; with them, ties follow keyword
+        alignment and each dict carries its per-quadrant keyword_alignment.
+        """
+        ranking = self.rank(user_traits, intersections, top_k, rows, sliders)
+        alignments = self.keyword_alignments(sliders, ranking[0])
+        return [
+            self.recommendation(career_idx, psych_score, ikigai_score, combined_score, alignment)
+            for career_idx, psych_score, ikigai_score, combined_score, alignment in zip(*ranking, alignments)
+        ]
+
+    def keyword_alignments(self, sliders, career_ids):
+        """Per-quadrant keyword alignment dicts for listed careers, or Nones without sliders"""
+        if sliders is None:
+            return [None] * len(career_ids)
+        return self.keyword_matcher.quadrant_alignment_dicts(sliders, career_ids)
+
+    def recommend_batch(self, users_traits, users_intersections, top_k=5, users_sliders=None):
+        """recommend() for many users with a single scoring pass over the catalog
+
+        users_sliders is an optional (n_users, 4, n_items) slider tensor for the
+        keyword tie-break and per-quadrant alignment.
+        """
+        if not users_traits:
+            return []
+
+        vectors = [self.trait_vector(user_traits) for user_traits in users_traits]
+        user_values = np.stack([values for values, _ in vectors])
+        user_masks = np.stack([mask for _, mask in vectors])
+        user_intersections = np.stack([self.intersection_vector(intersections) for intersections in users_intersections])
+
+        psych_scores, ikigai_scores, combined_scores = self.score_batch(user_values, user_masks, user_intersections)
+        secondary = self.keyword_tiebreak(users_sliders) if users_sliders is not None else None
+        top = select_top_k_rows(combined_scores, top_k, secondary)
+
+        return [
+            [
+                self.recommendation(
+                    idx, psych_scores[user, idx], ikigai_scores[user, idx], combined_scores[user, idx], alignment
+                )
+                for idx, alignment in zip(
+                    top[user], self.keyword_alignments(None if users_sliders is None else users_sliders[user], top[user])
+                )
+            ]
+            for user in range(len(top))
+        ]
+
+    def recommendation(self, career_idx, psych_score, ikigai_score, combined_score, keyword_alignment=None):
+        """Recommendation dict for one career and its scores (plus per-quadrant keyword alignment, if given)"""
+        combined_score = float(combined_score)
+        recommendation = {
+            "career": self.career_names[career_idx],
+            "data": self.career_record(career_idx),
+            "psychometric_score": float(psych_score),
+            "ikigai_score": float(ikigai_score),
+            "combined_score": combined_score,
+            "match_percentage": int(combined_score * 100)
+        }
+        if keyword_alignment is not None:
+            recommendation["keyword_alignment"] = keyword_alignment
+        return recommendation
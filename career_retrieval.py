@@ -0,0 +1,122 @@
+"""
+PATH-FINDER: Career Candidate Retrieval
+Tree-based candidate retrieval for very large catalogs (1M+ occupations),
+followed by an exact re-rank with the 40/60 formula:
+- Careers are embedded by their Ikigai signature (normalized intersection row)
+  and trait mask; careers sharing both form a partition, so the Ikigai part of
+  the score is constant inside it
+- Inside a partition personality fit falls as the Manhattan distance between
+  user and career traits grows, so a KDTree with the manhattan metric returns
+  the best personality matches without scanning the partition
+- Partitions are visited best-first by their score upper bound and skipped
+  once they cannot beat the current k-th candidate
+
+Small partitions, and users missing a trait the partition uses, are scored
+exhaustively, so the only approximation comes from ties and from clipping of
+per-trait distances beyond the 0-5 scale.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from career_engine import IKIGAI_WEIGHT, NEUTRAL_SCORE, PSYCHOMETRIC_WEIGHT
+
+# Partitions smaller than this are scored exhaustively instead of through a tree
+MIN_TREE_SIZE = 256
+
+# Candidates pulled from each partition's tree, as a multiple of top_k
+OVERSAMPLE = 4
+
+# Tolerance when comparing a partition's upper bound against exact scores
+BOUND_EPSILON = 1e-9
+
+Partition = namedtuple("Partition", ["rows", "trait_dims", "signature", "neutral", "tree"])
+
+
+class CareerRetrievalIndex:
+    """Partitioned KDTree index over a CareerScoringEngine"""
+
+    def __init__(self, engine, min_tree_size=MIN_TREE_SIZE, leaf_size=40):
+        # scikit-learn is only needed once an index is actually built
+        from sklearn.neighbors import KDTree
+
+        self.engine = engine
+        n_traits = len(engine.trait_names)
+        n_labels = len(engine.intersection_names)
+
+        # Embedding key: trait mask | normalized intersection signature | "no labels" flag
+        counts = np.where(engine.intersection_counts > 0, engine.intersection_counts, 1)
+        keys = np.concatenate([
+            engine.trait_mask.astype(float),
+            engine.intersection_matrix / counts[:, np.newaxis],
+            (engine.intersection_counts == 0).astype(float)[:, np.newaxis]
+        ], axis=1)
+        # Unique over whole rows viewed as bytes; much faster than np.unique(axis=0)
+        row_bytes = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+        _, first_rows, inverse = np.unique(row_bytes, return_index=True, return_inverse=True)
+        unique_keys = keys[first_rows]
+        inverse = inverse.ravel()
+
+        # Stable sort keeps each partition's rows in catalog order
+        order = np.argsort(inverse, kind="stable")
+        boundaries = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+        self.partitions = []
+        for part, key in enumerate(unique_keys):
+            rows = order[boundaries[part]:boundaries[part + 1]]
+            trait_dims = np.flatnonzero(key[:n_traits])
+            tree = None
+            if len(rows) >= min_tree_size and len(trait_dims) > 0:
+                points = np.ascontiguousarray(engine.trait_matrix[rows][:, trait_dims])
+                tree = KDTree(points, metric="manhattan", leaf_size=leaf_size)
+            self.partitions.append(Partition(
+                rows, trait_dims, key[n_traits:n_traits + n_labels], bool(key[-1]), tree
+            ))
+
+    def __len__(self):
+        return len(self.partitions)
+
+    def candidates(self, user_traits, intersections, top_k=5, per_partition=None):
+        """Sorted career indices likely to contain the exact top_k"""
+        per_partition = per_partition or top_k * OVERSAMPLE
+        values, mask = self.engine.trait_vector(user_traits)
+        user_ikigai = self.engine.intersection_vector(intersections)
+
+        # Ikigai is constant per partition; personality fit is at most 1
+        ikigai = np.array([
+            NEUTRAL_SCORE if part.neutral else float(part.signature @ user_ikigai) for part in self.partitions
+        ])
+        upper_bounds = PSYCHOMETRIC_WEIGHT + IKIGAI_WEIGHT * ikigai
+
+        selected = []
+        best_scores = np.empty(0)
+        for part_idx in np.argsort(-upper_bounds, kind="stable"):
+            if len(best_scores) >= top_k and upper_bounds[part_idx] + BOUND_EPSILON < best_scores[-top_k]:
+                break
+
+            part = self.partitions[part_idx]
+            if part.tree is None or not mask[part.trait_dims].all():
+                rows = part.rows
+            else:
+                n_neighbors = min(per_partition, len(part.rows))
+                _, neighbors = part.tree.query(values[part.trait_dims][np.newaxis], k=n_neighbors)
+                rows = np.sort(part.rows[neighbors[0]])
+
+            _, _, combined = self.engine.score_batch(
+                values[np.newaxis], mask[np.newaxis], user_ikigai[np.newaxis], rows
+            )
+            selected.append(rows)
+            best_scores = np.sort(np.concatenate([best_scores, combined[0]]))[-top_k:]
+
+        if not selected:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(selected))
+
+    def recommend(self, user_traits, intersections, top_k=5, per_partition=None, sliders=None):
+        """Retrieve candidates, then re-rank them exactly with CareerScoringEngine.recommend
+
+        sliders applies the keyword tie-break among the retrieved candidates.
+        """
+        rows = self.candidates(user_traits, intersections, top_k, per_partition)
+        return self.engine.recommend(user_traits, intersections, top_k=top_k, rows=rows, sliders=sliders)
@@ -0,0 +1,244 @@
+"""
+PATH-FINDER: External Career Catalog Store
+Columnar on-disk career catalog that is memory-mapped at startup:
+- Numeric fields (trait matrix and mask, intersection counts, keyword ids) are
+  .npy files opened with mmap_mode="r": zero-copy arrays whose pages the OS
+  shares between worker processes on the same host
+- Career names and full records live in string tables (UTF-8 blob + offsets)
+  and are decoded only for the careers a caller actually looks up
+- Exports are written to a sibling directory and swapped into place, so running
+  processes keep their mapped files and never see a half-written bundle
+
+Usage:
+    python catalog_store.py export catalog_bundle/   # write the built-in catalog
+    python catalog_store.py info catalog_bundle/
+    PATHFINDER_CATALOG=catalog_bundle/ streamlit run app.py
+"""
+
+import argparse
+import json
+import mmap
+import os
+import shutil
+import uuid
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+
+import numpy as np
+
+from career_engine import KEYWORD_FIELDS, CareerScoringEngine, Vocabulary
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Numeric columns stored as one .npy file each
+MATRIX_FILES = {
+    "trait_matrix": "trait_matrix.npy",
+    "trait_mask": "trait_mask.npy",
+    "intersection_matrix": "intersection_matrix.npy",
+    "intersection_counts": "intersection_counts.npy",
+}
+
+
+class StringTable(Sequence):
+    """Read-only sequence of strings backed by a memory-mapped UTF-8 blob and an offsets array"""
+
+    def __init__(self, blob_path, offsets_path):
+        self.offsets = np.load(offsets_path, mmap_mode="r")
+        self._blob = b""
+        if os.path.getsize(blob_path) > 0:
+            with open(blob_path, "rb") as blob_file:
+                self._blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("string table index out of range")
+        return self._blob[int(self.offsets[idx]):int(self.offsets[idx + 1])].decode("utf-8")
+
+
+def write_string_table(strings, blob_path, offsets_path):
+    """Write strings as one UTF-8 blob plus an int64 offsets array"""
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+
+    with open(blob_path, "wb") as blob_file:
+        blob_file.write(b"".join(encoded))
+    np.save(offsets_path, offsets)
+
+
+class MappedCatalog(Mapping):
+    """Career name -> record mapping over string tables; records are decoded on access"""
+
+    def __init__(self, directory):
+        self.names = StringTable(
+            os.path.join(directory, "names.bin"), os.path.join(directory, "names_offsets.npy")
+        )
+        self.records = StringTable(
+            os.path.join(directory, "records.bin"), os.path.join(directory, "records_offsets.npy")
+        )
+        self._ids = None
+
+    def record(self, idx):
+        """Decode the record of the career at row idx"""
+        return json.loads(self.records[idx])
+
+    def __getitem__(self, name):
+        if self._ids is None:
+            # Name lookups need every name once; index lookups via record() never do
+            self._ids = {career_name: idx for idx, career_name in enumerate(self.names)}
+        return self.record(self._ids[name])
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+def save_catalog(career_database, directory, fingerprint=None):
+    """Write a career catalog dict as a memory-mappable bundle; returns the manifest
+
+    An existing bundle in directory is replaced as a whole; a non-empty
+    directory that is not a bundle is refused.
+    """
+    directory = os.path.abspath(directory)
+    if os.path.isdir(directory) and os.listdir(directory) and not os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+        raise ValueError(f"{directory} is not empty and is not a catalog bundle")
+    os.makedirs(os.path.dirname(directory), exist_ok=True)
+
+    staging = f"{directory}.{uuid.uuid4().hex[:8]}.tmp"
+    os.mkdir(staging)
+    try:
+        manifest = _write_bundle(career_database, staging, fingerprint)
+        _swap_directory(staging, directory)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return manifest
+
+
+def _swap_directory(staging, directory):
+    """Move a finished bundle into place; files of a replaced bundle stay valid while mapped"""
+    if not os.path.exists(directory):
+        os.replace(staging, directory)
+        return
+    retired = f"{staging}.old"
+    os.replace(directory, retired)
+    try:
+        os.replace(staging, directory)
+    except OSError:
+        os.replace(retired, directory)
+        raise
+    # Processes that mapped the old files keep reading them until they reload
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def _write_bundle(career_database, directory, fingerprint):
+    engine = CareerScoringEngine(career_database)
+
+    for attribute, filename in MATRIX_FILES.items():
+        np.save(os.path.join(directory, filename), getattr(engine, attribute))
+    for field, vocabulary in engine.keyword_vocabularies.items():
+        np.save(os.path.join(directory, f"keywords_{field}_indptr.npy"), vocabulary.indptr)
+        np.save(os.path.join(directory, f"keywords_{field}_indices.npy"), vocabulary.indices)
+
+    write_string_table(
+        career_database.keys(),
+        os.path.join(directory, "names.bin"), os.path.join(directory, "names_offsets.npy")
+    )
+    write_string_table(
+        (json.dumps(career_data, separators=(",", ":")) for career_data in career_database.values()),
+        os.path.join(directory, "records.bin"), os.path.join(directory, "records_offsets.npy")
+    )
+
+    if fingerprint is None:
+        from scoring import catalog_fingerprint
+        fingerprint = catalog_fingerprint(career_database)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "fingerprint": fingerprint,
+        "careers": len(engine),
+        "trait_names": list(engine.trait_names),
+        "intersection_names": list(engine.intersection_names),
+        "keyword_names": {field: list(vocabulary.names) for field, vocabulary in engine.keyword_vocabularies.items()}
+    }
+    with open(os.path.join(directory, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def read_manifest(directory):
+    """Load and validate a bundle's manifest"""
+    with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported catalog format {manifest.get('format_version')} in {directory} "
+            f"(expected {FORMAT_VERSION})"
+        )
+    return manifest
+
+
+def load_catalog_engine(directory):
+    """Memory-map a bundle and wrap it in a CareerScoringEngine without copying arrays"""
+    manifest = read_manifest(directory)
+    arrays = {
+        attribute: np.load(os.path.join(directory, filename), mmap_mode="r")
+        for attribute, filename in MATRIX_FILES.items()
+    }
+
+    keyword_vocabularies = {}
+    for field in KEYWORD_FIELDS:
+        names = tuple(manifest["keyword_names"][field])
+        keyword_vocabularies[field] = Vocabulary(
+            names,
+            MappingProxyType({name: idx for idx, name in enumerate(names)}),
+            np.load(os.path.join(directory, f"keywords_{field}_indptr.npy"), mmap_mode="r"),
+            np.load(os.path.join(directory, f"keywords_{field}_indices.npy"), mmap_mode="r")
+        )
+
+    catalog = MappedCatalog(directory)
+    return CareerScoringEngine.from_arrays(
+        catalog,
+        catalog.names,
+        manifest["trait_names"],
+        manifest["intersection_names"],
+        keyword_vocabularies,
+        fingerprint=manifest["fingerprint"],
+        **arrays
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or inspect memory-mapped career catalogs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Write the built-in CAREER_DATABASE as a bundle")
+    export_parser.add_argument("directory")
+    info_parser = subparsers.add_parser("info", help="Show a bundle's manifest summary")
+    info_parser.add_argument("directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        from scoring import CAREER_DATABASE
+        manifest = save_catalog(CAREER_DATABASE, args.directory)
+        print(f"Wrote {manifest['careers']} careers to {args.directory} (fingerprint {manifest['fingerprint']})")
+    else:
+        manifest = read_manifest(args.directory)
+        print(f"Careers:       {manifest['careers']}")
+        print(f"Fingerprint:   {manifest['fingerprint']}")
+        print(f"Traits:        {', '.join(manifest['trait_names'])}")
+        print(f"Intersections: {', '.join(manifest['intersection_names'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+PATH-FINDER: Incremental Ikigai Scoring
+Live career scores while the user moves the Ikigai sliders:
+- Running sums per quadrant plus a 4x4 matrix of cross-products (sums of
+  squares on the diagonal) make one slider change an O(1) update of the three
+  quadrant-pair correlations it affects
+- The personality part of every career's score is fixed during layer 2, so
+  re-ranking after a change only recomputes the Ikigai part: O(careers)
+- Careers tied on the combined score follow keyword alignment with the current
+  sliders, as in the final ranking (CareerScoringEngine.rank)
+"""
+
+import numpy as np
+
+from career_engine import (
+    INTERSECTION_PAIRS,
+    IKIGAI_WEIGHT,
+    NEUTRAL_SCORE,
+    PSYCHOMETRIC_WEIGHT,
+    break_ties,
+    select_top_k,
+)
+from scoring import INTERSECTION_DESCRIPTIONS
+
+# Sums of squared deviations at or below this count as zero variance
+ZERO_VARIANCE = 1e-9
+
+
+class IncrementalIkigaiScorer:
+    """Running quadrant statistics and career scores for one user's slider session"""
+
+    def __init__(self, engine, user_traits, sliders):
+        self.engine = engine
+        self.user_traits = user_traits
+
+        # (4, n_items) slider values, quadrants ordered love, good at, world needs, paid for
+        self.sliders = np.array(sliders, dtype=float)
+        self.n_items = self.sliders.shape[1]
+        self.sums = self.sliders.sum(axis=1)
+        self.cross = self.sliders @ self.sliders.T
+
+        self.pair_scores = np.full((len(self.sliders), len(self.sliders)), NEUTRAL_SCORE)
+        for first in range(len(self.sliders)):
+            for second in range(first + 1, len(self.sliders)):
+                self._refresh_pair(first, second)
+
+        # Fixed for the session: personality part and per-career label weights
+        self.psychometric_part = engine.psychometric_scores(user_traits) * PSYCHOMETRIC_WEIGHT
+        counts = engine.intersection_counts
+        self.career_weights = engine.intersection_matrix / np.where(counts > 0, counts, 1)[:, np.newaxis]
+        self.neutral_careers = counts == 0
+        self.label_columns = [
+            (engine.intersection_ids.get(label), first, second) for label, first, second in INTERSECTION_PAIRS
+        ]
+        self.center_column = engine.intersection_ids.get("Ikigai_Center")
+
+        self._rescore()
+
+    def update(self, quadrant, item, value):
+        """Move one slider and re-rank; returns False if the value did not change"""
+        if not self._apply(quadrant, item, value):
+            return False
+        self._rescore()
+        return True
+
+    def set_sliders(self, sliders):
+        """Apply every changed slider in a (4, n_items) array, re-ranking once; returns the number changed"""
+        sliders = np.asarray(sliders, dtype=float)
+        changed = np.argwhere(sliders != self.sliders)
+        for quadrant, item in changed:
+            self._apply(quadrant, item, sliders[quadrant, item])
+        if len(changed):
+            self._rescore()
+        return len(changed)
+
+    def intersection_scores(self):
+        """Intersection scores shaped like calculate_ikigai_intersections"""
+        intersections = {
+            label: {"score": float(self.pair_scores[first, second]), "description": INTERSECTION_DESCRIPTIONS[label]}
+            for label, first, second in INTERSECTION_PAIRS
+        }
+        intersections["Ikigai_Center"] = {
+            "score": self._center_score(),
+            "description": "Perfect balance of all four elements"
+        }
+        return intersections
+
+    def top_careers(self, top_k=5):
+        """(career name, combined score) for the current top_k, ties ordered by keyword alignment"""
+        order = break_ties(
+            self.combined_scores,
+            select_top_k(self.combined_scores, top_k),
+            lambda pool: self.engine.keyword_matcher.alignment(self.sliders, pool)
+        )
+        return [(self.engine.career_names[idx], float(self.combined_scores[idx])) for idx in order]
+
+    def _apply(self, quadrant, item, value):
+        old_value = self.sliders[quadrant, item]
+        if value == old_value:
+            return False
+
+        # Cross-products with every quadrant shift by delta times that quadrant's value for this item
+        delta = value - old_value
+        column = self.sliders[:, item] * delta
+        self.cross[quadrant, :] += column
+        self.cross[:, quadrant] += column
+        self.cross[quadrant, quadrant] += delta * delta
+        self.sums[quadrant] += delta
+        self.sliders[quadrant, item] = value
+
+        for other in range(len(self.sliders)):
+            if other != quadrant:
+                self._refresh_pair(quadrant, other)
+        return True
+
+    def _refresh_pair(self, first, second):
+        """Pearson correlation of two quadrants from the running sums, mapped to 0-1"""
+        spread_first = self.cross[first, first] - self.sums[first] ** 2 / self.n_items
+        spread_second = self.cross[second, second] - self.sums[second] ** 2 / self.n_items
+
+        score = NEUTRAL_SCORE
+        if spread_first > ZERO_VARIANCE and spread_second > ZERO_VARIANCE:
+            co_spread = self.cross[first, second] - self.sums[first] * self.sums[second] / self.n_items
+            correlation = co_spread / (spread_first * spread_second) ** 0.5
+            score = min(1.0, max(0.0, (correlation + 1) / 2))
+        self.pair_scores[first, second] = self.pair_scores[second, first] = score
+
+    def _center_score(self):
+        return float(sum(self.pair_scores[first, second] for _, first, second in INTERSECTION_PAIRS) / len(INTERSECTION_PAIRS))
+
+    def _rescore(self):
+        user_intersections = np.zeros(len(self.engine.intersection_names))
+        for column, first, second in self.label_columns:
+            if column is not None:
+                user_intersections[column] = self.pair_scores[first, second]
+        if self.center_column is not None:
+            user_intersections[self.center_column] = self._center_score()
+
+        ikigai_scores = np.where(self.neutral_careers, NEUTRAL_SCORE, self.career_weights @ user_intersections)
+        self.combined_scores = self.psychometric_part + ikigai_scores * IKIGAI_WEIGHT
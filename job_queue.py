@@ -0,0 +1,240 @@
+"""
+PATH-FINDER: Background Job Queue
+Runs slow analysis and export steps off the Streamlit script thread:
+- Jobs run on a bounded thread pool, or on a ProcessPoolExecutor passed as
+  executor for picklable CPU-heavy work (process jobs report "running" from
+  submission, since their start is not observable)
+- Jobs are submitted under a key; submitting a key that is already queued,
+  running or recently finished returns the same Job instead of a duplicate
+- At most max_pending jobs are queued or running at once; further submits
+  raise QueueFull, or wait for a free slot with block=True
+- Job status can be polled (status(), Job.snapshot()) or awaited from asyncio
+  code (Job.wait_async(), JobQueue.run_async())
+
+Finished jobs are kept for result_ttl seconds so pollers can collect them.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+
+DEFAULT_WORKERS = 4
+# Queued + running jobs before submit() applies backpressure
+MAX_PENDING_JOBS = 64
+# Finished jobs kept for polling, by count and by age
+MAX_FINISHED_JOBS = 1024
+RESULT_TTL_SECONDS = 300
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """Raised when the queue already holds max_pending unfinished jobs"""
+
+
+class Job:
+    """Handle to one submitted job: status, timings and its eventual result"""
+
+    def __init__(self, key):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def status(self):
+        if self.future.done():
+            return FAILED if self.error is not None else DONE
+        return QUEUED if self.started_at is None else RUNNING
+
+    @property
+    def error(self):
+        """The exception the job raised, or None"""
+        if not self.future.done():
+            return None
+        if self.future.cancelled():
+            return CancelledError("Job was cancelled")
+        return self.future.exception()
+
+    def done(self):
+        return self.future.done()
+
+    def wait(self, timeout=None):
+        """Block until the job finishes or timeout seconds pass; returns done()"""
+        wait_for_futures([self.future], timeout=timeout)
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """The job's return value, waiting up to timeout seconds; re-raises the job's exception"""
+        return self.future.result(timeout=timeout)
+
+    async def wait_async(self, timeout=None):
+        """Await the job's result from asyncio code without blocking the event loop"""
+        # shield: a cancelled or timed-out waiter must not cancel the shared job
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.future)), timeout)
+
+    def snapshot(self):
+        """JSON-friendly status of the job"""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "error": None if self.error is None else repr(self.error),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """Deduplicating, bounded background job runner"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_pending=MAX_PENDING_JOBS, executor=None,
+                 max_finished=MAX_FINISHED_JOBS, result_ttl=RESULT_TTL_SECONDS):
+        self.executor = executor or ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pathfinder-job")
+        # Only in-process workers can record when a job starts and ends
+        self._in_process = isinstance(self.executor, ThreadPoolExecutor)
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.result_ttl = result_ttl
+
+        self._active = {}              # key -> queued or running Job
+        self._finished = OrderedDict()  # key -> finished Job, oldest first
+        self._by_id = {}               # job id -> Job, for every tracked job
+        self._cond = threading.Condition()
+        self._closed = False
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, key, func, *args, block=False, timeout=None):
+        """Run func(*args) in the background under key and return its Job
+
+        An unfinished or successfully finished job with the same key is returned
+        instead of starting another. When max_pending jobs are unfinished, raise
+        QueueFull, or with block=True wait up to timeout seconds for a free slot.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("JobQueue is closed")
+                self._expire_finished()
+                existing = self._active.get(key) or self._finished.get(key)
+                if existing is not None and existing.status != FAILED:
+                    self.deduplicated += 1
+                    return existing
+                if len(self._active) < self.max_pending:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    self.rejected += 1
+                    raise QueueFull(f"{len(self._active)} jobs are already queued or running")
+                self._cond.wait(remaining)
+
+            # The future is set before the job is visible to other submitters
+            job = Job(key)
+            if self._in_process:
+                job.future = self.executor.submit(self._run, job, func, args)
+            else:
+                job.started_at = job.submitted_at
+                job.future = self.executor.submit(func, *args)
+            # A failed job being retried is replaced, not kept alongside its successor
+            failed = self._finished.pop(key, None)
+            if failed is not None:
+                self._by_id.pop(failed.id, None)
+            self._active[key] = job
+            self._by_id[job.id] = job
+            self.submitted += 1
+
+        job.future.add_done_callback(lambda future: self._finish(job))
+        return job
+
+    async def run_async(self, key, func, *args):
+        """submit() and await the result from asyncio code (raises QueueFull when saturated)"""
+        return await self.submit(key, func, *args).wait_async()
+
+    def get(self, job_id):
+        """The tracked Job with this id, or None once it has expired"""
+        with self._cond:
+            self._expire_finished()
+            return self._by_id.get(job_id)
+
+    def status(self, job_id):
+        """Job.snapshot() of a tracked job, or None when unknown or expired"""
+        job = self.get(job_id)
+        return job.snapshot() if job is not None else None
+
+    def stats(self):
+        with self._cond:
+            running = sum(job.status == RUNNING for job in self._active.values())
+            return {
+                "queued": len(self._active) - running,
+                "running": running,
+                "finished_kept": len(self._finished),
+                "submitted": self.submitted,
+                "deduplicated": self.deduplicated,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def close(self, wait=True):
+        """Stop accepting jobs and shut the executor down"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self, job, func, args):
+        job.started_at = time.time()
+        try:
+            return func(*args)
+        finally:
+            job.finished_at = time.time()
+
+    def _finish(self, job):
+        with self._cond:
+            if job.finished_at is None:
+                job.finished_at = time.time()
+            if job.error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+            if self._active.get(job.key) is not job:
+                # Failed and already resubmitted before this callback ran
+                self._by_id.pop(job.id, None)
+                return
+            del self._active[job.key]
+            self._finished[job.key] = job
+            self._finished.move_to_end(job.key)
+            while len(self._finished) > self.max_finished:
+                _, oldest = self._finished.popitem(last=False)
+                self._by_id.pop(oldest.id, None)
+            self._cond.notify_all()
+
+    def _expire_finished(self):
+        cutoff = time.time() - self.result_ttl
+        while self._finished:
+            key, oldest = next(iter(self._finished.items()))
+            if oldest.finished_at > cutoff:
+                break
+            del self._finished[key]
+            self._by_id.pop(oldest.id, None)
@@ -0,0 +1,185 @@
+"""
+PATH-FINDER: Keyword-Level Ikigai Matching
+Matches the 40 Ikigai slider items against each career's own quadrant lists
+(what_you_love, what_youre_good_at, what_world_needs, what_you_can_be_paid_for)
+instead of only its coarse ikigai_intersections labels:
+- Each slider item is linked to the normalized keywords of its quadrant's
+  field: weight 1 for the same keyword, otherwise the share of words they
+  have in common (data_analysis ~ data_driven_decisions = 0.25)
+- Those links are folded into a sparse career x item weight matrix once per
+  catalog. Each career's row is normalized so its alignment is the weighted
+  mean of the user's matching sliders (0-1), averaged over the quadrants it
+  has matches in
+- Scoring a user is one sparse mat-vec; careers without any match get the
+  neutral 0.5
+
+CareerScoringEngine.rank/recommend/recommend_batch and batch scoring use
+alignment to order careers whose 40/60 combined scores tie whenever the user's
+sliders are given, and recommendations carry a per-quadrant keyword_alignment.
+"""
+
+from functools import cached_property
+
+import numpy as np
+import scipy.sparse as sp
+
+from career_engine import NEUTRAL_SCORE
+from scoring import IKIGAI_QUADRANTS, normalize_keyword
+
+# Career list field compared with each quadrant's slider items (by quadrant key)
+QUADRANT_FIELDS = {
+    "love": "what_you_love",
+    "good_at": "what_youre_good_at",
+    "world_needs": "what_world_needs",
+    "paid_for": "what_you_can_be_paid_for",
+}
+
+QUADRANT_KEYS = [quadrant["key"] for quadrant in IKIGAI_QUADRANTS.values()]
+
+# Keyword links weaker than this are dropped
+MIN_KEYWORD_WEIGHT = 0.2
+MAX_SLIDER_VALUE = 10
+# Catalogs up to this size score a few careers with a full mat-vec and a dense copy of
+# the weights; larger ones gather just those rows from the CSR arrays
+SMALL_CATALOG_LIMIT = 4096
+
+
+def keyword_weight(item, term):
+    """Similarity of two normalized keywords: 1 if equal, else shared words / all words"""
+    if item == term:
+        return 1.0
+    item_words = set(item.split("_"))
+    term_words = set(term.split("_"))
+    return len(item_words & term_words) / len(item_words | term_words)
+
+
+def item_term_weights(items, terms):
+    """(n_items, n_terms) sparse keyword weights between slider items and a field's vocabulary"""
+    rows, cols, weights = [], [], []
+    # Only terms sharing a word with an item can link to it
+    term_ids_by_word = {}
+    for term_idx, term in enumerate(terms):
+        for word in set(term.split("_")):
+            term_ids_by_word.setdefault(word, []).append(term_idx)
+
+    for item_idx, item in enumerate(items):
+        candidates = {term_idx for word in item.split("_") for term_idx in term_ids_by_word.get(word, [])}
+        for term_idx in sorted(candidates):
+            weight = keyword_weight(item, terms[term_idx])
+            if weight >= MIN_KEYWORD_WEIGHT:
+                rows.append(item_idx)
+                cols.append(term_idx)
+                weights.append(weight)
+    return sp.csr_matrix((weights, (rows, cols)), shape=(len(items), len(terms)))
+
+
+def row_entries(matrix, rows):
+    """(row position, column, weight) of the stored entries of a few CSR rows, row by row
+
+    Gathers straight from the CSR arrays: for a handful of rows this is far
+    cheaper than slicing the scipy matrix.
+    """
+    starts = matrix.indptr[rows]
+    lengths = matrix.indptr[rows + 1] - starts
+    positions = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.repeat(np.arange(len(rows)), lengths), matrix.indices[positions], matrix.data[positions]
+
+
+class KeywordMatcher:
+    """Sparse career x slider-item weights for one CareerScoringEngine's catalog
+
+    Built lazily by the engine (CareerScoringEngine.keyword_matcher) or directly.
+    """
+
+    def __init__(self, engine):
+        n_careers = len(engine)
+
+        blocks = []
+        for quadrant in IKIGAI_QUADRANTS.values():
+            items = [normalize_keyword(item) for item in quadrant["items"]]
+            vocabulary = engine.keyword_vocabularies.get(QUADRANT_FIELDS.get(quadrant["key"]))
+            if vocabulary is None or not vocabulary.names:
+                blocks.append(sp.csr_matrix((n_careers, len(items))))
+                continue
+
+            # Career -> keyword incidence straight from the engine's CSR vocabulary
+            incidence = sp.csr_matrix(
+                (np.ones(len(vocabulary.indices)), np.asarray(vocabulary.indices), np.asarray(vocabulary.indptr)),
+                shape=(n_careers, len(vocabulary.names))
+            )
+            block = (incidence @ item_term_weights(items, vocabulary.names).T).tocsr()
+
+            # Weighted mean within the quadrant on the 0-1 slider scale
+            totals = np.asarray(block.sum(axis=1)).ravel()
+            scale = np.divide(1.0, totals * MAX_SLIDER_VALUE, out=np.zeros(n_careers), where=totals > 0)
+            blocks.append(sp.diags(scale) @ block)
+
+        quadrant_matched = np.stack([np.asarray(block.sum(axis=1)).ravel() > 0 for block in blocks], axis=1)
+        self._assign(sp.hstack(blocks).tocsr(), quadrant_matched)
+
+    @classmethod
+    def from_arrays(cls, quadrant_weights, quadrant_matched):
+        """Wrap prebuilt weights (e.g. in shared memory) without recomputing them"""
+        matcher = cls.__new__(cls)
+        matcher._assign(quadrant_weights, quadrant_matched)
+        return matcher
+
+    def _assign(self, quadrant_weights, quadrant_matched):
+        # quadrant_weights: (careers, 4 * n_items), each matched quadrant's slice sums to 1 / MAX_SLIDER_VALUE
+        self.quadrant_weights = quadrant_weights
+        self.quadrant_matched = quadrant_matched
+        self.n_items = quadrant_weights.shape[1] // len(QUADRANT_KEYS)
+
+        # Overall alignment averages the quadrants each career matched
+        matched_quadrants = quadrant_matched.sum(axis=1)
+        self.matched = matched_quadrants > 0
+        scale = np.divide(1.0, matched_quadrants, out=np.zeros(len(matched_quadrants)), where=self.matched)
+        self.weights = (sp.diags(scale) @ quadrant_weights).tocsr()
+
+    @cached_property
+    def dense_quadrant_weights(self):
+        return self.quadrant_weights.toarray()
+
+    def alignment(self, sliders, rows=None):
+        """Keyword alignment (0-1) of every career (or just rows) with one user's (4, n_items) slider values"""
+        sliders = np.asarray(sliders, dtype=float).ravel()
+        if rows is None:
+            return np.where(self.matched, self.weights @ sliders, NEUTRAL_SCORE)
+        rows = np.asarray(rows, dtype=np.intp)
+        if len(self.matched) <= SMALL_CATALOG_LIMIT:
+            return self.alignment(sliders)[rows]
+        positions, columns, weights = row_entries(self.weights, rows)
+        # bincount sums each row in storage order, exactly like the sparse mat-vec
+        scores = np.bincount(positions, weights=weights * sliders[columns], minlength=len(rows))
+        return np.where(self.matched[rows], scores, NEUTRAL_SCORE)
+
+    def alignment_batch(self, sliders):
+        """(n_users, n_careers) alignment for (n_users, 4, n_items) slider values"""
+        sliders = np.asarray(sliders, dtype=float)
+        scores = np.asarray((self.weights @ sliders.reshape(len(sliders), self.weights.shape[1]).T).T)
+        return np.where(self.matched[np.newaxis, :], scores, NEUTRAL_SCORE)
+
+    def quadrant_alignment(self, sliders, careers):
+        """(len(careers), 4) per-quadrant alignment, quadrants in QUADRANT_KEYS order
+
+        sliders is one user's (4, n_items) values, or one (4, n_items) block per
+        career for (user, career) pairs. Unmatched quadrants get the neutral 0.5.
+        """
+        careers = np.asarray(careers, dtype=np.intp)
+        sliders = np.asarray(sliders, dtype=float).reshape(-1, self.quadrant_weights.shape[1])
+        if len(self.matched) <= SMALL_CATALOG_LIMIT:
+            weighted = self.dense_quadrant_weights[careers] * sliders
+            scores = weighted.reshape(len(careers), len(QUADRANT_KEYS), self.n_items).sum(axis=2)
+        else:
+            positions, columns, weights = row_entries(self.quadrant_weights, careers)
+            values = sliders[0, columns] if len(sliders) == 1 else sliders[positions, columns]
+            scores = np.bincount(
+                (positions * len(QUADRANT_KEYS)) + (columns // self.n_items),
+                weights=weights * values,
+                minlength=len(careers) * len(QUADRANT_KEYS)
+            ).reshape(len(careers), len(QUADRANT_KEYS))
+        return np.where(self.quadrant_matched[careers], scores, NEUTRAL_SCORE)
+
+    def quadrant_alignment_dicts(self, sliders, careers):
+        """quadrant_alignment() as one {quadrant key: score} dict per career"""
+        return [dict(zip(QUADRANT_KEYS, scores)) for scores in self.quadrant_alignment(sliders, careers).tolist()]
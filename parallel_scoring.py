@@ -0,0 +1,165 @@
+"""
+PATH-FINDER: Parallel Cohort Scoring
+Scores large cohorts across worker processes for offline re-scores after a
+catalog update:
+- The career matrices (traits, trait mask, intersections, label counts) and
+  the keyword matcher's sparse weights are copied into
+  multiprocessing.shared_memory once; workers attach to them by name instead
+  of receiving a pickled engine
+- Users are sharded across a ProcessPoolExecutor; each worker runs the same
+  batch_scoring.score_cohort formulas as the single-process path
+- Within a shard, users are scored in passes of at most MAX_SCORE_CELLS
+  user x career pairs so memory stays bounded for very large catalogs
+
+Usage:
+    python batch_scoring.py users.parquet -o recommendations.parquet --workers 8
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse as sp
+
+from batch_scoring import score_cohort
+from career_engine import CareerScoringEngine
+from keyword_matching import KeywordMatcher
+from scoring import get_career_engine
+
+# Engine arrays placed in shared memory
+SHARED_ARRAYS = ["trait_matrix", "trait_mask", "intersection_matrix", "intersection_counts"]
+# Keyword matcher arrays placed in shared memory (CSR parts of its quadrant weights)
+KEYWORD_ARRAYS = ["keyword_data", "keyword_indices", "keyword_indptr", "keyword_matched"]
+
+# Users per task handed to a worker
+DEFAULT_SHARD_SIZE = 2_000
+# Upper bound on users x careers scored in one pass inside a worker
+MAX_SCORE_CELLS = 2_000_000
+
+RESULT_FIELDS = ["top_careers", "psychometric_score", "ikigai_score", "combined_score", "keyword_alignment", "ikigai_center"]
+
+# Set in each worker process by _attach_catalog
+_worker_engine = None
+_worker_blocks = []
+
+
+class SharedCatalog:
+    """Career matrices of an engine copied into named shared memory blocks"""
+
+    def __init__(self, engine):
+        self.blocks = []
+        arrays = {}
+        matcher = engine.keyword_matcher
+        sources = {name: getattr(engine, name) for name in SHARED_ARRAYS}
+        sources.update(zip(KEYWORD_ARRAYS, [
+            matcher.quadrant_weights.data, matcher.quadrant_weights.indices,
+            matcher.quadrant_weights.indptr, matcher.quadrant_matched
+        ]))
+        for name, source in sources.items():
+            source = np.ascontiguousarray(source)
+            # Zero-size blocks are not allowed, so empty matrices still get one byte
+            block = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+            np.ndarray(source.shape, dtype=source.dtype, buffer=block.buf)[...] = source
+            self.blocks.append(block)
+            arrays[name] = (block.name, source.shape, source.dtype.str)
+
+        self.descriptor = {
+            "arrays": arrays,
+            "n_careers": len(engine),
+            "trait_names": engine.trait_names,
+            "intersection_names": engine.intersection_names,
+            "keyword_shape": matcher.quadrant_weights.shape,
+        }
+
+    def close(self):
+        """Release and remove the shared blocks (workers must be finished)"""
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _attach_catalog(descriptor):
+    """Worker initializer: build a scoring engine over the shared career matrices"""
+    global _worker_engine
+    arrays = {}
+    for name, (block_name, shape, dtype) in descriptor["arrays"].items():
+        block = shared_memory.SharedMemory(name=block_name)
+        # Keep the mapping open for the worker's lifetime
+        _worker_blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+    keyword_data, keyword_indices, keyword_indptr, keyword_matched = (arrays.pop(name) for name in KEYWORD_ARRAYS)
+    _worker_engine = CareerScoringEngine.from_arrays(
+        None, range(descriptor["n_careers"]), descriptor["trait_names"], descriptor["intersection_names"], {},
+        **arrays
+    )
+    # The worker engine has no keyword lists, so it gets the parent's matcher instead
+    _worker_engine.keyword_matcher = KeywordMatcher.from_arrays(
+        sp.csr_matrix((keyword_data, keyword_indices, keyword_indptr), shape=descriptor["keyword_shape"]),
+        keyword_matched
+    )
+
+
+def score_in_passes(answers, sliders, engine, top_k):
+    """score_cohort over consecutive user slices of at most MAX_SCORE_CELLS user x career pairs"""
+    users_per_pass = max(1, MAX_SCORE_CELLS // max(len(engine), 1))
+    if len(answers) <= users_per_pass:
+        return score_cohort(answers, sliders, engine=engine, top_k=top_k)
+
+    passes = [
+        score_cohort(answers[start:start + users_per_pass], sliders[start:start + users_per_pass],
+                     engine=engine, top_k=top_k)
+        for start in range(0, len(answers), users_per_pass)
+    ]
+    return {field: np.concatenate([results[field] for results in passes]) for field in RESULT_FIELDS}
+
+
+def _score_shard(task):
+    answers, sliders, top_k = task
+    return score_in_passes(answers, sliders, _worker_engine, top_k)
+
+
+class ParallelCohortScorer:
+    """Process pool whose workers score user shards against one shared catalog"""
+
+    def __init__(self, engine=None, workers=None, shard_size=DEFAULT_SHARD_SIZE):
+        self.engine = engine if engine is not None else get_career_engine()
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.catalog = SharedCatalog(self.engine)
+        try:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_attach_catalog, initargs=(self.catalog.descriptor,)
+            )
+        except Exception:
+            self.catalog.close()
+            raise
+
+    def score(self, answers, sliders, top_k=5):
+        """Same result dict as batch_scoring.score_cohort, scored across the worker pool"""
+        tasks = [
+            (answers[start:start + self.shard_size], sliders[start:start + self.shard_size], top_k)
+            for start in range(0, len(answers), self.shard_size)
+        ]
+        shards = list(self.pool.map(_score_shard, tasks))
+        if not shards:
+            return score_cohort(answers, sliders, engine=self.engine, top_k=top_k)
+        return {field: np.concatenate([results[field] for results in shards]) for field in RESULT_FIELDS}
+
+    def close(self):
+        self.pool.shutdown()
+        self.catalog.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,231 @@
+"""
+PATH-FINDER: PDF Report Renderer
+Renders the complete career analysis report as a PDF with reportlab's
+SimpleDocTemplate:
+- Paragraph styles and table templates are built once per process and reused
+  for every report
+- Reports are written into an in-memory BytesIO, ready for st.download_button
+- A batch mode renders a whole cohort file in parallel worker processes
+
+Usage:
+    python pdf_report.py sampleusers.csv -o reports/ [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import KeepTogether, ListFlowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from report_export import iter_cohort_results, report_path
+from scoring import BIG_FIVE_TRAITS
+
+ACCENT_COLOR = colors.HexColor("#6366f1")
+MUTED_COLOR = colors.HexColor("#64748b")
+ROW_BACKGROUND = colors.HexColor("#f1f5f9")
+
+NEXT_STEPS = [
+    "Focus on your top career match and research the industry",
+    "Develop skills highlighted in your recommendations",
+    "Network with professionals in your target field",
+    "Update your resume to highlight relevant experience",
+    "Set up job alerts and start applying to relevant positions"
+]
+
+# Reports queued per worker process in batch mode; bounds memory for any cohort size
+WORKER_CHUNK_SIZE = 32
+
+ReportStyles = namedtuple("ReportStyles", ["title", "subtitle", "heading", "body", "small", "score_table", "career_table"])
+
+
+@lru_cache(maxsize=None)
+def report_styles():
+    """Paragraph styles and table templates, built once per process"""
+    sample = getSampleStyleSheet()
+    title = ParagraphStyle(
+        "ReportTitle", parent=sample["Title"], fontName="Helvetica-Bold", fontSize=20, textColor=ACCENT_COLOR
+    )
+    subtitle = ParagraphStyle(
+        "ReportSubtitle", parent=sample["Normal"], fontSize=9, textColor=MUTED_COLOR, alignment=TA_CENTER
+    )
+    heading = ParagraphStyle(
+        "ReportHeading", parent=sample["Heading2"], fontName="Helvetica-Bold", fontSize=13,
+        textColor=ACCENT_COLOR, spaceBefore=10, spaceAfter=6
+    )
+    body = ParagraphStyle("ReportBody", parent=sample["Normal"], fontSize=10, leading=14)
+    small = ParagraphStyle("ReportSmall", parent=body, fontSize=9, leading=12, textColor=MUTED_COLOR)
+
+    score_table = TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("BACKGROUND", (0, 0), (-1, 0), ACCENT_COLOR),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_BACKGROUND]),
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ])
+    career_table = TableStyle([
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("TEXTCOLOR", (0, 0), (0, -1), MUTED_COLOR),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LINEBELOW", (0, -1), (-1, -1), 0.5, ROW_BACKGROUND),
+    ])
+    return ReportStyles(title, subtitle, heading, body, small, score_table, career_table)
+
+
+def build_report_story(psychometric, results):
+    """Flowables for one report, mirroring the sections of generate_text_report"""
+    styles = report_styles()
+    story = [
+        Paragraph("PATH-FINDER: Complete Career Analysis", styles.title),
+        Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y')}", styles.subtitle),
+        Spacer(1, 6 * mm),
+        Paragraph("Executive Summary", styles.heading),
+        Paragraph(
+            "This comprehensive analysis combines personality assessment with Ikigai discovery to provide "
+            "personalized career recommendations based on your psychological profile and life purpose alignment.",
+            styles.body
+        ),
+        Paragraph("Personality Profile", styles.heading),
+        Paragraph(escape(psychometric["analysis"]["summary"]) or "Balanced profile across all traits.", styles.body),
+        Spacer(1, 3 * mm)
+    ]
+
+    trait_rows = [["Big Five Trait", "Score", "Description"]]
+    for trait, score in psychometric["trait_scores"].items():
+        trait_info = BIG_FIVE_TRAITS.get(trait, {"name": trait.title()})
+        details = psychometric["analysis"]["trait_details"].get(trait, {})
+        trait_rows.append([
+            trait_info["name"], f"{int((score / 5) * 100)}%", Paragraph(escape(details.get("description", "")), styles.small)
+        ])
+    story.append(Table(trait_rows, colWidths=[45 * mm, 20 * mm, 105 * mm], style=styles.score_table))
+
+    intersections = results["ikigai_intersections"]
+    story.append(Paragraph("Ikigai Analysis", styles.heading))
+    story.append(Paragraph(f"Overall Ikigai Score: <b>{int(intersections['Ikigai_Center']['score'] * 100)}%</b>", styles.body))
+    story.append(Spacer(1, 3 * mm))
+    intersection_rows = [["Intersection", "Score", "Meaning"]]
+    for intersection, data in intersections.items():
+        if intersection != "Ikigai_Center":
+            intersection_rows.append([intersection, f"{int(data['score'] * 100)}%", escape(data["description"])])
+    story.append(Table(intersection_rows, colWidths=[45 * mm, 20 * mm, 105 * mm], style=styles.score_table))
+
+    story.append(Paragraph("Top Career Recommendations", styles.heading))
+    for rank, rec in enumerate(results["career_recommendations"][:3], 1):
+        career = rec["data"]
+        rows = [
+            ["Description", Paragraph(escape(career["description"]), styles.small)],
+            ["Salary Range", career["salary_range"]],
+            ["Growth Rate", career["growth_rate"]],
+            ["Key Skills", Paragraph(escape(", ".join(career["skills"][:5])), styles.small)],
+            ["Match Breakdown", f"Personality {int(rec['psychometric_score'] * 100)}%  |  "
+                                f"Ikigai {int(rec['ikigai_score'] * 100)}%"],
+        ]
+        story.append(KeepTogether([
+            Paragraph(f"{rank}. {escape(rec['career'])} ({rec['match_percentage']}% Match)", styles.body),
+            Spacer(1, 1 * mm),
+            Table(rows, colWidths=[35 * mm, 135 * mm], style=styles.career_table),
+            Spacer(1, 4 * mm)
+        ]))
+
+    story.append(Paragraph("Next Steps", styles.heading))
+    story.append(ListFlowable(
+        [Paragraph(step, styles.body) for step in NEXT_STEPS], bulletType="1", bulletFontSize=10
+    ))
+    story.append(Spacer(1, 4 * mm))
+    story.append(Paragraph(
+        "Remember: career discovery is a journey. Use this analysis as a starting point for deeper "
+        "self-reflection and professional growth.", styles.small
+    ))
+    return story
+
+
+def render_pdf_report(psychometric, results, output=None):
+    """Render the report into output (a new BytesIO by default) and return it rewound"""
+    output = output if output is not None else BytesIO()
+    document = SimpleDocTemplate(
+        output, pagesize=A4, title="PATH-FINDER Career Analysis", author="PATH-FINDER",
+        leftMargin=20 * mm, rightMargin=20 * mm, topMargin=18 * mm, bottomMargin=18 * mm
+    )
+    document.build(build_report_story(psychometric, results))
+    output.seek(0)
+    return output
+
+
+def _render_user_report(job):
+    """Worker task: render one user's report to disk, returning its size in bytes"""
+    path, psychometric, results = job
+    with open(path, "wb") as report_file:
+        render_pdf_report(psychometric, results, report_file)
+    return os.path.getsize(path)
+
+
+def _report_jobs(input_path, output_dir):
+    """Yield (path, psychometric_results, final_results) for every user in a cohort file"""
+    for user_id, psychometric, results in iter_cohort_results(input_path):
+        yield report_path(output_dir, user_id, ".pdf"), psychometric, results
+
+
+def render_cohort_reports(input_path, output_dir, workers=None):
+    """Render one PDF per user in a cohort file using a pool of worker processes; returns stats"""
+    os.makedirs(output_dir, exist_ok=True)
+    n_reports = 0
+    total_bytes = 0
+    start = time.perf_counter()
+
+    max_in_flight = (workers or os.cpu_count() or 1) * WORKER_CHUNK_SIZE
+    pending = set()
+
+    # Each worker builds the styles once, before its first report
+    with ProcessPoolExecutor(max_workers=workers, initializer=report_styles) as pool:
+        # Submit through a bounded window so only max_in_flight reports are held at once
+        for job in _report_jobs(input_path, output_dir):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                n_reports += len(done)
+                total_bytes += sum(future.result() for future in done)
+            pending.add(pool.submit(_render_user_report, job))
+        for future in pending:
+            n_reports += 1
+            total_bytes += future.result()
+
+    total_time = time.perf_counter() - start
+    return {
+        "reports": n_reports,
+        "bytes": total_bytes,
+        "total_seconds": total_time,
+        "reports_per_second": n_reports / total_time if total_time else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PDF career reports for every user in a cohort file")
+    parser.add_argument("input", help="CSV or Parquet file in the batch scoring input format")
+    parser.add_argument("-o", "--output-dir", required=True, help="Directory for career_report_<user_id>.pdf files")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    stats = render_cohort_reports(args.input, args.output_dir, workers=args.workers)
+    print(
+        f"Rendered {stats['reports']:,} reports ({stats['bytes'] / 1024 / 1024:.1f} MB) in "
+        f"{stats['total_seconds']:.2f}s ({stats['reports_per_second']:,.0f} reports/s)",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
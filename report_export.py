@@ -0,0 +1,182 @@
+"""
+PATH-FINDER: Cohort Report Export
+Writes the complete text report for every user in a cohort file, with memory
+bounded by the chunk size rather than the cohort size:
+- Users are read and scored EXPORT_CHUNK_SIZE at a time (one catalog pass per
+  chunk, as in batch scoring)
+- Each report is streamed section by section (scoring.write_text_report)
+  straight into its output, never built as one string
+- Output is one career_report_<user_id>.txt per user in a directory, or one
+  compressed archive: a .tar.gz is written in constant memory (a report is
+  buffered only to write its tar header), while a .zip keeps a ~0.5 KB
+  directory record per report in memory until it is closed, so prefer
+  .tar.gz for millions of users
+
+Usage:
+    python report_export.py sampleusers.csv -o reports/
+    python report_export.py users.parquet -o reports.tar.gz
+"""
+
+import argparse
+import gzip
+import io
+import os
+import re
+import sys
+import tarfile
+import time
+import zipfile
+
+from scoring import (
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    iter_text_report,
+    personality_profile,
+    score_assessments,
+    write_text_report,
+)
+
+# Users read and scored per pass over the catalog
+EXPORT_CHUNK_SIZE = 10_000
+# Write buffer of each per-user report file
+REPORT_BUFFER_SIZE = 64 * 1024
+
+
+def assessments_from_arrays(answers, sliders):
+    """Session-state shaped (psychometric_answers, ikigai_data) pairs from batch scoring arrays"""
+    assessments = []
+    for user_answers, user_sliders in zip(answers, sliders):
+        psychometric_answers = {
+            question["id"]: question["options"][option]
+            for question, option in zip(PSYCHOMETRIC_QUESTIONS, user_answers)
+        }
+        ikigai_data = {
+            quadrant: {item: int(value) for item, value in zip(data["items"], quadrant_sliders)}
+            for (quadrant, data), quadrant_sliders in zip(IKIGAI_QUADRANTS.items(), user_sliders)
+        }
+        assessments.append((psychometric_answers, ikigai_data))
+    return assessments
+
+
+def iter_cohort_results(input_path, chunksize=EXPORT_CHUNK_SIZE):
+    """Yield (user_id, psychometric_results, final_results) for every user in a cohort file"""
+    from batch_scoring import frame_to_arrays, read_user_chunks
+
+    for frame in read_user_chunks(input_path, chunksize=chunksize):
+        user_ids, answers, sliders = frame_to_arrays(frame)
+        assessments = assessments_from_arrays(answers, sliders)
+        for user_id, user_answers, results in zip(user_ids, answers, score_assessments(assessments)):
+            trait_scores, analysis = personality_profile(user_answers)
+            yield user_id, {"trait_scores": trait_scores, "analysis": analysis}, results
+
+
+def report_name(user_id, extension=".txt"):
+    """career_report_<user_id> file name, with characters outside [A-Za-z0-9_.-] replaced by _"""
+    safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", str(user_id))
+    return f"career_report_{safe_id}{extension}"
+
+
+def report_path(output_dir, user_id, extension=".txt"):
+    """Path of a user's report inside output_dir; raises ValueError if it would resolve outside it"""
+    root = os.path.realpath(output_dir)
+    path = os.path.realpath(os.path.join(root, report_name(user_id, extension)))
+    if os.path.dirname(path) != root:
+        raise ValueError(f"Report for user_id {user_id!r} would be written outside {output_dir}")
+    return path
+
+
+def export_to_directory(reports, output_dir):
+    """Write each (user_id, psychometric, results) report to its own file; returns (reports, bytes)"""
+    os.makedirs(output_dir, exist_ok=True)
+    count = 0
+    total_bytes = 0
+    for user_id, psychometric, results in reports:
+        path = report_path(output_dir, user_id)
+        with open(path, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as report_file:
+            write_text_report(psychometric, results, report_file)
+            total_bytes += report_file.tell()
+        count += 1
+    return count, total_bytes
+
+
+def export_to_zip(reports, output):
+    """Stream each (user_id, psychometric, results) report into a zip archive; returns (reports, bytes)"""
+    count = 0
+    total_bytes = 0
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for user_id, psychometric, results in reports:
+            with archive.open(report_name(user_id), "w") as entry:
+                with io.TextIOWrapper(entry, encoding="utf-8", write_through=True) as report_file:
+                    write_text_report(psychometric, results, report_file)
+            total_bytes += archive.infolist()[-1].file_size
+            count += 1
+    return count, total_bytes
+
+
+def export_to_tar_gz(reports, output):
+    """Stream each (user_id, psychometric, results) report into a .tar.gz in constant memory; returns (reports, bytes)"""
+    # Headers are written directly: TarFile.addfile would keep every member's TarInfo
+    count = 0
+    total_bytes = 0
+    written = 0
+    mtime = time.time()
+    with gzip.open(output, "wb") as archive:
+        for user_id, psychometric, results in reports:
+            data = "".join(iter_text_report(psychometric, results)).encode("utf-8")
+            info = tarfile.TarInfo(report_name(user_id))
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            header = info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+            padding = -len(data) % tarfile.BLOCKSIZE
+            archive.write(header)
+            archive.write(data)
+            archive.write(tarfile.NUL * padding)
+            written += len(header) + len(data) + padding
+            total_bytes += len(data)
+            count += 1
+
+        # End-of-archive marker, padded to a whole record like tarfile does
+        written += 2 * tarfile.BLOCKSIZE
+        archive.write(tarfile.NUL * (2 * tarfile.BLOCKSIZE + -written % tarfile.RECORDSIZE))
+    return count, total_bytes
+
+
+def export_cohort_reports(input_path, output_path, chunksize=EXPORT_CHUNK_SIZE):
+    """Text reports for every user in a cohort file, into a directory, .tar.gz or .zip archive; returns stats"""
+    start = time.perf_counter()
+    reports = iter_cohort_results(input_path, chunksize=chunksize)
+    if output_path.endswith((".tar.gz", ".tgz")):
+        n_reports, total_bytes = export_to_tar_gz(reports, output_path)
+    elif output_path.endswith(".zip"):
+        n_reports, total_bytes = export_to_zip(reports, output_path)
+    else:
+        n_reports, total_bytes = export_to_directory(reports, output_path)
+
+    total_time = time.perf_counter() - start
+    return {
+        "reports": n_reports,
+        "bytes": total_bytes,
+        "total_seconds": total_time,
+        "reports_per_second": n_reports / total_time if total_time else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write text career reports for every user in a cohort file")
+    parser.add_argument("input", help="CSV or Parquet file in the batch scoring input format")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Directory for career_report_<user_id>.txt files, or a .tar.gz / .zip archive path")
+    parser.add_argument("--chunksize", type=int, default=EXPORT_CHUNK_SIZE, help="Users scored per pass")
+    args = parser.parse_args(argv)
+
+    stats = export_cohort_reports(args.input, args.output, chunksize=args.chunksize)
+    print(
+        f"Wrote {stats['reports']:,} reports ({stats['bytes'] / 1024 / 1024:.1f} MB of text) in "
+        f"{stats['total_seconds']:.2f}s ({stats['reports_per_second']:,.0f} reports/s)",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
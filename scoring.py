@@ -0,0 +1,877 @@
+"""
+PATH-FINDER: Scoring Core
+Question bank, career catalog and the pure scoring functions behind the
+3-layer analysis. Nothing here imports Streamlit or other UI libraries, so
+batch jobs, services and tests can import it in milliseconds; NumPy is only
+loaded when careers are first ranked.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+from datetime import datetime
+from types import MappingProxyType
+
+from stage_timing import timed
+
+# Psychometric Questions Database
+PSYCHOMETRIC_QUESTIONS = [
+    {
+        "id": 1,
+        "category": "problem_solving",
+        "question": "When faced with a complex problem at work, what is your typical approach?",
+        "options": [
+            {
+                "text": "I break it down into smaller, manageable parts and tackle each systematically",
+                "traits": {"conscientiousness": 4, "openness": 3, "analytical_thinking": 5}
+            },
+            {
+                "text": "I brainstorm multiple creative solutions before choosing the best one", 
+                "traits": {"openness": 5, "creativity": 4, "extraversion": 3}
+            },
+            {
+                "text": "I research similar problems and adapt proven solutions",
+                "traits": {"conscientiousness": 3, "analytical_thinking": 4, "stability": 3}
+            },
+            {
+                "text": "I collaborate with others to find the best solution together",
+                "traits": {"agreeableness": 5, "extraversion": 4, "teamwork": 5}
+            }
+        ]
+    },
+    {
+        "id": 2,
+        "category": "work_environment",
+        "question": "Your ideal work environment would be:",
+        "options": [
+            {
+                "text": "A quiet, organized space where I can focus deeply on complex tasks",
+                "traits": {"conscientiousness": 5, "introversion": 4, "depth_focus": 5}
+            },
+            {
+                "text": "A dynamic, collaborative space with lots of interaction and energy",
+                "traits": {"extraversion": 5, "agreeableness": 4, "social_energy": 5}
+            },
+            {
+                "text": "A flexible environment where I can choose when and how to work",
+                "traits": {"openness": 4, "autonomy": 5, "adaptability": 4}
+            },
+            {
+                "text": "A structured environment with clear expectations and processes",
+                "traits": {"conscientiousness": 5, "stability": 4, "structure_preference": 5}
+            }
+        ]
+    },
+    {
+        "id": 3,
+        "category": "decision_making",
+        "question": "How do you typically make important decisions?",
+        "options": [
+            {
+                "text": "I gather extensive data and analyze all possible outcomes",
+                "traits": {"conscientiousness": 5, "analytical_thinking": 5, "neuroticism": 2}
+            },
+            {
+                "text": "I trust my intuition and past experiences",
+                "traits": {"openness": 4, "confidence": 4, "intuitive_thinking": 5}
+            },
+            {
+                "text": "I seek advice from trusted colleagues or mentors",
+                "traits": {"agreeableness": 4, "humility": 4, "social_intelligence": 4}
+            },
+            {
+                "text": "I make quick decisions and adjust as I learn more",
+                "traits": {"extraversion": 4, "adaptability": 5, "risk_tolerance": 4}
+            }
+        ]
+    },
+    {
+        "id": 4,
+        "category": "teamwork",
+        "question": "In team projects, you naturally tend to:",
+        "options": [
+            {
+                "text": "Take charge and coordinate the team's efforts toward the goal",
+                "traits": {"extraversion": 5, "leadership": 5, "results_oriented": 4}
+            },
+            {
+                "text": "Contribute specialized expertise and high-quality individual work",
+                "traits": {"conscientiousness": 5, "expertise": 5, "quality_focus": 5}
+            },
+            {
+                "text": "Facilitate communication and ensure everyone's voice is heard",
+                "traits": {"agreeableness": 5, "empathy": 4, "social_intelligence": 5}
+            },
+            {
+                "text": "Generate creative ideas and alternative approaches",
+                "traits": {"openness": 5, "creativity": 5, "innovation": 4}
+            }
+        ]
+    },
+    {
+        "id": 5,
+        "category": "motivation",
+        "question": "What motivates you most in your work?",
+        "options": [
+            {
+                "text": "Solving complex challenges and achieving mastery in my field",
+                "traits": {"openness": 4, "achievement": 5, "expertise": 5}
+            },
+            {
+                "text": "Making a positive impact on others and contributing to society",
+                "traits": {"agreeableness": 5, "social_impact": 5, "purpose_driven": 5}
+            },
+            {
+                "text": "Leading teams and driving organizational success",
+                "traits": {"extraversion": 5, "leadership": 5, "ambition": 4}
+            },
+            {
+                "text": "Creating innovative solutions and exploring new possibilities",
+                "traits": {"openness": 5, "creativity": 5, "innovation": 5}
+            }
+        ]
+    }
+]
+
+# Big Five Traits for analysis
+BIG_FIVE_TRAITS = {
+    "openness": {
+        "name": "Openness to Experience",
+        "description": "Creativity, curiosity, and willingness to try new experiences",
+        "high_description": "Creative, curious, open to new ideas and experiences",
+        "low_description": "Practical, conventional, prefers familiar approaches"
+    },
+    "conscientiousness": {
+        "name": "Conscientiousness", 
+        "description": "Organization, discipline, and goal-directed behavior",
+        "high_description": "Organized, disciplined, reliable, and goal-oriented",
+        "low_description": "Flexible, spontaneous, adaptable to changing situations"
+    },
+    "extraversion": {
+        "name": "Extraversion",
+        "description": "Energy from social interaction and external stimulation",
+        "high_description": "Outgoing, energetic, enjoys social interaction and leadership",
+        "low_description": "Reserved, thoughtful, prefers deep work and smaller groups"
+    },
+    "agreeableness": {
+        "name": "Agreeableness",
+        "description": "Cooperation, empathy, and concern for others",
+        "high_description": "Cooperative, empathetic, values harmony and helping others", 
+        "low_description": "Direct, competitive, focused on results and efficiency"
+    },
+    "neuroticism": {
+        "name": "Emotional Stability",
+        "description": "Emotional resilience and stress management",
+        "high_description": "May experience stress under pressure, sensitive to criticism",
+        "low_description": "Emotionally stable, calm under pressure, resilient"
+    }
+}
+
+# Enhanced career database
+CAREER_DATABASE = {
+    "Data Scientist": {
+        "skills": ["programming", "mathematics", "analytical_thinking", "statistics", "machine_learning"],
+        "growth_rate": "Very High",
+        "salary_range": "$80,000 - $160,000",
+        "description": "Analyze complex datasets to help organizations make data-driven decisions",
+        "ikigai_intersections": ["Profession", "Vocation"],
+        "psychometric_fit": {
+            "openness": 4, "conscientiousness": 5, "extraversion": 2, 
+            "agreeableness": 3, "neuroticism": 2
+        },
+        "what_you_love": ["analyzing_data", "learning_new_things", "creative_problem_solving"],
+        "what_youre_good_at": ["programming", "mathematics", "analytical_thinking"],
+        "what_world_needs": ["data_driven_decisions", "business_insights", "predictive_analytics"],
+        "what_you_can_be_paid_for": ["data_analysis", "machine_learning_models", "business_intelligence"]
+    },
+    "UX/UI Designer": {
+        "skills": ["design", "creativity", "user_research", "prototyping", "communication"],
+        "growth_rate": "High",
+        "salary_range": "$60,000 - $130,000",
+        "description": "Create user-centered digital experiences and interfaces",
+        "ikigai_intersections": ["Passion", "Mission"],
+        "psychometric_fit": {
+            "openness": 5, "conscientiousness": 3, "extraversion": 3,
+            "agreeableness": 4, "neuroticism": 2
+        },
+        "what_you_love": ["artistic_expression", "helping_others", "creative_problem_solving"],
+        "what_youre_good_at": ["design_thinking", "prototyping", "user_research"],
+        "what_world_needs": ["intuitive_interfaces", "accessible_design", "better_user_experiences"],
+        "what_you_can_be_paid_for": ["user_interface_design", "user_experience_consulting", "design_systems"]
+    },
+    "Product Manager": {
+        "skills": ["strategic_planning", "communication", "leadership", "market_analysis", "project_management"],
+        "growth_rate": "High",
+        "salary_range": "$85,000 - $170,000",
+        "description": "Guide product development from conception to market success",
+        "ikigai_intersections": ["Passion", "Vocation"],
+        "psychometric_fit": {
+            "openness": 4, "conscientiousness": 4, "extraversion": 5,
+            "agreeableness": 4, "neuroticism": 2
+        },
+        "what_you_love": ["strategic_thinking", "building_solutions", "leading_teams"],
+        "what_youre_good_at": ["strategic_thinking", "communication", "project_management"],
+        "what_world_needs": ["innovative_products", "user_solutions", "market_driven_development"],
+        "what_you_can_be_paid_for": ["product_strategy", "product_development", "market_analysis"]
+    },
+    "Software Engineer": {
+        "skills": ["programming", "problem_solving", "system_design", "algorithms", "debugging"],
+        "growth_rate": "Very High", 
+        "salary_range": "$70,000 - $150,000",
+        "description": "Design, develop, and maintain software applications and systems",
+        "ikigai_intersections": ["Profession", "Vocation"],
+        "psychometric_fit": {
+            "openness": 4, "conscientiousness": 5, "extraversion": 2,
+            "agreeableness": 3, "neuroticism": 2
+        },
+        "what_you_love": ["building_solutions", "creative_problem_solving", "learning_new_things"],
+        "what_youre_good_at": ["programming", "analytical_thinking", "problem_solving"],
+        "what_world_needs": ["digital_transformation", "automation", "technical_solutions"],
+        "what_you_can_be_paid_for": ["software_development", "technical_consulting", "system_architecture"]
+    },
+    "Digital Marketing Manager": {
+        "skills": ["marketing", "communication", "analytical_thinking", "creativity", "strategic_planning"],
+        "growth_rate": "High",
+        "salary_range": "$50,000 - $110,000",
+        "description": "Develop and execute marketing strategies across digital channels",
+        "ikigai_intersections": ["Passion", "Profession"],
+        "psychometric_fit": {
+            "openness": 4, "conscientiousness": 3, "extraversion": 4,
+            "agreeableness": 4, "neuroticism": 2
+        },
+        "what_you_love": ["creative_storytelling", "connecting_with_audiences", "brand_building"],
+        "what_youre_good_at": ["marketing_strategy", "content_creation", "data_analysis"],
+        "what_world_needs": ["brand_awareness", "customer_engagement", "digital_presence"],
+        "what_you_can_be_paid_for": ["marketing_campaigns", "brand_strategy", "digital_advertising"]
+    }
+}
+
+# Ikigai quadrants (order matters: love, good at, world needs, paid for)
+IKIGAI_QUADRANTS = {
+    "What You Love": {
+        "key": "love",
+        "icon": "💝",
+        "items": [
+            "Creative Problem Solving", "Helping Others", "Learning New Things",
+            "Building Solutions", "Artistic Expression", "Leading Teams",
+            "Analyzing Data", "Strategic Thinking", "Teaching Others", "Innovation"
+        ]
+    },
+    "What You're Good At": {
+        "key": "good_at",
+        "icon": "💪", 
+        "items": [
+            "Communication", "Analytical Thinking", "Programming", "Design Thinking",
+            "Project Management", "Research", "Leadership", "Mathematics",
+            "Writing", "Marketing"
+        ]
+    },
+    "What World Needs": {
+        "key": "world_needs",
+        "icon": "🌍",
+        "items": [
+            "Digital Transformation", "Climate Solutions", "Education Access",
+            "Healthcare Innovation", "Social Equality", "Economic Opportunity",
+            "Mental Health Support", "Data Privacy", "Smart Cities", "Elderly Care"
+        ]
+    },
+    "What You Can Be Paid For": {
+        "key": "paid_for",
+        "icon": "💰",
+        "items": [
+            "Software Development", "Consulting Services", "Content Creation",
+            "Product Design", "Data Analysis", "Marketing", "Financial Services",
+            "Healthcare Services", "Education", "Engineering"
+        ]
+    }
+}
+
+# Slider value assumed for Ikigai items a user did not rate (the app's slider default)
+DEFAULT_SLIDER_VALUE = 5
+SLIDER_RANGE = (0, 10)
+
+# What each Ikigai intersection stands for
+INTERSECTION_DESCRIPTIONS = {
+    "Passion": "What you love and are good at",
+    "Mission": "What you love and the world needs",
+    "Profession": "What you're good at and can be paid for",
+    "Vocation": "What the world needs and you can be paid for"
+}
+
+# Optional external catalog bundle (see catalog_store.py); overrides CAREER_DATABASE
+CATALOG_PATH = os.environ.get("PATHFINDER_CATALOG")
+
+# Process-wide career index, built on first use and shared by every session
+_career_engine = None
+_catalog_version = None
+_question_bank_version = None
+_career_engine_lock = threading.Lock()
+
+# Personality profiles for every answer combination (4^5 = 1024), keyed by question bank version
+_personality_table = None
+# Larger answer spaces are analyzed per request instead of precomputed
+PERSONALITY_TABLE_LIMIT = 65_536
+
+# Option traits compiled into fixed-index vectors, and the trait profile of every
+# answer combination, keyed by question bank version
+_trait_vocabulary = None
+_trait_profile_table = None
+# Big Five score used when no selected option rates the trait
+DEFAULT_TRAIT_SCORE = 2.5
+
+# Trait names (Big Five first, then auxiliary traits), name -> column, and one
+# (values, mask) row per answer option; option o of question q is row option_offsets[q] + o
+TraitVocabulary = namedtuple("TraitVocabulary", ["names", "ids", "n_big_five", "option_offsets", "values", "mask"])
+
+def normalize_keyword(text):
+    """Lowercase snake_case form of a label, e.g. "Creative Problem Solving" -> creative_problem_solving"""
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+def answer_columns():
+    """Field names for the psychometric answers in batch files and API requests (q1, q2, ...)"""
+    return [f"q{question['id']}" for question in PSYCHOMETRIC_QUESTIONS]
+
+def slider_columns():
+    """Field names for the Ikigai sliders, in quadrant order (<quadrant key>_<item>)"""
+    return [
+        f"{quadrant['key']}_{normalize_keyword(item)}"
+        for quadrant in IKIGAI_QUADRANTS.values()
+        for item in quadrant["items"]
+    ]
+
+def catalog_fingerprint(career_database):
+    """Stable hash of a career catalog (or any JSON-able data), used to key caches"""
+    canonical = json.dumps(career_database, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+def catalog_version():
+    """Fingerprint of the configured catalog, computed once until the index is invalidated"""
+    global _catalog_version
+    if _catalog_version is None:
+        if CATALOG_PATH:
+            from catalog_store import read_manifest
+            _catalog_version = read_manifest(CATALOG_PATH)["fingerprint"]
+        else:
+            _catalog_version = catalog_fingerprint(CAREER_DATABASE)
+    return _catalog_version
+
+def question_bank_version():
+    """Fingerprint of PSYCHOMETRIC_QUESTIONS and IKIGAI_QUADRANTS"""
+    global _question_bank_version
+    if _question_bank_version is None:
+        _question_bank_version = catalog_fingerprint([PSYCHOMETRIC_QUESTIONS, IKIGAI_QUADRANTS])
+    return _question_bank_version
+
+def invalidate_question_bank():
+    """Drop the question bank version (and with it the personality table and trait vocabulary); call after editing the questions"""
+    global _question_bank_version
+    _question_bank_version = None
+
+def assessment_key(psychometric_answers, ikigai_data):
+    """Canonical encoding of a complete assessment, or None if it cannot be encoded
+
+    One byte per question (chosen option index) followed by one byte per slider,
+    in PSYCHOMETRIC_QUESTIONS / IKIGAI_QUADRANTS order.
+    """
+    encoded = bytearray()
+    for question in PSYCHOMETRIC_QUESTIONS:
+        answer = psychometric_answers.get(question["id"])
+        option_texts = [option["text"] for option in question["options"]]
+        if not answer or answer["text"] not in option_texts:
+            return None
+        encoded.append(option_texts.index(answer["text"]))
+    
+    # Intersections pair sliders by position, so order is part of the key
+    if not ikigai_data or list(ikigai_data) != list(IKIGAI_QUADRANTS):
+        return None
+    for quadrant, data in IKIGAI_QUADRANTS.items():
+        values = ikigai_data[quadrant]
+        if list(values) != data["items"]:
+            return None
+        for value in values.values():
+            if not isinstance(value, int) or not 0 <= value <= 255:
+                return None
+            encoded.append(value)
+    
+    return bytes(encoded)
+
+def build_career_engine(career_database=None):
+    """Build an immutable scoring index for a catalog dict, or for the configured catalog
+
+    With no argument this memory-maps the bundle named by PATHFINDER_CATALOG, or
+    falls back to the built-in CAREER_DATABASE.
+    """
+    # Deferred so importing this module does not pull in NumPy
+    if career_database is None and CATALOG_PATH:
+        from catalog_store import load_catalog_engine
+        return load_catalog_engine(CATALOG_PATH)
+    
+    from career_engine import CareerScoringEngine
+    if career_database is None:
+        career_database = CAREER_DATABASE
+    return CareerScoringEngine(career_database, fingerprint=catalog_fingerprint(career_database))
+
+def get_career_engine():
+    """Return the scoring index for CAREER_DATABASE, building it once per process"""
+    global _career_engine
+    if _career_engine is None:
+        with _career_engine_lock:
+            if _career_engine is None:
+                _career_engine = build_career_engine()
+    return _career_engine
+
+def invalidate_career_engine():
+    """Drop the cached career index and version; call after CAREER_DATABASE changes"""
+    global _career_engine, _catalog_version
+    with _career_engine_lock:
+        _career_engine = None
+        _catalog_version = None
+
+def calculate_trait_scores(answers, auxiliary=False):
+    """Average Big Five trait scores across the selected answer options
+    
+    With auxiliary=True the other traits the options rate (analytical_thinking,
+    leadership, ...) are averaged too, for career matching.
+    """
+    trait_scores = {}
+    
+    # Initialize trait scores
+    for trait in BIG_FIVE_TRAITS.keys():
+        trait_scores[trait] = []
+    
+    # Collect trait scores from answers
+    for answer in answers:
+        for trait, score in answer["traits"].items():
+            if trait in trait_scores:
+                trait_scores[trait].append(score)
+            elif auxiliary:
+                trait_scores[trait] = [score]
+    
+    # Calculate average scores (safer calculation)
+    final_scores = {}
+    for trait, scores in trait_scores.items():
+        if scores:
+            final_scores[trait] = sum(scores) / len(scores)
+        else:
+            final_scores[trait] = DEFAULT_TRAIT_SCORE  # Default neutral score
+    
+    return final_scores
+
+def generate_personality_analysis(trait_scores):
+    """Generate detailed personality analysis"""
+    analysis = {
+        "summary": "",
+        "trait_details": {},
+        "strengths": [],
+        "development_areas": [],
+        "work_style": ""
+    }
+    
+    # Generate summary
+    summary = "Based on your responses, you demonstrate "
+    if trait_scores.get("openness", 0) >= 4:
+        summary += "high creativity and openness to new experiences. "
+    if trait_scores.get("conscientiousness", 0) >= 4:
+        summary += "strong organizational skills and attention to detail. "
+    if trait_scores.get("extraversion", 0) >= 4:
+        summary += "natural leadership abilities and social energy. "
+    if trait_scores.get("agreeableness", 0) >= 4:
+        summary += "excellent interpersonal skills and empathy. "
+    if trait_scores.get("neuroticism", 0) <= 2:
+        summary += "emotional stability and resilience under pressure. "
+    
+    analysis["summary"] = summary
+    
+    # Trait details
+    for trait, score in trait_scores.items():
+        trait_info = BIG_FIVE_TRAITS.get(trait, {})
+        if not trait_info:
+            continue
+            
+        scaled_score = min(5, max(1, score))
+        
+        if scaled_score >= 4:
+            description = trait_info.get("high_description", "High level")
+        elif scaled_score <= 2:
+            description = trait_info.get("low_description", "Low level")
+        else:
+            description = f"Balanced {trait_info.get('name', trait).lower()}"
+        
+        analysis["trait_details"][trait] = {
+            "score": scaled_score,
+            "description": description,
+            "name": trait_info.get("name", trait.title())
+        }
+    
+    # Identify strengths
+    for trait, score in trait_scores.items():
+        if score >= 4 and trait in BIG_FIVE_TRAITS:
+            trait_info = BIG_FIVE_TRAITS[trait]
+            analysis["strengths"].append(trait_info.get("high_description", f"High {trait}"))
+    
+    # Identify development areas  
+    for trait, score in trait_scores.items():
+        if score <= 2.5 and trait != "neuroticism" and trait in BIG_FIVE_TRAITS:
+            trait_info = BIG_FIVE_TRAITS[trait]
+            analysis["development_areas"].append(f"Develop {trait_info.get('name', trait).lower()}")
+    
+    return analysis
+
+def answer_index(options):
+    """Mixed-radix index of one chosen option index per question (base 4 with four options each)"""
+    index = 0
+    for question, option in zip(PSYCHOMETRIC_QUESTIONS, options):
+        index = index * len(question["options"]) + option
+    return index
+
+def build_personality_table():
+    """(trait_scores, analysis) for every answer combination, in answer_index order"""
+    table = []
+    for combination in itertools.product(*(question["options"] for question in PSYCHOMETRIC_QUESTIONS)):
+        trait_scores = calculate_trait_scores(combination)
+        table.append((trait_scores, generate_personality_analysis(trait_scores)))
+    return table
+
+def personality_table():
+    """Precomputed personality profiles, rebuilt when the question bank version changes
+
+    Returns None when the answer space exceeds PERSONALITY_TABLE_LIMIT.
+    """
+    global _personality_table
+    version = question_bank_version()
+    if _personality_table is None or _personality_table[0] != version:
+        size = 1
+        for question in PSYCHOMETRIC_QUESTIONS:
+            size *= len(question["options"])
+        _personality_table = (version, build_personality_table() if size <= PERSONALITY_TABLE_LIMIT else None)
+    return _personality_table[1]
+
+def personality_profile(options):
+    """(trait_scores, analysis) for one chosen option index per question
+
+    Both dicts come from a table shared by every session and must not be modified.
+    """
+    table = personality_table()
+    if table is not None:
+        return table[answer_index(options)]
+    trait_scores = calculate_trait_scores(
+        question["options"][option] for question, option in zip(PSYCHOMETRIC_QUESTIONS, options)
+    )
+    return trait_scores, generate_personality_analysis(trait_scores)
+
+def compile_trait_vocabulary():
+    """Every answer option as a fixed-index vector over the Big Five and auxiliary traits"""
+    import numpy as np
+    
+    names = list(BIG_FIVE_TRAITS)
+    for question in PSYCHOMETRIC_QUESTIONS:
+        for option in question["options"]:
+            names.extend(trait for trait in option["traits"] if trait not in names)
+    ids = {name: col for col, name in enumerate(names)}
+    
+    options = [option for question in PSYCHOMETRIC_QUESTIONS for option in question["options"]]
+    values = np.zeros((len(options), len(names)))
+    mask = np.zeros(values.shape, dtype=bool)
+    for row, option in enumerate(options):
+        for trait, score in option["traits"].items():
+            values[row, ids[trait]] = score
+            mask[row, ids[trait]] = True
+    option_offsets = np.cumsum([0] + [len(question["options"]) for question in PSYCHOMETRIC_QUESTIONS[:-1]])
+    
+    for matrix in (values, mask, option_offsets):
+        matrix.setflags(write=False)
+    return TraitVocabulary(tuple(names), MappingProxyType(ids), len(BIG_FIVE_TRAITS), option_offsets, values, mask)
+
+def trait_vocabulary():
+    """Compiled option trait vectors, rebuilt when the question bank version changes"""
+    global _trait_vocabulary
+    version = question_bank_version()
+    if _trait_vocabulary is None or _trait_vocabulary[0] != version:
+        _trait_vocabulary = (version, compile_trait_vocabulary())
+    return _trait_vocabulary[1]
+
+def trait_profiles(answers):
+    """(values, mask) trait arrays aligned to trait_vocabulary().names for (n_users, n_questions) option indexes
+    
+    Each profile is one sum over the users' selected option rows. Big Five traits
+    no option rated default to DEFAULT_TRAIT_SCORE; unrated auxiliary traits are
+    left out of the mask.
+    """
+    import numpy as np
+    
+    vocabulary = trait_vocabulary()
+    rows = vocabulary.option_offsets + np.asarray(answers, dtype=np.int64)
+    totals = vocabulary.values[rows].sum(axis=1)
+    counts = vocabulary.mask[rows].sum(axis=1)
+    
+    values = np.full(totals.shape, DEFAULT_TRAIT_SCORE)
+    np.divide(totals, counts, out=values, where=counts > 0)
+    mask = counts > 0
+    mask[:, :vocabulary.n_big_five] = True
+    return values, mask
+
+def trait_profile_dicts(values, mask):
+    """{trait: score} dicts of the rated traits in trait_profiles() rows"""
+    names = trait_vocabulary().names
+    return [
+        {trait: score for trait, score, rated in zip(names, row_values, row_mask) if rated}
+        for row_values, row_mask in zip(values.tolist(), mask.tolist())
+    ]
+
+def trait_profile_table():
+    """Trait profiles of every answer combination in answer_index order, or None above PERSONALITY_TABLE_LIMIT"""
+    global _trait_profile_table
+    version = question_bank_version()
+    if _trait_profile_table is None or _trait_profile_table[0] != version:
+        option_ranges = [range(len(question["options"])) for question in PSYCHOMETRIC_QUESTIONS]
+        size = 1
+        for options in option_ranges:
+            size *= len(options)
+        table = None
+        if size <= PERSONALITY_TABLE_LIMIT:
+            table = trait_profile_dicts(*trait_profiles(list(itertools.product(*option_ranges))))
+        _trait_profile_table = (version, table)
+    return _trait_profile_table[1]
+
+def trait_profile(options):
+    """{trait: score} for one chosen option index per question: the Big Five plus every rated auxiliary trait
+    
+    Dicts from the precomputed table are shared by every session and must not be modified.
+    """
+    table = trait_profile_table()
+    if table is not None:
+        return table[answer_index(options)]
+    return trait_profile_dicts(*trait_profiles([options]))[0]
+
+def slider_array(ikigai_data):
+    """(4, n_items) slider values in IKIGAI_QUADRANTS order; unrated items get DEFAULT_SLIDER_VALUE"""
+    import numpy as np
+    
+    return np.array([
+        [ikigai_data.get(quadrant, {}).get(item, DEFAULT_SLIDER_VALUE) for item in data["items"]]
+        for quadrant, data in IKIGAI_QUADRANTS.items()
+    ], dtype=float)
+
+@timed("ikigai_intersections")
+def calculate_ikigai_intersections(ikigai_data):
+    """Calculate Ikigai intersection scores"""
+    intersections = {}
+    
+    quadrants = list(ikigai_data.keys())
+    if len(quadrants) < 4:
+        return {"Ikigai_Center": {"score": 0.5, "description": "Incomplete data"}}
+    
+    # Quadrants in order: What You Love, Good At, World Needs, Can Be Paid For
+    pair_scores = calculate_quadrant_pair_scores([ikigai_data[quadrant] for quadrant in quadrants[:4]])
+    
+    from career_engine import INTERSECTION_PAIRS
+    for intersection, first, second in INTERSECTION_PAIRS:
+        intersections[intersection] = {
+            "score": pair_scores[first][second],
+            "description": INTERSECTION_DESCRIPTIONS[intersection]
+        }
+    
+    # Overall Ikigai score
+    total_score = sum([intersection["score"] for intersection in intersections.values()])
+    intersections["Ikigai_Center"] = {
+        "score": total_score / 4,
+        "description": "Perfect balance of all four elements"
+    }
+    
+    return intersections
+
+def calculate_quadrant_pair_scores(quadrant_values):
+    """4x4 nested list of correlation scores between quadrant slider dicts"""
+    rows = [list(values.values()) for values in quadrant_values]
+    is_matrix = all(len(row) == len(rows[0]) > 0 for row in rows) and all(
+        isinstance(value, (int, float)) for row in rows for value in row
+    )
+    if not is_matrix:
+        # Ragged or non-numeric input keeps the per-pair scalar rules
+        return [[calculate_intersection_score(first, second) for second in quadrant_values] for first in quadrant_values]
+    
+    # All six pairs from one stacked 4 x n_items array
+    from career_engine import quadrant_pair_scores
+    return quadrant_pair_scores(rows).tolist()
+
+def calculate_intersection_score(dict1, dict2):
+    """Calculate overlap score between two dictionaries"""
+    if not dict1 or not dict2:
+        return 0.5
+    
+    # Simple correlation-based scoring with safe calculation
+    values1 = [v for v in dict1.values() if isinstance(v, (int, float))]
+    values2 = [v for v in dict2.values() if isinstance(v, (int, float))]
+    
+    if len(values1) != len(values2) or len(values1) == 0:
+        return 0.5
+    
+    # Calculate correlation manually to avoid numpy warnings
+    mean1 = sum(values1) / len(values1)
+    mean2 = sum(values2) / len(values2)
+    
+    numerator = sum((v1 - mean1) * (v2 - mean2) for v1, v2 in zip(values1, values2))
+    sum_sq1 = sum((v1 - mean1) ** 2 for v1 in values1)
+    sum_sq2 = sum((v2 - mean2) ** 2 for v2 in values2)
+    
+    if sum_sq1 == 0 or sum_sq2 == 0:
+        return 0.5
+    
+    correlation = numerator / (sum_sq1 * sum_sq2) ** 0.5
+    
+    # Convert to 0-1 scale
+    return max(0, min(1, (correlation + 1) / 2))
+
+@timed("career_recommendations")
+def generate_comprehensive_recommendations(psychometric_results, ikigai_data, intersections, top_k=5, engine=None):
+    """Generate comprehensive career recommendations"""
+    engine = engine if engine is not None else get_career_engine()
+    
+    # Personality (40%, Big Five and auxiliary traits) + Ikigai (60%) scored against the whole catalog at once
+    return engine.recommend(
+        {**psychometric_results["trait_scores"], **psychometric_results.get("auxiliary_traits", {})},
+        intersections,
+        top_k=top_k,
+        sliders=slider_array(ikigai_data)
+    )
+
+def score_assessments(assessments, top_k=5, engine=None):
+    """Final recommendation results for many (psychometric_answers, ikigai_data) pairs in one catalog pass"""
+    engine = engine if engine is not None else get_career_engine()
+    trait_scores = [calculate_trait_scores(answers.values(), auxiliary=True) for answers, _ in assessments]
+    intersections = [calculate_ikigai_intersections(ikigai_data) for _, ikigai_data in assessments]
+    sliders = [slider_array(ikigai_data) for _, ikigai_data in assessments]
+    recommendations = engine.recommend_batch(trait_scores, intersections, top_k=top_k, users_sliders=sliders)
+    
+    return [
+        {"ikigai_intersections": user_intersections, "career_recommendations": user_recommendations}
+        for user_intersections, user_recommendations in zip(intersections, recommendations)
+    ]
+
+def calculate_psychometric_compatibility(user_traits, career_traits):
+    """Calculate compatibility between user and career traits"""
+    if not user_traits or not career_traits:
+        return 0.5
+    
+    compatibility_score = 0
+    trait_count = 0
+    
+    for trait, ideal_score in career_traits.items():
+        if trait in user_traits:
+            user_score = user_traits[trait]
+            # Calculate distance (lower is better)
+            distance = abs(user_score - ideal_score)
+            # Convert to compatibility (higher is better)
+            trait_compatibility = 1 - (distance / 5)  # Normalize by max distance
+            compatibility_score += max(0, trait_compatibility)
+            trait_count += 1
+    
+    return compatibility_score / trait_count if trait_count > 0 else 0.5
+
+def calculate_career_ikigai_alignment(intersections, career_intersections):
+    """Calculate how well career aligns with user's Ikigai"""
+    if not career_intersections:
+        return 0.5
+    
+    total_score = 0
+    for intersection in career_intersections:
+        if intersection in intersections:
+            total_score += intersections[intersection]["score"]
+    
+    return total_score / len(career_intersections)
+
+def iter_text_report(psychometric, results):
+    """Yield the text report section by section, for writing straight to a file or socket"""
+    if not results:
+        yield "No analysis data available"
+        return
+    
+    yield """
+PATH-FINDER: COMPLETE CAREER ANALYSIS REPORT
+============================================
+
+Generated on: {date}
+
+EXECUTIVE SUMMARY
+================
+This comprehensive analysis combines personality assessment with Ikigai discovery 
+to provide personalized career recommendations based on your psychological profile 
+and life purpose alignment.
+
+PERSONALITY PROFILE
+==================
+{personality_summary}
+
+BIG FIVE TRAIT SCORES
+====================
+""".format(
+        date=datetime.now().strftime("%B %d, %Y"),
+        personality_summary=psychometric["analysis"]["summary"]
+    )
+    
+    for trait, score in psychometric["trait_scores"].items():
+        trait_info = BIG_FIVE_TRAITS.get(trait, {"name": trait.title()})
+        percentage = int((score / 5) * 100)
+        yield f"{trait_info['name']}: {percentage}%\n"
+    
+    yield f"""
+
+IKIGAI ANALYSIS
+===============
+Overall Ikigai Score: {int(results["ikigai_intersections"]["Ikigai_Center"]["score"] * 100)}%
+
+Intersection Scores:
+"""
+    
+    for intersection, data in results["ikigai_intersections"].items():
+        if intersection != "Ikigai_Center":
+            score_percent = int(data["score"] * 100)
+            yield f"- {intersection}: {score_percent}% - {data['description']}\n"
+    
+    yield """
+
+TOP CAREER RECOMMENDATIONS
+==========================
+"""
+    
+    for i, rec in enumerate(results["career_recommendations"][:3], 1):
+        yield f"""
+{i}. {rec['career']} ({rec['match_percentage']}% Match)
+   Description: {rec['data']['description']}
+   Salary Range: {rec['data']['salary_range']}
+   Growth Rate: {rec['data']['growth_rate']}
+   Key Skills: {', '.join(rec['data']['skills'][:5])}
+   Personality Match: {int(rec['psychometric_score'] * 100)}%
+   Ikigai Alignment: {int(rec['ikigai_score'] * 100)}%
+
+"""
+    
+    yield """
+NEXT STEPS
+==========
+1. Focus on your top career match and research the industry
+2. Develop skills highlighted in your recommendations
+3. Network with professionals in your target field
+4. Update your resume to highlight relevant experience
+5. Set up job alerts and start applying to relevant positions
+
+Remember: Career discovery is a journey. Use this analysis as a starting 
+point for deeper self-reflection and professional growth.
+"""
+
+def write_text_report(psychometric, results, output):
+    """Write the text report to a writable text stream section by section; returns characters written"""
+    written = 0
+    for section in iter_text_report(psychometric, results):
+        output.write(section)
+        written += len(section)
+    return written
+
+@timed("text_report")
+def generate_text_report(psychometric, results):
+    """Generate comprehensive text report"""
+    return "".join(iter_text_report(psychometric, results))
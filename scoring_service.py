@@ -0,0 +1,396 @@
+"""
+PATH-FINDER: HTTP Scoring Service
+Stateless JSON API over the same scoring core as the Streamlit app, written as
+a plain ASGI application (run it with uvicorn or any ASGI server):
+- POST /recommend         one user's answers and sliders -> final recommendations
+- POST /recommend/batch   {"users": [...]} -> {"results": [...]}
+- GET  /metrics           request counts, p50/p99 latency, batching and cache stats
+- GET  /healthz           liveness check
+
+Concurrent /recommend requests are micro-batched: requests that arrive while
+a batch is being scored are scored together against the catalog in one pass.
+Identical answer sets are served from an LRU/TTL result cache.
+
+Usage:
+    python scoring_service.py --port 8000
+    uvicorn scoring_service:app --workers 4 --timeout-keep-alive 30
+
+Request body for /recommend (same field names as batch scoring input files;
+sliders that are left out default to 5):
+    {"answers": {"q1": 2, "q2": 1, "q3": 4, "q4": 3, "q5": 1},
+     "sliders": {"love_creative_problem_solving": 8, "paid_for_data_analysis": 6}}
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from scoring import (
+    CAREER_DATABASE,
+    DEFAULT_SLIDER_VALUE,
+    IKIGAI_QUADRANTS,
+    PSYCHOMETRIC_QUESTIONS,
+    SLIDER_RANGE,
+    assessment_key,
+    catalog_version,
+    get_career_engine,
+    normalize_keyword,
+    question_bank_version,
+    score_assessments,
+)
+from result_cache import ResultCache, deep_sizeof
+
+logger = logging.getLogger(__name__)
+
+# Micro-batching: requests that queue up while a batch is being scored form the next
+# batch (up to MAX_BATCH_SIZE). A positive wait trades latency for larger batches.
+MAX_BATCH_SIZE = 64
+MAX_BATCH_WAIT_MS = 0.0
+
+# Requests waiting to be scored before new ones are rejected with 503
+MAX_QUEUED_REQUESTS = 4096
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_USERS_PER_BATCH = 1000
+
+# Latency percentiles are computed over the most recent requests per route
+LATENCY_WINDOW = 10_000
+
+RESULT_CACHE_MAX_ENTRIES = 10_000
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RESULT_CACHE_TTL_SECONDS = 3600
+
+# (quadrant, item, request field) for every slider, in IKIGAI_QUADRANTS order
+SLIDER_FIELDS = [
+    (quadrant, item, f"{data['key']}_{normalize_keyword(item)}")
+    for quadrant, data in IKIGAI_QUADRANTS.items()
+    for item in data["items"]
+]
+
+
+class RequestError(Exception):
+    """Client error returned as a JSON body with the given HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_user(payload):
+    """Validate one user's JSON payload -> (psychometric_answers, ikigai_data) shaped like app session state"""
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Each user must be a JSON object with 'answers' and 'sliders'")
+    answers = payload.get("answers")
+    sliders = payload.get("sliders", {})
+    if not isinstance(answers, dict) or not isinstance(sliders, dict):
+        raise RequestError(400, "'answers' and 'sliders' must be JSON objects")
+
+    psychometric_answers = {}
+    for question in PSYCHOMETRIC_QUESTIONS:
+        field = f"q{question['id']}"
+        choice = answers.get(field)
+        n_options = len(question["options"])
+        if not isinstance(choice, int) or isinstance(choice, bool) or not 1 <= choice <= n_options:
+            raise RequestError(400, f"'{field}' must be an option number between 1 and {n_options}")
+        psychometric_answers[question["id"]] = question["options"][choice - 1]
+
+    unknown = sorted(set(sliders).difference(field for _, _, field in SLIDER_FIELDS))
+    if unknown:
+        raise RequestError(400, f"Unknown slider fields: {', '.join(unknown)}")
+
+    ikigai_data = {quadrant: {} for quadrant in IKIGAI_QUADRANTS}
+    for quadrant, item, field in SLIDER_FIELDS:
+        value = sliders.get(field, DEFAULT_SLIDER_VALUE)
+        if not isinstance(value, int) or isinstance(value, bool) or not SLIDER_RANGE[0] <= value <= SLIDER_RANGE[1]:
+            raise RequestError(400, f"'{field}' must be a whole number between {SLIDER_RANGE[0]} and {SLIDER_RANGE[1]}")
+        ikigai_data[quadrant][item] = value
+
+    return psychometric_answers, ikigai_data
+
+
+class LatencyWindow:
+    """Request count, error count and a sliding window of latencies for one route"""
+
+    def __init__(self, size=LATENCY_WINDOW):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+        self.errors = 0
+
+    def observe(self, seconds, error=False):
+        self.samples.append(seconds)
+        self.count += 1
+        self.errors += error
+
+    def summary(self):
+        summary = {"count": self.count, "errors": self.errors, "p50_ms": None, "p99_ms": None}
+        if self.samples:
+            p50, p99 = np.percentile(np.fromiter(self.samples, dtype=float), [50, 99])
+            summary.update(p50_ms=round(p50 * 1000, 3), p99_ms=round(p99 * 1000, 3))
+        return summary
+
+
+class MicroBatcher:
+    """Queues concurrent scoring requests and scores them together in a worker thread"""
+
+    def __init__(self, score_many, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_BATCH_WAIT_MS,
+                 max_queued=MAX_QUEUED_REQUESTS):
+        self.score_many = score_many
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queued = max_queued
+        self.queue = None
+        self.task = None
+        self.batches = 0
+        self.batched_requests = 0
+        self.largest_batch = 0
+
+    def start(self):
+        if self.task is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queued)
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def submit(self, item):
+        """Score one item as part of the next batch"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((item, future))
+        except asyncio.QueueFull:
+            raise RequestError(503, "Scoring queue is full, retry shortly")
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Scoring is NumPy-bound; a worker thread keeps the event loop accepting requests
+            try:
+                results = await loop.run_in_executor(None, self.score_many, [item for item, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+
+            self.batches += 1
+            self.batched_requests += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "requests": self.batched_requests,
+            "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "queued": self.queue.qsize() if self.queue is not None else 0
+        }
+
+
+class ScoringService:
+    """ASGI application serving career recommendations as JSON"""
+
+    def __init__(self, top_k=5, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_BATCH_WAIT_MS):
+        self.top_k = top_k
+        self.batcher = MicroBatcher(self._score_many, max_batch_size, max_wait_ms)
+        # Career records are shared with the catalog, so they do not count toward the cap
+        shared_ids = frozenset(id(career) for career in CAREER_DATABASE.values())
+        self.result_cache = ResultCache(
+            max_entries=RESULT_CACHE_MAX_ENTRIES,
+            max_bytes=RESULT_CACHE_MAX_BYTES,
+            ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+            sizeof=lambda value: deep_sizeof(value, shared_ids)
+        )
+        self.latency = {}
+        self.started_at = time.monotonic()
+        self.routes = {
+            ("POST", "/recommend"): self.recommend,
+            ("POST", "/recommend/batch"): self.recommend_batch,
+            ("GET", "/metrics"): self.metrics,
+            ("GET", "/healthz"): self.healthz,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        start = time.perf_counter()
+        route = (scope["method"], scope["path"])
+        handler = self.routes.get(route)
+        try:
+            if handler is None:
+                if any(path == scope["path"] for _, path in self.routes):
+                    raise RequestError(405, "Method not allowed")
+                raise RequestError(404, "Not found")
+            status, payload = 200, await handler(receive)
+        except RequestError as exc:
+            status, payload = exc.status, {"error": str(exc)}
+        except Exception:
+            logger.exception("Unhandled error serving %s", scope["path"])
+            status, payload = 500, {"error": "Internal server error"}
+
+        await self._send_json(send, status, payload)
+        if handler is not None:
+            self.latency.setdefault(scope["path"], LatencyWindow()).observe(time.perf_counter() - start, status >= 400)
+
+    async def recommend(self, receive):
+        user = parse_user(await self._read_json(receive))
+        cache_key = self._cache_key(user)
+        results = self.result_cache.get(cache_key) if cache_key is not None else None
+        if results is None:
+            results = await self.batcher.submit(user)
+            if cache_key is not None:
+                self.result_cache.put(cache_key, results)
+        return {**results, "completed_at": datetime.now().isoformat()}
+
+    async def recommend_batch(self, receive):
+        payload = await self._read_json(receive)
+        users = payload.get("users") if isinstance(payload, dict) else None
+        if not isinstance(users, list) or not users:
+            raise RequestError(400, "Body must be {\"users\": [...]} with at least one user")
+        if len(users) > MAX_USERS_PER_BATCH:
+            raise RequestError(413, f"At most {MAX_USERS_PER_BATCH} users per batch")
+
+        parsed = [parse_user(user) for user in users]
+        cache_keys = [self._cache_key(user) for user in parsed]
+        results = [self.result_cache.get(key) if key is not None else None for key in cache_keys]
+
+        # Already a batch: score the cache misses directly instead of through the micro-batcher
+        misses = [idx for idx, result in enumerate(results) if result is None]
+        if misses:
+            scored = await asyncio.get_running_loop().run_in_executor(
+                None, self._score_many, [parsed[idx] for idx in misses]
+            )
+            for idx, result in zip(misses, scored):
+                results[idx] = result
+                if cache_keys[idx] is not None:
+                    self.result_cache.put(cache_keys[idx], result)
+
+        completed_at = datetime.now().isoformat()
+        return {"results": [{**result, "completed_at": completed_at} for result in results]}
+
+    async def metrics(self, receive):
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "requests": {path: window.summary() for path, window in sorted(self.latency.items())},
+            "batching": self.batcher.stats(),
+            "result_cache": self.result_cache.stats()
+        }
+
+    async def healthz(self, receive):
+        return {"status": "ok", "catalog_version": catalog_version()}
+
+    def _score_many(self, users):
+        return score_assessments(users, top_k=self.top_k)
+
+    def _cache_key(self, user):
+        answers_key = assessment_key(*user)
+        if answers_key is None:
+            return None
+        return (catalog_version(), question_bank_version(), self.top_k, answers_key)
+
+    async def _read_json(self, receive):
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise RequestError(400, "Client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise RequestError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        try:
+            return json.loads(b"".join(chunks))
+        except ValueError:
+            raise RequestError(400, "Request body must be valid JSON")
+
+    async def _send_json(self, send, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii"))
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Build the shared career index before the first request arrives
+                await asyncio.get_running_loop().run_in_executor(None, get_career_engine)
+                self.batcher.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.batcher.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+app = ScoringService()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve career recommendations over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--top-k", type=int, default=5, help="Recommendations per user")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_BATCH_WAIT_MS)
+    parser.add_argument("--keep-alive", type=int, default=30, help="Idle keep-alive timeout in seconds")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("Running the service requires uvicorn (pip install uvicorn)")
+
+    service = ScoringService(top_k=args.top_k, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    uvicorn.run(
+        service, host=args.host, port=args.port,
+        timeout_keep_alive=args.keep_alive, access_log=False, log_level="warning"
+    )
+
+
+if __name__ == "__main__":
+    main()
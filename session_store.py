@@ -0,0 +1,217 @@
+"""
+PATH-FINDER: Session Store
+Server-side persistence of assessment sessions in a local SQLite database:
+- WAL journal mode, so readers resuming sessions never block the writer
+- A small pool of reusable connections shared by all app sessions
+- save() only records the latest snapshot in memory; a background thread
+  coalesces repeated saves of the same session and writes each batch in a
+  single transaction, keeping disk I/O off the render path
+- A batch that fails to write goes back into the queue (newer saves of the
+  same session win) and is retried; flush() and close() raise the error
+  rather than returning as if it were on disk
+- load() resumes a session with one primary-key lookup
+
+Rows hold AssessmentState.record() tuples keyed by session id.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from assessment_state import AssessmentState
+
+POOL_SIZE = 4
+# A batch is written once it has this many sessions or its oldest save is this old
+MAX_BATCH_SIZE = 256
+MAX_BATCH_WAIT_SECONDS = 0.05
+BUSY_TIMEOUT_SECONDS = 5.0
+# Pause before retrying a batch whose write failed
+RETRY_WAIT_SECONDS = 1.0
+
+RECORD_COLUMNS = (
+    "bank_version", "answers", "sliders", "psychometric_completed_at", "intersection_scores",
+    "career_ids", "career_scores", "catalog_version", "completed_at"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    bank_version TEXT NOT NULL,
+    answers BLOB NOT NULL,
+    sliders BLOB NOT NULL,
+    psychometric_completed_at REAL,
+    intersection_scores BLOB,
+    career_ids BLOB,
+    career_scores BLOB,
+    catalog_version TEXT,
+    completed_at REAL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+UPSERT = (
+    f"INSERT INTO sessions (session_id, {', '.join(RECORD_COLUMNS)}, updated_at) "
+    f"VALUES ({', '.join('?' * (len(RECORD_COLUMNS) + 2))}) "
+    f"ON CONFLICT(session_id) DO UPDATE SET "
+    f"{', '.join(f'{column} = excluded.{column}' for column in RECORD_COLUMNS)}, updated_at = excluded.updated_at"
+)
+SELECT = f"SELECT {', '.join(RECORD_COLUMNS)} FROM sessions WHERE session_id = ?"
+
+
+class SessionStore:
+    """Pooled SQLite session persistence with a batching background writer"""
+
+    def __init__(self, path, pool_size=POOL_SIZE, max_batch_size=MAX_BATCH_SIZE,
+                 max_batch_wait=MAX_BATCH_WAIT_SECONDS, retry_wait=RETRY_WAIT_SECONDS):
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait
+        self.retry_wait = retry_wait
+
+        self._pool = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+        self._pending = {}    # session_id -> (record, updated_at), latest save wins
+        self._in_flight = {}  # batch currently being written
+        self._cond = threading.Condition()
+        self._closed = False
+        self._stopped = False
+        self._last_error = None
+        self.saves = 0
+        self.rows_written = 0
+        self.batches = 0
+        self.write_errors = 0
+
+        self._writer = threading.Thread(target=self._run, name="session-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        # WAL only needs a sync at checkpoints to stay consistent
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def save(self, session_id, record):
+        """Queue an AssessmentState.record() snapshot for the writer; returns immediately"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("session store is closed")
+            self._pending[session_id] = (record, time.time())
+            self.saves += 1
+            self._cond.notify_all()
+
+    def load(self, session_id):
+        """Saved AssessmentState for session_id, or None if there is none usable"""
+        with self._cond:
+            entry = self._pending.get(session_id) or self._in_flight.get(session_id)
+        if entry is not None:
+            return AssessmentState.from_record(entry[0])
+
+        with self.connection() as conn:
+            row = conn.execute(SELECT, (session_id,)).fetchone()
+        return AssessmentState.from_record(row) if row is not None else None
+
+    def flush(self):
+        """Block until every save made so far is on disk
+
+        Raises the writer's sqlite3.Error if a write fails first; the failed
+        saves stay queued and are retried.
+        """
+        with self._cond:
+            errors = self.write_errors
+            self._cond.wait_for(
+                lambda: self._stopped or self.write_errors > errors or not (self._pending or self._in_flight)
+            )
+            if self._pending or self._in_flight:
+                raise self._last_error
+
+    def close(self):
+        """Write outstanding saves, stop the writer and close the pool
+
+        Raises the last sqlite3.Error if some saves could still not be written.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        while not self._pool.empty():
+            self._pool.get().close()
+        if self._pending:
+            raise self._last_error
+
+    def stats(self):
+        """Counters for monitoring: saves, rows written, batches and the pending backlog"""
+        with self._cond:
+            return {
+                "saves": self.saves,
+                "rows_written": self.rows_written,
+                "batches": self.batches,
+                "pending": len(self._pending) + len(self._in_flight),
+                "write_errors": self.write_errors
+            }
+
+    def _next_batch(self):
+        """Wait for saves, give a burst time to coalesce, then take the whole backlog"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._closed)
+            if not self._pending:
+                return None
+            deadline = time.monotonic() + self.max_batch_wait
+            while not self._closed and len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._in_flight, self._pending = self._pending, {}
+            return self._in_flight
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            error = None
+            try:
+                with self.connection() as conn, conn:
+                    conn.executemany(UPSERT, [
+                        (session_id, *record, updated_at) for session_id, (record, updated_at) in batch.items()
+                    ])
+            except sqlite3.Error as exc:
+                error = exc
+            with self._cond:
+                if error is None:
+                    self.rows_written += len(batch)
+                else:
+                    # Requeue the batch unless newer saves of the same sessions replaced it
+                    self.write_errors += 1
+                    self._last_error = error
+                    for session_id, entry in batch.items():
+                        self._pending.setdefault(session_id, entry)
+                self.batches += 1
+                self._in_flight = {}
+                self._cond.notify_all()
+                if error is not None:
+                    if self._closed:
+                        break
+                    # Back off before the retry; close() cuts the wait short for one last attempt
+                    self._cond.wait_for(lambda: self._closed, timeout=self.retry_wait)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
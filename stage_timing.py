@@ -0,0 +1,162 @@
+"""
+PATH-FINDER: Stage Timing
+In-process latency histograms for the stages of the 3-layer pipeline:
+- @timed("stage") wraps a function and stage("name") wraps a block; both
+  record the elapsed time into a fixed-bucket histogram per stage
+- Histograms are exported in the Prometheus text format, as a string or as a
+  .prom file for a textfile collector (written at most every few seconds)
+- Disabled unless PATHFINDER_TIMING is set (or enable() is called); a disabled
+  timer costs one flag check per call
+
+Usage:
+    PATHFINDER_TIMING=1 PATHFINDER_TIMING_FILE=metrics/pathfinder.prom streamlit run app.py
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+METRIC_NAME = "pathfinder_stage_duration_seconds"
+# Upper bounds in seconds; the +Inf bucket is implied
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+EXPORT_PATH = os.environ.get("PATHFINDER_TIMING_FILE", "pathfinder_timing.prom")
+EXPORT_INTERVAL_SECONDS = 10.0
+
+_enabled = os.environ.get("PATHFINDER_TIMING", "").lower() in ("1", "true", "yes", "on")
+_disabled_block = nullcontext()
+
+
+class StageHistogram:
+    """Per-bucket counts, sum and count of one stage's durations"""
+
+    __slots__ = ("bucket_counts", "total", "count")
+
+    def __init__(self):
+        # Last slot counts durations above every bound
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.bucket_counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class StageTimings:
+    """Thread-safe set of per-stage histograms"""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._last_export = 0.0
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = StageHistogram()
+            histogram.observe(seconds)
+
+    def summary(self):
+        """{stage: {"count", "mean_ms"}} for quick inspection"""
+        with self._lock:
+            return {
+                stage: {"count": histogram.count, "mean_ms": histogram.total / histogram.count * 1000}
+                for stage, histogram in sorted(self._histograms.items())
+            }
+
+    def prometheus_text(self):
+        """All histograms in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in each PATH-FINDER pipeline stage",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS, histogram.bucket_counts):
+                    cumulative += count
+                    lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{METRIC_NAME}_sum{{stage="{stage}"}} {histogram.total!r}')
+                lines.append(f'{METRIC_NAME}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path=None):
+        """Atomically replace the metrics file with the current histograms"""
+        path = path or EXPORT_PATH
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as metrics_file:
+            metrics_file.write(self.prometheus_text())
+        os.replace(temp_path, path)
+
+    def export_if_due(self, path=None, interval=EXPORT_INTERVAL_SECONDS):
+        """write() if enabled and the last export is older than interval seconds"""
+        if not _enabled:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_export < interval:
+                return False
+            self._last_export = now
+        self.write(path)
+        return True
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+timings = StageTimings()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+@contextmanager
+def _timed_block(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.observe(name, time.perf_counter() - start)
+
+
+def stage(name):
+    """Context manager timing a block as stage name (a shared no-op while disabled)"""
+    return _timed_block(name) if _enabled else _disabled_block
+
+
+def timed(name):
+    """Decorator timing every call of a function as stage name"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,140 @@
+"""
+PATH-FINDER: UI Templates
+Static styling and HTML card markup for the Streamlit app:
+- assets/style.css is read, minified and wrapped in a <style> block once per
+  process instead of being rebuilt on every rerun
+- Card templates are whitespace-compacted once at import; rendered cards are
+  cached by their inputs, so reruns reuse the same strings
+"""
+
+import os
+import re
+from functools import lru_cache
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+STYLESHEET = os.path.join(ASSETS_DIR, "style.css")
+
+# Distinct rendered cards kept per process (progress steps, metrics, career cards, ...)
+RENDER_CACHE_SIZE = 4096
+
+TEMPLATES = {
+    "main_header": """
+        <div class="main-header fade-in">
+            <h1>🧭 PATH-FINDER</h1>
+            <p>Complete Career Discovery Platform</p>
+            <p style="font-size: 1rem; margin-top: 1rem;">
+                3-Layer Analysis: Personality → Ikigai → Career Navigation
+            </p>
+        </div>
+    """,
+    "section_header": """
+        <div class="ikigai-section fade-in">
+            <div class="ikigai-header">
+                <h2>{title}</h2>
+                <p style="color: var(--text-secondary); font-size: 1.1rem;">
+                    {subtitle}
+                </p>
+            </div>
+        </div>
+    """,
+    "progress_step": """
+        <div class="progress-step {status_class}" style="text-align: center;">
+            <div class="step-icon">{icon}</div>
+            <div style="font-weight: 600; color: {color};">
+                Layer {num}
+            </div>
+            <div class="step-label">{label}</div>
+        </div>
+    """,
+    "question_title": """
+        <div class="question-container fade-in">
+            <div class="question-title">
+                Question {id}: {question}
+            </div>
+        </div>
+    """,
+    "quadrant_header": """
+        <div style="background: rgba(255, 255, 255, 0.03); border-radius: 12px; padding: 2rem; margin: 1rem 0; border: 1px solid rgba(102, 126, 234, 0.2);">
+            <h3 style="color: var(--accent-color); margin-bottom: 1rem;">
+                {icon} {quadrant}
+            </h3>
+        </div>
+    """,
+    "metric": """
+        <div class="metric-container">
+            <div class="metric-value">{value}%</div>
+            <div class="metric-label">{label}</div>
+        </div>
+    """,
+    "ikigai_score": """
+        <div style="text-align: center; margin: 2rem 0;">
+            <div style="background: linear-gradient(135deg, var(--accent-color), var(--accent-secondary));
+                        border-radius: 50%; width: 150px; height: 150px; margin: 0 auto;
+                        display: flex; flex-direction: column; align-items: center; justify-content: center;
+                        color: white; font-weight: 700;">
+                <div style="font-size: 2.5rem;">{score}%</div>
+                <div>Ikigai Score</div>
+            </div>
+        </div>
+    """,
+    "career_card": """
+        <div class="result-card fade-in">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                <h3 style="color: var(--accent-color); margin: 0;">
+                    #{rank} {career}
+                </h3>
+                <div style="background: linear-gradient(135deg, var(--accent-color), var(--accent-secondary));
+                            color: white; padding: 0.5rem 1rem; border-radius: 20px; font-weight: 600;">
+                    {match}% Match
+                </div>
+            </div>
+        </div>
+    """,
+    "match_breakdown": """
+        <div style="margin: 0.5rem 0;">
+            <div>Personality: {psychometric}%</div>
+            <div class="trait-bar">
+                <div class="trait-fill" style="width: {psychometric}%"></div>
+            </div>
+        </div>
+        <div style="margin: 0.5rem 0;">
+            <div>Ikigai: {ikigai}%</div>
+            <div class="trait-bar">
+                <div class="trait-fill" style="width: {ikigai}%"></div>
+            </div>
+        </div>
+    """,
+}
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r"\s*:\s*", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def compact_html(markup):
+    """Single-line markup: whitespace between tags dropped, other runs collapsed to one space"""
+    markup = re.sub(r">\s+<", "><", markup.strip())
+    markup = re.sub(r">\s+", ">", markup)
+    markup = re.sub(r"\s+<", "<", markup)
+    return re.sub(r"\s+", " ", markup)
+
+
+COMPILED_TEMPLATES = {name: compact_html(markup) for name, markup in TEMPLATES.items()}
+
+
+@lru_cache(maxsize=None)
+def style_block():
+    """The app stylesheet as one minified <style> block, read once per process"""
+    with open(STYLESHEET, encoding="utf-8") as stylesheet:
+        return f"<style>{minify_css(stylesheet.read())}</style>"
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render(name, **fields):
+    """Markup for one card template, cached by template name and field values"""
+    return COMPILED_TEMPLATES[name].format(**fields)
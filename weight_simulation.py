@@ -0,0 +1,303 @@
+"""
+PATH-FINDER: What-If Weight Simulation
+Shows how stable a user's recommendations are when the fixed 40/60
+psychometric/Ikigai weighting, or the user's own trait scores, change:
+- Every (trait profile, psychometric weight, Ikigai weight) setting of a grid
+  is ranked at once; the default grid is 100 x 100 weights in 0.01-1.0
+- Trait perturbations shift one rated trait at a time by a few steps
+  (clipped to the 1-5 scale) and re-score only the psychometric side
+- Rank stability is summarized against the app's 40/60 ranking: how often
+  the top career and the top-k set survive, and how often each career makes
+  the list
+
+With positive weights only careers on the k-skyband can ever make the top k
+(fewer than k careers score at least as high on both sides and win the
+tie-break), so the grid is broadcast over those few candidates rather than the
+whole catalog. Given the user's sliders, ties follow keyword alignment and then
+catalog order, so every simulated list is the one engine.rank(..., sliders=...)
+returns at that setting.
+
+Usage:
+    python weight_simulation.py sampleusers.csv -o stability.csv [--grid-steps 100] [--trait-step 0.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from career_engine import IKIGAI_WEIGHT, PSYCHOMETRIC_WEIGHT, break_ties, select_top_k
+from scoring import BIG_FIVE_TRAITS, get_career_engine
+
+DEFAULT_GRID_STEPS = 100
+DEFAULT_WEIGHT_GRID = np.linspace(0.01, 1.0, DEFAULT_GRID_STEPS)
+# Shifts applied to one trait at a time by trait_perturbations()
+DEFAULT_TRAIT_STEPS = (-1.0, -0.5, 0.5, 1.0)
+MIN_TRAIT_SCORE = 1
+MAX_TRAIT_SCORE = 5
+# Reference careers per probe setting when pruning the catalog, in multiples of k
+SKYBAND_PROBE_DEPTH = 4
+# Candidate rows compared per block in the dominance counts
+DOMINANCE_BLOCK_SIZE = 1024
+
+
+def weight_grid(steps=DEFAULT_GRID_STEPS, low=0.01, high=1.0):
+    """Evenly spaced positive weights for one axis of the simulation grid"""
+    return np.linspace(low, high, steps)
+
+
+def _positive_weights(weights):
+    weights = np.atleast_1d(np.asarray(weights, dtype=float))
+    if weights.ndim != 1 or len(weights) == 0 or not np.all(weights > 0):
+        raise ValueError("Simulation weights must be a non-empty 1-D array of positive numbers")
+    return weights
+
+
+def tie_ranks(alignment):
+    """Tie-break position of each career: higher keyword alignment first, then catalog order"""
+    ranks = np.empty(len(alignment), dtype=np.intp)
+    ranks[np.argsort(-np.asarray(alignment), kind="stable")] = np.arange(len(alignment))
+    return ranks
+
+
+def _dominator_counts(psych, ikigai, candidates, reference, ranks):
+    """How many reference careers score at least as high as each candidate on both sides and win the tie-break"""
+    counts = np.empty(len(candidates), dtype=np.intp)
+    for begin in range(0, len(candidates), DOMINANCE_BLOCK_SIZE):
+        block = candidates[begin:begin + DOMINANCE_BLOCK_SIZE, np.newaxis]
+        dominated = (
+            (psych[reference] >= psych[block])
+            & (ikigai[reference] >= ikigai[block])
+            & (ranks[reference] < ranks[block])
+        )
+        counts[begin:begin + DOMINANCE_BLOCK_SIZE] = dominated.sum(axis=1)
+    return counts
+
+
+def skyband(psych, ikigai, k, probe_weights=((PSYCHOMETRIC_WEIGHT, IKIGAI_WEIGHT),), ranks=None):
+    """Sorted indices of the careers that can reach the top k for some positive weights
+
+    A career is dropped once k careers score at least as high on both sides
+    and win the tie-break (lower ranks, from tie_ranks(); catalog order by
+    default): they outrank it under every positive weighting, even after
+    floating-point rounding, so the engine's lists never include it.
+    """
+    if ranks is None:
+        ranks = np.arange(len(psych))
+    # Strong careers at a few probe settings rule out most of the catalog cheaply
+    reference = np.unique(np.concatenate([
+        select_top_k((psych * psych_weight) + (ikigai * ikigai_weight), SKYBAND_PROBE_DEPTH * k)
+        for psych_weight, ikigai_weight in probe_weights
+    ]))
+    candidates = np.arange(len(psych))
+    candidates = candidates[_dominator_counts(psych, ikigai, candidates, reference, ranks) < k]
+    # Dominance is transitive, so a career with k dominators has k among the survivors
+    return candidates[_dominator_counts(psych, ikigai, candidates, candidates, ranks) < k]
+
+
+def simulate_scores(psych, ikigai, psych_weights=DEFAULT_WEIGHT_GRID, ikigai_weights=DEFAULT_WEIGHT_GRID, top_k=5,
+                    alignment=None):
+    """Top-k careers for every (profile, psychometric weight, Ikigai weight) setting
+
+    psych: (n_profiles, n_careers) psychometric scores, one row per trait profile
+    ikigai: (n_careers,) Ikigai scores
+    alignment: optional (n_careers,) keyword alignment that orders tied careers
+    Returns (top_careers, combined_scores), each (n_profiles, n_psych, n_ikigai, k).
+    """
+    psych = np.atleast_2d(psych)
+    ranks = tie_ranks(alignment) if alignment is not None else np.arange(len(ikigai))
+    psych_weights = _positive_weights(psych_weights)
+    ikigai_weights = _positive_weights(ikigai_weights)
+
+    probe_weights = [
+        (psych_weights.min(), ikigai_weights.max()),
+        (np.median(psych_weights), np.median(ikigai_weights)),
+        (psych_weights.max(), ikigai_weights.min()),
+    ]
+
+    shape = (len(psych), len(psych_weights), len(ikigai_weights), min(top_k, len(ikigai)))
+    top_careers = np.empty(shape, dtype=np.intp)
+    top_scores = np.empty(shape)
+    for profile, profile_psych in enumerate(psych):
+        candidates = skyband(profile_psych, ikigai, top_k, probe_weights, ranks)
+        candidates = candidates[np.argsort(ranks[candidates], kind="stable")]
+        combined = (
+            (profile_psych[candidates] * psych_weights[:, np.newaxis, np.newaxis])
+            + (ikigai[candidates] * ikigai_weights[:, np.newaxis])[np.newaxis, :, :]
+        )
+        # Candidates are in tie-break order, so a stable sort keeps the engine's tie-break
+        order = np.argsort(-combined, axis=-1, kind="stable")[..., :top_k]
+        top_careers[profile] = candidates[order]
+        top_scores[profile] = np.take_along_axis(combined, order, axis=-1)
+    return top_careers, top_scores
+
+
+def rank_stability(top_careers, baseline):
+    """Rank-stability statistics of simulated top-k lists against the baseline list
+
+    Agreement values are shares of all settings; careers are every career that
+    made any list, most frequent first, with the share of settings listing
+    them, ranking them first, and their mean 1-based position when listed.
+    """
+    lists = top_careers.reshape(-1, top_careers.shape[-1])
+    n_settings, k = lists.shape
+    shared = np.isin(lists, baseline).sum(axis=1)
+
+    careers, inverse = np.unique(lists, return_inverse=True)
+    inverse = inverse.reshape(lists.shape)
+    counts = np.bincount(inverse.ravel(), minlength=len(careers))
+    firsts = np.bincount(inverse[:, 0], minlength=len(careers))
+    positions = np.bincount(inverse.ravel(), weights=np.tile(np.arange(1, k + 1), n_settings), minlength=len(careers))
+    order = np.lexsort((careers, -counts))
+
+    return {
+        "top1_agreement": float(np.mean(lists[:, 0] == baseline[0])),
+        "topk_agreement": float(np.mean(shared == len(baseline))),
+        "order_agreement": float(np.mean(np.all(lists == baseline, axis=1))),
+        "mean_overlap": float(np.mean(shared / len(baseline))),
+        "careers": careers[order],
+        "frequency": counts[order] / n_settings,
+        "top1_share": firsts[order] / n_settings,
+        "mean_position": positions[order] / counts[order],
+    }
+
+
+def trait_perturbations(engine, steps=DEFAULT_TRAIT_STEPS, traits=None):
+    """(n_profiles, n_traits) trait shifts: no shift first, then each step on one trait at a time
+
+    traits defaults to the Big Five traits the engine scores.
+    """
+    if traits is None:
+        traits = [trait for trait in BIG_FIVE_TRAITS if trait in engine.trait_ids]
+    deltas = [np.zeros(len(engine.trait_names))]
+    for trait in traits:
+        for step in steps:
+            delta = np.zeros(len(engine.trait_names))
+            delta[engine.trait_ids[trait]] = step
+            deltas.append(delta)
+    return np.stack(deltas)
+
+
+def _simulate(engine, values, mask, ikigai, alignment, psych_weights, ikigai_weights, perturbations, top_k):
+    if perturbations is None:
+        perturbations = np.zeros((1, len(values)))
+    # Unrated traits stay unrated, so their shifts are ignored
+    profiles = np.where(mask, np.clip(values + perturbations, MIN_TRAIT_SCORE, MAX_TRAIT_SCORE), values)
+    psych = engine.psychometric_scores_batch(profiles, np.broadcast_to(mask, profiles.shape))
+    top_careers, combined = simulate_scores(psych, ikigai, psych_weights, ikigai_weights, top_k, alignment)
+
+    baseline_psych = engine.psychometric_scores_batch(values[np.newaxis], mask[np.newaxis])[0]
+    baseline_scores = (baseline_psych * PSYCHOMETRIC_WEIGHT) + (ikigai * IKIGAI_WEIGHT)
+    baseline = select_top_k(baseline_scores, top_k)
+    if alignment is not None:
+        baseline = break_ties(baseline_scores, baseline, lambda pool: alignment[pool])
+
+    result = {
+        "psych_weights": _positive_weights(psych_weights),
+        "ikigai_weights": _positive_weights(ikigai_weights),
+        "perturbations": perturbations,
+        "top_careers": top_careers,
+        "combined_score": combined,
+        "baseline": baseline,
+    }
+    result.update(rank_stability(top_careers, baseline))
+    return result
+
+
+def simulate_user(user_traits, intersections, engine=None, psych_weights=DEFAULT_WEIGHT_GRID,
+                  ikigai_weights=DEFAULT_WEIGHT_GRID, perturbations=None, top_k=5, sliders=None):
+    """Simulate one user's rankings over a weight grid and optional trait perturbations
+
+    user_traits and intersections are shaped like the app's results; perturbations
+    is an (n_profiles, n_traits) array such as trait_perturbations(engine), and
+    sliders the user's (4, n_items) slider values for the keyword tie-break.
+    Returns the simulated top_careers/combined_score tensors, the 40/60 baseline
+    list and the rank_stability() statistics.
+    """
+    engine = engine if engine is not None else get_career_engine()
+    values, mask = engine.trait_vector(user_traits)
+    ikigai = engine.ikigai_scores(intersections)
+    alignment = engine.keyword_matcher.alignment(sliders) if sliders is not None else None
+    return _simulate(engine, values, mask, ikigai, alignment, psych_weights, ikigai_weights, perturbations, top_k)
+
+
+def simulate_cohort(answers, sliders, engine=None, psych_weights=DEFAULT_WEIGHT_GRID,
+                    ikigai_weights=DEFAULT_WEIGHT_GRID, perturbations=None, top_k=5):
+    """Per-user rank stability for a cohort in the batch scoring array format
+
+    Ties are broken by each user's keyword alignment, as in score_cohort.
+    Returns a dict of arrays: the (n_users, k) 40/60 baseline lists and each
+    user's top1/topk/order agreement and mean overlap.
+    """
+    from batch_scoring import cohort_arrays
+
+    engine = engine if engine is not None else get_career_engine()
+    user_values, user_masks, user_intersections, _ = cohort_arrays(answers, sliders, engine)
+    ikigai_scores = engine.ikigai_scores_batch(user_intersections)
+    alignments = engine.keyword_matcher.alignment_batch(sliders)
+
+    summaries = [
+        _simulate(engine, values, mask, ikigai, alignment, psych_weights, ikigai_weights, perturbations, top_k)
+        for values, mask, ikigai, alignment in zip(user_values, user_masks, ikigai_scores, alignments)
+    ]
+    stats = ["top1_agreement", "topk_agreement", "order_agreement", "mean_overlap"]
+    baseline = np.array([summary["baseline"] for summary in summaries], dtype=np.intp)
+    cohort = {"baseline": baseline.reshape(len(summaries), min(top_k, len(engine)))}
+    cohort.update({stat: np.array([summary[stat] for summary in summaries]) for stat in stats})
+    return cohort
+
+
+def stability_frame(user_ids, cohort, engine=None):
+    """One row per user: the 40/60 top career and list, and its stability across the grid"""
+    engine = engine if engine is not None else get_career_engine()
+    return pd.DataFrame({
+        "user_id": user_ids,
+        "top_career": [engine.career_names[row[0]] for row in cohort["baseline"]],
+        "top_careers": ["; ".join(engine.career_names[idx] for idx in row) for row in cohort["baseline"]],
+        "top1_agreement": cohort["top1_agreement"],
+        "topk_agreement": cohort["topk_agreement"],
+        "order_agreement": cohort["order_agreement"],
+        "mean_overlap": cohort["mean_overlap"],
+    })
+
+
+def main(argv=None):
+    from batch_scoring import frame_to_arrays, read_user_chunks
+
+    parser = argparse.ArgumentParser(description="Rank stability of each user's recommendations across weight settings")
+    parser.add_argument("input", help="CSV or Parquet file in the batch scoring input format")
+    parser.add_argument("-o", "--output", required=True, help="Output .csv path")
+    parser.add_argument("--top-k", type=int, default=5, help="Recommendations per user")
+    parser.add_argument("--grid-steps", type=int, default=DEFAULT_GRID_STEPS, help="Weights per axis (0.01-1.0)")
+    parser.add_argument("--trait-step", type=float, default=None,
+                        help="Also shift each Big Five trait by +/- this much and +/- twice this much")
+    args = parser.parse_args(argv)
+
+    engine = get_career_engine()
+    grid = weight_grid(args.grid_steps)
+    perturbations = None
+    if args.trait_step:
+        step = args.trait_step
+        perturbations = trait_perturbations(engine, steps=(-2 * step, -step, step, 2 * step))
+
+    start = time.perf_counter()
+    frames = []
+    for frame in read_user_chunks(args.input):
+        user_ids, answers, sliders = frame_to_arrays(frame)
+        cohort = simulate_cohort(answers, sliders, engine, grid, grid, perturbations, args.top_k)
+        frames.append(stability_frame(user_ids, cohort, engine))
+    results = pd.concat(frames, ignore_index=True)
+    results.to_csv(args.output, index=False)
+
+    total_time = time.perf_counter() - start
+    print(
+        f"Simulated {len(results):,} users x {len(grid) ** 2:,} weight settings in {total_time:.2f}s "
+        f"(mean top-1 agreement {results['top1_agreement'].mean():.1%})",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()